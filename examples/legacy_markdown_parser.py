@@ -0,0 +1,461 @@
+"""Markdown parser of notionhelper 0.6.1, before the single-pass rewrite.
+
+Vendored unchanged, for `markdown_parser_benchmark.py` only: it lets the benchmark
+time the previous implementation next to the current one on the same machine.
+"""
+
+from typing import Any, Dict, List, Optional
+import re
+
+from notionhelper import NotionHelper
+
+
+class LegacyMarkdownHelper(NotionHelper):
+    """NotionHelper whose internal markdown parser is the previous recursive one."""
+
+    def _chunk_text(self, value: str, max_utf16_units: int = 2000) -> List[str]:
+        """Splits text into chunks that each fit Notion's UTF-16 length limit."""
+        if not value:
+            return [""]
+
+        chunks = []
+        current_chars: List[str] = []
+        current_units = 0
+
+        for char in value:
+            char_units = self._utf16_units(char)
+            if current_chars and current_units + char_units > max_utf16_units:
+                chunks.append("".join(current_chars))
+                current_chars = [char]
+                current_units = char_units
+            else:
+                current_chars.append(char)
+                current_units += char_units
+
+        if current_chars:
+            chunks.append("".join(current_chars))
+
+        return chunks
+
+
+    def _normalize_rich_text(self, items: Any) -> List[Dict[str, Any]]:
+        """Normalizes rich text entries into a Notion-safe text-only representation."""
+        if not isinstance(items, list):
+            return []
+
+        normalized: List[Dict[str, Any]] = []
+        default_annotations = {
+            "bold": False,
+            "italic": False,
+            "strikethrough": False,
+            "underline": False,
+            "code": False,
+            "color": "default",
+        }
+
+        for item in items:
+            content = ""
+            link_url = None
+            annotations = default_annotations.copy()
+
+            if isinstance(item, str):
+                content = item
+            elif isinstance(item, dict):
+                item_annotations = item.get("annotations", {})
+                if isinstance(item_annotations, dict):
+                    annotations.update(
+                        {
+                            "bold": bool(item_annotations.get("bold", False)),
+                            "italic": bool(item_annotations.get("italic", False)),
+                            "strikethrough": bool(item_annotations.get("strikethrough", False)),
+                            "underline": bool(item_annotations.get("underline", False)),
+                            "code": bool(item_annotations.get("code", False)),
+                            "color": item_annotations.get("color", "default") or "default",
+                        }
+                    )
+
+                text_obj = item.get("text") if isinstance(item.get("text"), dict) else {}
+                if item.get("type") == "text" and isinstance(text_obj, dict):
+                    text_obj = item["text"]
+                    content = text_obj.get("content", "") or item.get("plain_text", "")
+                    link_obj = text_obj.get("link")
+                    if isinstance(link_obj, dict):
+                        link_url = link_obj.get("url")
+                else:
+                    content = text_obj.get("content", "") or item.get("plain_text", "")
+
+                if item.get("href"):
+                    link_url = item.get("href")
+            else:
+                continue
+
+            if not isinstance(content, str):
+                content = str(content)
+
+            for chunk in self._chunk_text(content, 2000):
+                text_entry: Dict[str, Any] = {"content": chunk}
+                if link_url:
+                    text_entry["link"] = {"url": link_url}
+                normalized.append(
+                    {
+                        "type": "text",
+                        "text": text_entry,
+                        "annotations": annotations.copy(),
+                    }
+                )
+
+        return normalized
+
+
+    def _plain_text_rich_text(self, value: str) -> List[Dict[str, Any]]:
+        """Builds a plain text rich_text array, using the shared normalizer/chunker."""
+        return self._normalize_rich_text([{"type": "text", "text": {"content": value}}])
+
+
+    def _parse_inline_markdown_segments(
+        self,
+        value: str,
+        inherited_annotations: Optional[Dict[str, Any]] = None,
+        inherited_href: Optional[str] = None,
+        depth: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Parses basic inline markdown syntax into text segments with annotations."""
+        if not value:
+            return []
+        if depth > 8:
+            return [
+                {
+                    "text": value,
+                    "annotations": inherited_annotations or {},
+                    "href": inherited_href,
+                }
+            ]
+
+        annotations = {
+            "bold": False,
+            "italic": False,
+            "strikethrough": False,
+            "underline": False,
+            "code": False,
+            "color": "default",
+        }
+        if isinstance(inherited_annotations, dict):
+            annotations.update(inherited_annotations)
+
+        token_patterns = [
+            ("link", re.compile(r"\[([^\]]+)\]\((https?://[^\s)]+)\)")),
+            ("code", re.compile(r"`([^`\n]+)`")),
+            ("bold", re.compile(r"\*\*(.+?)\*\*")),
+            ("strike", re.compile(r"~~(.+?)~~")),
+            ("italic", re.compile(r"(?<!\*)\*([^*\n]+)\*(?!\*)")),
+        ]
+
+        earliest_match = None
+        earliest_kind = None
+        for kind, pattern in token_patterns:
+            match = pattern.search(value)
+            if not match:
+                continue
+            if earliest_match is None or match.start() < earliest_match.start():
+                earliest_match = match
+                earliest_kind = kind
+
+        if earliest_match is None or earliest_kind is None:
+            return [{"text": value, "annotations": annotations, "href": inherited_href}]
+
+        segments: List[Dict[str, Any]] = []
+        prefix = value[:earliest_match.start()]
+        if prefix:
+            segments.append({"text": prefix, "annotations": annotations.copy(), "href": inherited_href})
+
+        token_inner = earliest_match.group(1)
+        token_href = inherited_href
+        nested_annotations = annotations.copy()
+
+        if earliest_kind == "link":
+            token_href = earliest_match.group(2)
+        elif earliest_kind == "code":
+            nested_annotations["code"] = True
+            segments.append({"text": token_inner, "annotations": nested_annotations, "href": token_href})
+            suffix = value[earliest_match.end():]
+            if suffix:
+                segments.extend(
+                    self._parse_inline_markdown_segments(
+                        suffix,
+                        inherited_annotations=annotations,
+                        inherited_href=inherited_href,
+                        depth=depth + 1,
+                    )
+                )
+            return segments
+        elif earliest_kind == "bold":
+            nested_annotations["bold"] = True
+        elif earliest_kind == "strike":
+            nested_annotations["strikethrough"] = True
+        elif earliest_kind == "italic":
+            nested_annotations["italic"] = True
+
+        segments.extend(
+            self._parse_inline_markdown_segments(
+                token_inner,
+                inherited_annotations=nested_annotations,
+                inherited_href=token_href,
+                depth=depth + 1,
+            )
+        )
+
+        suffix = value[earliest_match.end():]
+        if suffix:
+            segments.extend(
+                self._parse_inline_markdown_segments(
+                    suffix,
+                    inherited_annotations=annotations,
+                    inherited_href=inherited_href,
+                    depth=depth + 1,
+                )
+            )
+        return segments
+
+
+    def _markdown_inline_to_rich_text(self, value: str) -> List[Dict[str, Any]]:
+        """Converts inline markdown (bold/italic/strike/code/links) to Notion rich_text."""
+        segments = self._parse_inline_markdown_segments(value)
+        rich_text_items: List[Dict[str, Any]] = []
+        for segment in segments:
+            text = segment.get("text", "")
+            if not text:
+                continue
+            text_payload: Dict[str, Any] = {"content": text}
+            href = segment.get("href")
+            if isinstance(href, str) and href:
+                text_payload["link"] = {"url": href}
+            rich_text_items.append(
+                {
+                    "type": "text",
+                    "text": text_payload,
+                    "annotations": segment.get("annotations", {}),
+                }
+            )
+        return self._normalize_rich_text(rich_text_items)
+
+
+    def _parse_markdown_table(self, lines: List[str], start_idx: int) -> Optional[tuple[Dict[str, Any], int]]:
+        """Parses a simple markdown table starting at start_idx."""
+        first = lines[start_idx].strip()
+        if "|" not in first:
+            return None
+
+        table_lines: List[str] = []
+        idx = start_idx
+        while idx < len(lines):
+            candidate = lines[idx].strip()
+            if not candidate or "|" not in candidate:
+                break
+            table_lines.append(candidate)
+            idx += 1
+
+        if len(table_lines) < 2:
+            return None
+
+        sep_line = table_lines[1].strip()
+        sep_cells = [cell.strip() for cell in sep_line.strip("|").split("|")]
+        if not sep_cells or not all(re.match(r"^:?-{3,}:?$", cell) for cell in sep_cells):
+            return None
+
+        header_cells = [cell.strip() for cell in table_lines[0].strip("|").split("|")]
+        col_count = len(header_cells)
+        if col_count == 0:
+            return None
+
+        def to_cells(raw_cells: List[str]) -> List[List[Dict[str, Any]]]:
+            normalized = raw_cells[:col_count] + ([""] * max(0, col_count - len(raw_cells)))
+            return [self._markdown_inline_to_rich_text(cell.strip()) for cell in normalized]
+
+        children = [
+            {
+                "object": "block",
+                "type": "table_row",
+                "table_row": {"cells": to_cells(header_cells)},
+            }
+        ]
+
+        for raw_line in table_lines[2:]:
+            row_cells = [cell.strip() for cell in raw_line.strip("|").split("|")]
+            children.append(
+                {
+                    "object": "block",
+                    "type": "table_row",
+                    "table_row": {"cells": to_cells(row_cells)},
+                }
+            )
+
+        return (
+            {
+                "object": "block",
+                "type": "table",
+                "table": {
+                    "table_width": col_count,
+                    "has_column_header": True,
+                    "has_row_header": False,
+                    "children": children,
+                },
+            },
+            idx,
+        )
+
+
+    def _internal_markdown_to_blocks(self, markdown: str) -> List[Dict[str, Any]]:
+        """Internal markdown parser for critical block types."""
+        lines = markdown.splitlines()
+        blocks: List[Dict[str, Any]] = []
+        paragraph_lines: List[str] = []
+
+        def flush_paragraph() -> None:
+            if not paragraph_lines:
+                return
+            text = " ".join(part.strip() for part in paragraph_lines if part.strip()).strip()
+            paragraph_lines.clear()
+            if not text:
+                return
+            blocks.append(
+                {
+                    "object": "block",
+                    "type": "paragraph",
+                    "paragraph": {"rich_text": self._markdown_inline_to_rich_text(text)},
+                }
+            )
+
+        in_code_fence = False
+        code_language = "plain text"
+        code_lines: List[str] = []
+
+        line_idx = 0
+        while line_idx < len(lines):
+            line = lines[line_idx]
+            stripped = line.strip()
+
+            if in_code_fence:
+                if stripped.startswith("```"):
+                    blocks.append(
+                        {
+                            "object": "block",
+                            "type": "code",
+                            "code": {
+                                "language": code_language,
+                                "rich_text": self._plain_text_rich_text("\n".join(code_lines)),
+                            },
+                        }
+                    )
+                    in_code_fence = False
+                    code_language = "plain text"
+                    code_lines = []
+                else:
+                    code_lines.append(line.rstrip("\n"))
+                line_idx += 1
+                continue
+
+            fence_match = re.match(r"^```([a-zA-Z0-9_+\- ]*)\s*$", stripped)
+            if fence_match:
+                flush_paragraph()
+                in_code_fence = True
+                parsed_language = fence_match.group(1).strip()
+                code_language = parsed_language if parsed_language else "plain text"
+                code_lines = []
+                line_idx += 1
+                continue
+
+            if not stripped:
+                flush_paragraph()
+                line_idx += 1
+                continue
+
+            heading_match = re.match(r"^(#{1,6})\s+(.*)$", stripped)
+            if heading_match:
+                flush_paragraph()
+                level = min(len(heading_match.group(1)), 3)
+                text = heading_match.group(2).strip()
+                blocks.append(
+                    {
+                        "object": "block",
+                        "type": f"heading_{level}",
+                        f"heading_{level}": {"rich_text": self._markdown_inline_to_rich_text(text)},
+                    }
+                )
+                line_idx += 1
+                continue
+
+            if re.match(r"^([-*_])(?:\s*\1){2,}\s*$", stripped):
+                flush_paragraph()
+                blocks.append({"object": "block", "type": "divider", "divider": {}})
+                line_idx += 1
+                continue
+
+            quote_match = re.match(r"^>\s?(.*)$", stripped)
+            if quote_match:
+                flush_paragraph()
+                blocks.append(
+                    {
+                        "object": "block",
+                        "type": "quote",
+                        "quote": {"rich_text": self._markdown_inline_to_rich_text(quote_match.group(1).strip())},
+                    }
+                )
+                line_idx += 1
+                continue
+
+            unordered_match = re.match(r"^[-*+]\s+(.*)$", stripped)
+            if unordered_match:
+                flush_paragraph()
+                blocks.append(
+                    {
+                        "object": "block",
+                        "type": "bulleted_list_item",
+                        "bulleted_list_item": {
+                            "rich_text": self._markdown_inline_to_rich_text(unordered_match.group(1).strip())
+                        },
+                    }
+                )
+                line_idx += 1
+                continue
+
+            ordered_match = re.match(r"^\d+\.\s+(.*)$", stripped)
+            if ordered_match:
+                flush_paragraph()
+                blocks.append(
+                    {
+                        "object": "block",
+                        "type": "numbered_list_item",
+                        "numbered_list_item": {
+                            "rich_text": self._markdown_inline_to_rich_text(ordered_match.group(1).strip())
+                        },
+                    }
+                )
+                line_idx += 1
+                continue
+
+            table_parse = self._parse_markdown_table(lines, line_idx)
+            if table_parse:
+                flush_paragraph()
+                table_block, next_idx = table_parse
+                blocks.append(table_block)
+                line_idx = next_idx
+                continue
+
+            paragraph_lines.append(line)
+            line_idx += 1
+
+        if in_code_fence:
+            blocks.append(
+                {
+                    "object": "block",
+                    "type": "code",
+                    "code": {
+                        "language": code_language,
+                        "rich_text": self._plain_text_rich_text("\n".join(code_lines)),
+                    },
+                }
+            )
+
+        flush_paragraph()
+        return blocks
+
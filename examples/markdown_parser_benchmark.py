@@ -0,0 +1,91 @@
+"""Benchmark markdown -> Notion block conversion on a generated report.
+
+Usage:
+    python examples/markdown_parser_benchmark.py [--size-mb 1.0] [--repeat 3]
+
+Times the current parser next to the previous one (vendored in
+`legacy_markdown_parser.py`): the time to convert the whole document, and the time
+until the first append batch (100 blocks) is ready, which is when `append_page_body`
+can send its first request. The old parser built the full list before returning.
+"""
+
+import argparse
+import itertools
+import time
+
+from legacy_markdown_parser import LegacyMarkdownHelper
+from notionhelper import NotionHelper
+
+
+SECTION = """## Run {n}: results
+
+Training finished after **{n} epochs** with *early stopping*; see the [dashboard](https://example.com/runs/{n}) and `config_{n}.yaml`.
+The ~~old~~ new scheduler kept the loss flat | stable for the last few steps.
+
+- learning rate `3e-4`, batch size **64**
+- warmup for *500* steps
+1. evaluate on the holdout split
+2. compare with the [baseline](https://example.com/baseline)
+
+> Note: numbers below are from the validation set.
+
+| Metric | Value | Delta |
+| --- | ---: | --- |
+| sMAPE | {n}.25 | -0.{n} |
+| MAE | 1.{n} | **+0.02** |
+
+```python
+model.fit(x, y, epochs={n})
+```
+
+---
+
+"""
+
+
+def build_report(size_bytes: int) -> str:
+    parts = []
+    total = 0
+    for n in itertools.count(1):
+        section = SECTION.format(n=n)
+        parts.append(section)
+        total += len(section)
+        if total >= size_bytes:
+            break
+    return "".join(parts)
+
+
+def time_call(function, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    helper = NotionHelper("benchmark-token")
+    legacy = LegacyMarkdownHelper("benchmark-token")
+    markdown = build_report(int(args.size_mb * 1024 * 1024))
+    blocks = helper._internal_markdown_to_blocks(markdown)
+    print(f"document: {len(markdown) / 1024 / 1024:.2f} MB, {len(blocks)} top-level blocks")
+    if legacy._internal_markdown_to_blocks(markdown) != blocks:
+        print("warning: the two parsers produced different blocks for this document")
+
+    old_full = time_call(lambda: legacy._internal_markdown_to_blocks(markdown), args.repeat)
+    new_full = time_call(lambda: helper._internal_markdown_to_blocks(markdown), args.repeat)
+    new_first = time_call(lambda: list(itertools.islice(helper._iter_markdown_blocks(markdown), 100)), args.repeat)
+
+    print(f"{'':24}{'previous':>10}{'current':>10}")
+    print(f"{'full conversion':24}{old_full * 1000:8.1f}ms{new_full * 1000:8.1f}ms")
+    print(f"{'first 100 blocks ready':24}{old_full * 1000:8.1f}ms{new_first * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,16 @@
 from .helper import NotionHelper
+from .async_helper import AsyncNotionHelper
 from .ml_logger import MLNotionHelper
 from .converter_adapter import ConverterAdapter, InternalConverterAdapter, NotionBlockifyAdapter
 from .retry_policy import RetryPolicy
+from .rate_limiter import RateLimiter, TokenBucketRateLimiter, FileLockRateLimiter
+from .filters import Filter, Property, Sort
+from .sync import SQLiteSnapshot, SyncResult
+from .page_cache import PageCache
+from .schema_cache import SchemaCache
+from .bulk import BulkResult, RowResult
+from .key_index import KeyIndex
+from .spool import ExperimentSpool
 from .errors import (
     NotionAPIError,
     AuthError,
@@ -13,11 +22,26 @@ from .errors import (
 
 __all__ = [
     "NotionHelper",
+    "AsyncNotionHelper",
     "MLNotionHelper",
     "ConverterAdapter",
     "InternalConverterAdapter",
     "NotionBlockifyAdapter",
     "RetryPolicy",
+    "RateLimiter",
+    "TokenBucketRateLimiter",
+    "FileLockRateLimiter",
+    "Filter",
+    "Property",
+    "Sort",
+    "SQLiteSnapshot",
+    "SyncResult",
+    "PageCache",
+    "SchemaCache",
+    "BulkResult",
+    "RowResult",
+    "KeyIndex",
+    "ExperimentSpool",
     "NotionAPIError",
     "AuthError",
     "RateLimitError",
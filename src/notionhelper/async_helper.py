@@ -0,0 +1,747 @@
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
+import asyncio
+import json
+import logging
+import math
+import mimetypes
+import os
+from urllib.parse import urlparse
+
+import httpx
+
+from .converter_adapter import ConverterAdapter
+from .errors import NotionAPIError, TimeoutError
+from .filters import FilterLike, SortLike, compile_filter, compile_sorts
+from .helper import (
+    DEFAULT_NOTION_API_VERSION,
+    DEFAULT_UPLOAD_PART_SIZE,
+    FILE_UPLOADS_URL,
+    MARKDOWN_NOTION_API_VERSION,
+    MAX_APPEND_BLOCK_ELEMENTS,
+    MAX_APPEND_PAYLOAD_BYTES,
+    MULTI_PART_UPLOAD_THRESHOLD,
+    NotionHelper,
+)
+from .rate_limiter import RateLimiter, TokenBucketRateLimiter
+from .retry_policy import RetryPolicy
+from .schema_cache import SchemaCache
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncNotionHelper:
+    """
+    An asyncio client mirroring the core NotionHelper API.
+
+    Network calls are awaitable and share one pooled `httpx.AsyncClient`, so hundreds of
+    requests can be fanned out from a single event loop. Retry policy, structured errors,
+    sanitization and markdown/block conversion are shared with NotionHelper.
+
+    Methods
+    -------
+    get_database(database_id):
+        Retrieves the database object, which contains a list of data sources.
+
+    get_data_source(data_source_id):
+        Retrieves a specific data source, including its properties (schema).
+
+    get_page(page_id, return_markdown=False, ...):
+        Returns page properties and content, hydrating nested blocks concurrently.
+
+    get_page_markdown(page_id, include_transcript=False):
+        Retrieves page content using Notion's native markdown endpoint.
+
+    update_page_markdown(page_id, command, ...):
+        Updates page content using Notion's native markdown update endpoint.
+
+    iter_data_source_pages(data_source_id, ...):
+        Async generator yielding pages from a data source.
+
+    new_page_to_data_source(data_source_id, page_properties=None, markdown=None):
+        Adds a new page to a Notion data source.
+
+    append_page_body(page_id, body=None, ...):
+        Appends Notion blocks or raw markdown text to the body of a Notion page.
+
+    upload_file(file_path, progress_callback=None, part_size=10MB):
+        Uploads a file to Notion and returns the file upload object (multi-part over 20MB).
+
+    aclose():
+        Closes the underlying HTTP client.
+    """
+
+    def __init__(
+        self,
+        notion_token: str,
+        debug: bool = False,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        request_timeout: float = 30.0,
+        converter_adapter: Optional[ConverterAdapter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        schema_cache: Optional[SchemaCache] = None,
+        max_concurrency: int = 16,
+    ):
+        """Initializes the AsyncNotionHelper instance with the provided token.
+
+        Parameters:
+            notion_token (str): Notion API secret.
+            debug (bool): Enables verbose debug logging for API calls.
+            max_retries (int): Number of retries for 429/5xx and transient request failures.
+            retry_base_delay (float): Base delay (seconds) for exponential backoff.
+            request_timeout (float): Timeout (seconds) for HTTP requests.
+            converter_adapter (ConverterAdapter, optional): Custom markdown/block conversion adapter.
+            retry_policy (RetryPolicy, optional): Global retry policy; overrides retry params when provided.
+            max_connections (int): Maximum number of concurrent connections in the client pool.
+            max_keepalive_connections (int): Maximum number of idle keep-alive connections.
+            client (httpx.AsyncClient, optional): Externally managed client. The helper will not
+                close a client it did not create.
+            rate_limiter (RateLimiter, optional): Proactive limiter consulted before every request
+                attempt; waits are awaited rather than blocking the event loop.
+            schema_cache (SchemaCache, optional): In-process TTL cache for `get_database` and
+                `get_data_source`; can be shared with a `NotionHelper`.
+            max_concurrency (int): Maximum block-children requests in flight while hydrating
+                a page tree.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        # The sync helper is used for offline work only (headers, retry policy, conversion,
+        # sanitization and error classification); it never performs network I/O here.
+        self._helper = NotionHelper(
+            notion_token,
+            debug=debug,
+            max_retries=max_retries,
+            retry_base_delay=retry_base_delay,
+            request_timeout=request_timeout,
+            converter_adapter=converter_adapter,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            schema_cache=schema_cache,
+        )
+        self.notion_token = notion_token
+        self.debug = debug
+        self.max_concurrency = max_concurrency
+        self._block_semaphore = asyncio.Semaphore(max_concurrency)
+        self._owns_client = client is None
+        self._client = client if client is not None else httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._helper.retry_policy
+
+    def set_retry_policy(self, retry_policy: RetryPolicy) -> None:
+        """Overrides the active retry policy."""
+        self._helper.set_retry_policy(retry_policy)
+
+    def set_rate_limiter(self, rate_limiter: Optional[RateLimiter]) -> None:
+        """Sets (or clears, with None) the proactive request rate limiter."""
+        self._helper.set_rate_limiter(rate_limiter)
+
+    def set_converter_adapter(self, converter_adapter: ConverterAdapter) -> None:
+        """Overrides the active conversion adapter."""
+        self._helper.set_converter_adapter(converter_adapter)
+
+    async def aclose(self) -> None:
+        """Closes the HTTP client if it is owned by this helper."""
+        self._helper.close()
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncNotionHelper":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        await self.aclose()
+
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        api_version: str = DEFAULT_NOTION_API_VERSION,
+        params: Optional[Dict[str, Any]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        request_timeout: Optional[float] = None,
+        files: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Internal helper to make authenticated requests to the Notion API.
+        Mirrors NotionHelper._make_request, backing off with asyncio.sleep instead of time.sleep.
+        """
+        effective_policy = self._helper._build_retry_policy(retry_policy, request_timeout)
+        headers = self._helper._request_headers(api_version, json_body=files is None)
+        request_method = method.upper()
+        if request_method not in {"GET", "POST", "PATCH"}:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        request_path = urlparse(url).path
+
+        if self.debug:
+            LOGGER.debug(
+                "Notion request method=%s url=%s params=%s payload_keys=%s",
+                request_method,
+                url,
+                params,
+                sorted(payload.keys()) if isinstance(payload, dict) else None,
+            )
+
+        for attempt in range(effective_policy.max_retries + 1):
+            response = None
+            rate_limiter = self._helper.rate_limiter
+            if rate_limiter is not None:
+                # Other limiters (e.g. FileLockRateLimiter) may block on I/O or OS locks,
+                # so they reserve in a worker thread instead of on the event loop.
+                if isinstance(rate_limiter, TokenBucketRateLimiter):
+                    wait = rate_limiter.reserve()
+                else:
+                    wait = await asyncio.to_thread(rate_limiter.reserve)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            try:
+                if request_method == "GET":
+                    response = await self._client.get(
+                        url,
+                        headers=headers,
+                        params=params,
+                        timeout=effective_policy.timeout,
+                    )
+                elif request_method == "POST" and files is not None:
+                    self._helper._rewind_files(files)
+                    response = await self._client.post(
+                        url,
+                        headers=headers,
+                        data=payload,
+                        files=files,
+                        timeout=effective_policy.timeout,
+                    )
+                elif request_method == "POST":
+                    response = await self._client.post(
+                        url,
+                        headers=headers,
+                        params=params,
+                        content=json.dumps(payload),
+                        timeout=effective_policy.timeout,
+                    )
+                else:
+                    response = await self._client.patch(
+                        url,
+                        headers=headers,
+                        content=json.dumps(payload),
+                        timeout=effective_policy.timeout,
+                    )
+
+                if response.status_code in effective_policy.retry_statuses and attempt < effective_policy.max_retries:
+                    delay = effective_policy.compute_delay(
+                        attempt,
+                        retry_after=self._helper._retry_after_seconds(response),
+                    )
+                    LOGGER.warning(
+                        "Transient Notion error status=%s on %s %s. Retrying in %.2fs (attempt %s/%s).",
+                        response.status_code,
+                        request_method,
+                        url,
+                        delay,
+                        attempt + 1,
+                        effective_policy.max_retries,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                if 200 <= response.status_code < 300:
+                    try:
+                        return response.json()
+                    except ValueError:
+                        return {}
+
+                self._helper._log_bad_child_block(payload, response)
+                raise self._helper._classify_api_error(response, request_path)
+
+            except httpx.TimeoutException as req_err:
+                is_last_attempt = attempt >= effective_policy.max_retries
+                if not is_last_attempt and effective_policy.retry_on_timeout:
+                    delay = effective_policy.compute_delay(attempt)
+                    LOGGER.warning(
+                        "Timeout on %s %s: %s. Retrying in %.2fs (attempt %s/%s).",
+                        request_method,
+                        url,
+                        req_err,
+                        delay,
+                        attempt + 1,
+                        effective_policy.max_retries,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                raise TimeoutError(
+                    "Notion API request timed out",
+                    status_code=None,
+                    request_path=request_path,
+                    notion_code=None,
+                ) from req_err
+            except httpx.HTTPError as req_err:
+                is_last_attempt = attempt >= effective_policy.max_retries
+                if not is_last_attempt and effective_policy.retry_on_connection_error:
+                    delay = effective_policy.compute_delay(attempt)
+                    LOGGER.warning(
+                        "Request error on %s %s: %s. Retrying in %.2fs (attempt %s/%s).",
+                        request_method,
+                        url,
+                        req_err,
+                        delay,
+                        attempt + 1,
+                        effective_policy.max_retries,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                raise NotionAPIError(
+                    "Notion API request failed",
+                    status_code=response.status_code if response is not None else None,
+                    request_path=request_path,
+                    notion_code=None,
+                ) from req_err
+
+        raise RuntimeError("Request retry loop exited unexpectedly")
+
+    async def get_database(self, database_id: str) -> Dict[str, Any]:
+        """Retrieves the database object, which contains a list of data sources."""
+        url = f"https://api.notion.com/v1/databases/{database_id}"
+        return await self._get_schema("database", database_id, url)
+
+    async def get_data_source(self, data_source_id: str) -> Dict[str, Any]:
+        """Retrieves a specific data source, including its properties (schema)."""
+        url = f"https://api.notion.com/v1/data_sources/{data_source_id}"
+        return await self._get_schema("data_source", data_source_id, url)
+
+    async def _get_schema(self, kind: str, object_id: str, url: str) -> Dict[str, Any]:
+        """GETs a database/data source, going through the schema cache when configured."""
+        schema_cache = self._helper.schema_cache
+        if schema_cache is None:
+            return await self._make_request("GET", url)
+        key = self._helper._schema_cache_key(kind, object_id)
+        cached = schema_cache.get(key)
+        if cached is not None:
+            return cached
+        response = await self._make_request("GET", url)
+        if isinstance(response, dict):
+            schema_cache.set(key, response)
+        return response
+
+    async def get_page_markdown(self, page_id: str, include_transcript: bool = False) -> Dict[str, Any]:
+        """Retrieves page content using Notion's native markdown endpoint."""
+        url = f"https://api.notion.com/v1/pages/{page_id}/markdown"
+        params = {"include_transcript": True} if include_transcript else None
+        return await self._make_request(
+            "GET",
+            url,
+            api_version=MARKDOWN_NOTION_API_VERSION,
+            params=params,
+        )
+
+    async def update_page_markdown(
+        self,
+        page_id: str,
+        command: str,
+        *,
+        content_updates: Optional[List[Dict[str, Any]]] = None,
+        new_str: Optional[str] = None,
+        content: Optional[str] = None,
+        after: Optional[str] = None,
+        content_range: Optional[str] = None,
+        allow_deleting_content: bool = False,
+    ) -> Dict[str, Any]:
+        """Updates page content using Notion's native markdown update endpoint."""
+        payload = self._helper._build_markdown_update_payload(
+            command,
+            content_updates=content_updates,
+            new_str=new_str,
+            content=content,
+            after=after,
+            content_range=content_range,
+            allow_deleting_content=allow_deleting_content,
+        )
+        url = f"https://api.notion.com/v1/pages/{page_id}/markdown"
+        return await self._make_request(
+            "PATCH",
+            url,
+            payload,
+            api_version=MARKDOWN_NOTION_API_VERSION,
+        )
+
+    async def _get_page_blocks(
+        self,
+        page_id: str,
+        prefetched_blocks_page: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Retrieves all child blocks for a page/block and hydrates nested children concurrently.
+
+        At most `max_concurrency` children listings are in flight at once across the tree.
+        """
+        blocks_url = f"https://api.notion.com/v1/blocks/{page_id}/children"
+        content_blocks: List[Dict[str, Any]] = []
+        next_cursor = None if prefetched_blocks_page is None else prefetched_blocks_page.get("next_cursor")
+        first_iteration = True
+        while True:
+            if first_iteration and prefetched_blocks_page is not None:
+                blocks = prefetched_blocks_page
+            else:
+                params: Dict[str, Any] = {"page_size": 100}
+                if next_cursor:
+                    params["start_cursor"] = next_cursor
+                async with self._block_semaphore:
+                    blocks = await self._make_request("GET", blocks_url, params=params)
+            first_iteration = False
+            content_blocks.extend(blocks.get("results", []))
+            if not blocks.get("has_more"):
+                break
+            next_cursor = blocks.get("next_cursor")
+            if not next_cursor:
+                break
+
+        hydrated = [block for block in content_blocks if isinstance(block, dict)]
+        parents = [block for block in hydrated if block.get("has_children") and block.get("id")]
+        children_lists = await asyncio.gather(*(self._get_page_blocks(block["id"]) for block in parents))
+        for block, children in zip(parents, children_lists):
+            block_type = block.get("type")
+            if isinstance(block_type, str):
+                block_payload = block.get(block_type, {})
+                if isinstance(block_payload, dict):
+                    block_payload["children"] = children
+                    block[block_type] = block_payload
+        return hydrated
+
+    async def _expand_child_pages(
+        self,
+        blocks: List[Dict[str, Any]],
+        *,
+        return_markdown: bool,
+        use_markdown_api: bool,
+        include_transcript: bool,
+        max_child_page_depth: int,
+        child_page_depth: int,
+        visited_page_ids: set[str],
+    ) -> None:
+        """Fetches child_page blocks concurrently and embeds their page payload in place."""
+        pending: List[Dict[str, Any]] = []
+
+        def walk(items: List[Dict[str, Any]]) -> None:
+            for block in items:
+                if not isinstance(block, dict):
+                    continue
+                block_type = block.get("type")
+                child_page_id = block.get("id")
+                if (
+                    block_type == "child_page"
+                    and isinstance(child_page_id, str)
+                    and child_page_depth < max_child_page_depth
+                    and child_page_id not in visited_page_ids
+                ):
+                    pending.append(block)
+                block_payload = block.get(block_type, {}) if isinstance(block_type, str) else {}
+                if isinstance(block_payload, dict) and isinstance(block_payload.get("children"), list):
+                    walk(block_payload["children"])
+
+        walk(blocks)
+        pages = await asyncio.gather(
+            *(
+                self._get_page(
+                    block["id"],
+                    return_markdown=return_markdown,
+                    use_markdown_api=use_markdown_api,
+                    include_transcript=include_transcript,
+                    expand_child_pages=True,
+                    max_child_page_depth=max_child_page_depth,
+                    child_page_depth=child_page_depth + 1,
+                    visited_page_ids=visited_page_ids | {block["id"]},
+                )
+                for block in pending
+            )
+        )
+        for block, page in zip(pending, pages):
+            child_payload = block.get("child_page", {})
+            child_payload = child_payload if isinstance(child_payload, dict) else {}
+            child_payload["page"] = page
+            block["child_page"] = child_payload
+
+    async def get_page(
+        self,
+        page_id: str,
+        return_markdown: bool = False,
+        use_markdown_api: Optional[bool] = None,
+        include_transcript: bool = False,
+        expand_child_pages: bool = True,
+        max_child_page_depth: int = 3,
+    ) -> Dict[str, Any]:
+        """Retrieves the page properties and content on a Notion page given its page_id.
+
+        Parameters and return shape match NotionHelper.get_page; nested block children and
+        child pages are fetched concurrently.
+        """
+        if max_child_page_depth < 0:
+            raise ValueError("max_child_page_depth must be >= 0")
+        if use_markdown_api is None:
+            use_markdown_api = return_markdown
+        return await self._get_page(
+            page_id,
+            return_markdown=return_markdown,
+            use_markdown_api=use_markdown_api,
+            include_transcript=include_transcript,
+            expand_child_pages=expand_child_pages,
+            max_child_page_depth=max_child_page_depth,
+            child_page_depth=0,
+            visited_page_ids={page_id},
+        )
+
+    async def _get_page(
+        self,
+        page_id: str,
+        *,
+        return_markdown: bool,
+        use_markdown_api: bool,
+        include_transcript: bool,
+        expand_child_pages: bool,
+        max_child_page_depth: int,
+        child_page_depth: int,
+        visited_page_ids: set[str],
+    ) -> Dict[str, Any]:
+        page_url = f"https://api.notion.com/v1/pages/{page_id}"
+        if return_markdown and use_markdown_api:
+            page, markdown_response = await asyncio.gather(
+                self._make_request("GET", page_url),
+                self.get_page_markdown(page_id, include_transcript=include_transcript),
+            )
+        else:
+            page = await self._make_request("GET", page_url)
+            markdown_response = None
+
+        properties = page.get("properties", {})
+        prefetched_blocks_page: Optional[Dict[str, Any]] = None
+        native_markdown: Optional[str] = None
+        if isinstance(markdown_response, dict) and "markdown" in markdown_response:
+            native_markdown = markdown_response.get("markdown", "")
+        elif isinstance(markdown_response, dict) and "results" in markdown_response:
+            prefetched_blocks_page = markdown_response
+
+        content_blocks = await self._get_page_blocks(page_id, prefetched_blocks_page=prefetched_blocks_page)
+        if expand_child_pages:
+            await self._expand_child_pages(
+                content_blocks,
+                return_markdown=return_markdown,
+                use_markdown_api=use_markdown_api,
+                include_transcript=include_transcript,
+                max_child_page_depth=max_child_page_depth,
+                child_page_depth=child_page_depth,
+                visited_page_ids=visited_page_ids,
+            )
+        child_pages = self._helper._collect_expanded_child_pages(content_blocks) if expand_child_pages else []
+
+        if return_markdown:
+            content: Union[str, List[Dict[str, Any]]] = (
+                native_markdown
+                if native_markdown is not None
+                else self._helper._converter_adapter.blocks_to_markdown(content_blocks)
+            )
+        else:
+            content = content_blocks
+
+        result = {"properties": properties, "content": content}
+        if child_pages:
+            result["child_pages"] = child_pages
+        return result
+
+    async def iter_data_source_pages(
+        self,
+        data_source_id: str,
+        limit: Optional[int] = None,
+        page_size: int = 100,
+        start_cursor: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        request_timeout: Optional[float] = None,
+        filter: Optional[FilterLike] = None,
+        sorts: Optional[List[SortLike]] = None,
+        filter_properties: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yields pages from a data source incrementally using cursor pagination.
+
+        `filter`, `sorts` and `filter_properties` behave as in
+        `NotionHelper.iter_data_source_pages`.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        page_size = min(page_size, 100)
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be >= 0")
+        if limit == 0:
+            return
+
+        query: Dict[str, Any] = {}
+        if filter is not None:
+            query["filter"] = compile_filter(filter)
+        if sorts:
+            query["sorts"] = compile_sorts(sorts)
+        params = {"filter_properties": list(filter_properties)} if filter_properties else None
+
+        url = f"https://api.notion.com/v1/data_sources/{data_source_id}/query"
+        has_more = True
+        cursor = start_cursor
+        yielded = 0
+
+        while has_more:
+            payload: Dict[str, Any] = {**query, "page_size": page_size}
+            if cursor:
+                payload["start_cursor"] = cursor
+            if limit is not None:
+                payload["page_size"] = min(page_size, limit - yielded)
+
+            response = await self._make_request(
+                "POST",
+                url,
+                payload,
+                params=params,
+                retry_policy=retry_policy,
+                request_timeout=request_timeout,
+            )
+            results = response.get("results", [])
+            if not isinstance(results, list):
+                break
+
+            for page in results:
+                if not isinstance(page, dict):
+                    continue
+                yield page
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+            has_more = bool(response.get("has_more", False))
+            cursor = response.get("next_cursor", None)
+            if has_more and not cursor:
+                break
+
+    async def new_page_to_data_source(
+        self,
+        data_source_id: str,
+        page_properties: Optional[Dict[str, Any]] = None,
+        markdown: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Adds a new page to a Notion data source."""
+        payload, api_version = self._helper._build_new_page_payload(data_source_id, page_properties, markdown)
+        url = "https://api.notion.com/v1/pages"
+        return await self._make_request("POST", url, payload, api_version=api_version)
+
+    async def append_page_body(
+        self,
+        page_id: str,
+        body: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        sanitize: bool = True,
+        blocks: Optional[List[Dict[str, Any]]] = None,
+        batch_size: int = 100,
+        max_payload_bytes: int = MAX_APPEND_PAYLOAD_BYTES,
+        max_block_elements: int = MAX_APPEND_BLOCK_ELEMENTS,
+    ) -> Dict[str, Any]:
+        """Appends blocks or markdown text to a Notion page body.
+
+        Batches are packed under the same count, byte and block-element budgets as
+        `NotionHelper.append_page_body` and sent in order, since each append lands after
+        the previous one.
+        """
+        payload_blocks, batch_size = self._helper._prepare_append_blocks(body, blocks, sanitize, batch_size)
+
+        url = f"https://api.notion.com/v1/blocks/{page_id}/children"
+        if not payload_blocks:
+            return {"object": "list", "results": []}
+
+        responses = []
+        for batch in self._helper._pack_append_batches(
+            payload_blocks, batch_size, max_payload_bytes, max_block_elements
+        ):
+            responses.append(await self._make_request("PATCH", url, {"children": batch}))
+
+        return self._helper._merge_append_responses(responses)
+
+    async def upload_file(
+        self,
+        file_path: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        part_size: int = DEFAULT_UPLOAD_PART_SIZE,
+    ) -> Dict[str, Any]:
+        """Uploads a file to Notion and returns the file upload object.
+
+        Files larger than 20MB use Notion's multi-part mode, one `part_size` part at a
+        time, with parts read from disk in a worker thread. Unlike
+        `NotionHelper.upload_file_multipart`, an interrupted upload is not resumed.
+        `progress_callback(bytes_sent, total_bytes)` is called after each part, or once
+        when a single-part upload completes.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        total_bytes = os.path.getsize(file_path) if os.path.isfile(file_path) else 0
+        multi_part = total_bytes > MULTI_PART_UPLOAD_THRESHOLD
+        if multi_part:
+            self._helper._check_upload_part_size(total_bytes, part_size)
+
+        try:
+            if multi_part:
+                return await self._upload_file_multipart(file_path, total_bytes, part_size, progress_callback)
+
+            upload_data = await self._make_request("POST", FILE_UPLOADS_URL, {})
+            upload_url = upload_data["upload_url"]
+
+            with open(file_path, "rb") as f:
+                files = {'file': (os.path.basename(file_path), f, mimetypes.guess_type(file_path)[0] or 'application/octet-stream')}
+                result = await self._make_request("POST", upload_url, files=files)
+            if progress_callback is not None:
+                progress_callback(total_bytes, total_bytes)
+            return result
+        except NotionAPIError as e:
+            raise Exception(f"Failed to upload file {file_path}: {str(e)}") from e
+        except Exception as e:
+            raise Exception(f"Error uploading file {file_path}: {str(e)}") from e
+
+    async def _upload_file_multipart(
+        self,
+        file_path: str,
+        total_bytes: int,
+        part_size: int,
+        progress_callback: Optional[Callable[[int, int], None]],
+    ) -> Dict[str, Any]:
+        number_of_parts = max(1, math.ceil(total_bytes / part_size))
+        filename = os.path.basename(file_path)
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        upload = await self._make_request(
+            "POST",
+            FILE_UPLOADS_URL,
+            {
+                "mode": "multi_part",
+                "number_of_parts": number_of_parts,
+                "filename": filename,
+                "content_type": content_type,
+            },
+        )
+        upload_id = upload["id"]
+
+        def read_part(offset: int) -> bytes:
+            with open(file_path, "rb") as handle:
+                handle.seek(offset)
+                return handle.read(part_size)
+
+        for part_number in range(1, number_of_parts + 1):
+            offset = (part_number - 1) * part_size
+            chunk = await asyncio.to_thread(read_part, offset)
+            await self._make_request(
+                "POST",
+                f"{FILE_UPLOADS_URL}/{upload_id}/send",
+                {"part_number": str(part_number)},
+                files={"file": (filename, chunk, content_type)},
+            )
+            if progress_callback is not None:
+                progress_callback(min(offset + part_size, total_bytes), total_bytes)
+
+        return await self._make_request("POST", f"{FILE_UPLOADS_URL}/{upload_id}/complete", {})
@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+
+@dataclass
+class RowResult:
+    """Outcome of writing one input row."""
+
+    index: int
+    status: str  # "created", "updated" or "failed"
+    page_id: Optional[str] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "failed"
+
+
+@dataclass
+class BulkResult:
+    """Per-row report of a bulk write, usable to resume an interrupted run.
+
+    `rows` holds one entry per attempted input row, ordered by row index. Rows that
+    were never attempted (because the run was aborted) have no entry. Pass the report
+    back as `resume_from=` to retry only rows without a successful entry.
+    """
+
+    rows: List[RowResult] = field(default_factory=list)
+    aborted: Optional[str] = None
+
+    @property
+    def succeeded(self) -> List[RowResult]:
+        return [row for row in self.rows if row.ok]
+
+    @property
+    def failed(self) -> List[RowResult]:
+        return [row for row in self.rows if not row.ok]
+
+    @property
+    def completed_indices(self) -> Set[int]:
+        return {row.index for row in self.rows if row.ok}
+
+    def merge(self, other: "BulkResult") -> "BulkResult":
+        """Combines an earlier report with a resumed run; later rows win."""
+        by_index = {row.index: row for row in self.rows}
+        by_index.update({row.index: row for row in other.rows})
+        return BulkResult(rows=[by_index[idx] for idx in sorted(by_index)], aborted=other.aborted)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rows": [
+                {
+                    "index": row.index,
+                    "status": row.status,
+                    "page_id": row.page_id,
+                    "error": row.error,
+                    "error_type": row.error_type,
+                }
+                for row in self.rows
+            ],
+            "aborted": self.aborted,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BulkResult":
+        return cls(
+            rows=[RowResult(**row) for row in data.get("rows", [])],
+            aborted=data.get("aborted"),
+        )
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional, Protocol
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Protocol
 import re
 
 try:
@@ -11,7 +11,11 @@ Block = Dict[str, Any]
 
 
 class ConverterAdapter(Protocol):
-    """Adapter interface for markdown/block conversion."""
+    """Adapter interface for markdown/block conversion.
+
+    Adapters may also define `iter_markdown_blocks(markdown)` to yield blocks lazily;
+    `append_page_body` then starts sending before the whole document is converted.
+    """
 
     def markdown_to_blocks(self, markdown: str) -> List[Block]:
         ...
@@ -27,13 +31,20 @@ class InternalConverterAdapter:
         self,
         markdown_to_blocks_fn: Callable[[str], List[Block]],
         blocks_to_markdown_fn: Callable[[List[Block]], str],
+        iter_markdown_blocks_fn: Optional[Callable[[str], Iterable[Block]]] = None,
     ) -> None:
         self._markdown_to_blocks_fn = markdown_to_blocks_fn
         self._blocks_to_markdown_fn = blocks_to_markdown_fn
+        self._iter_markdown_blocks_fn = iter_markdown_blocks_fn
 
     def markdown_to_blocks(self, markdown: str) -> List[Block]:
         return self._markdown_to_blocks_fn(markdown)
 
+    def iter_markdown_blocks(self, markdown: str) -> Iterator[Block]:
+        if self._iter_markdown_blocks_fn is None:
+            return iter(self.markdown_to_blocks(markdown))
+        return iter(self._iter_markdown_blocks_fn(markdown))
+
     def blocks_to_markdown(self, blocks: List[Block]) -> str:
         return self._blocks_to_markdown_fn(blocks)
 
@@ -55,6 +66,13 @@ class NotionBlockifyAdapter:
             return converted
         return self._fallback.markdown_to_blocks(markdown)
 
+    def iter_markdown_blocks(self, markdown: str) -> Iterator[Block]:
+        # notion_blockify converts whole documents; only the fallback can stream.
+        iter_fallback = getattr(self._fallback, "iter_markdown_blocks", None)
+        if self._blockify_module is None and callable(iter_fallback):
+            return iter(iter_fallback(markdown))
+        return iter(self.markdown_to_blocks(markdown))
+
     def blocks_to_markdown(self, blocks: List[Block]) -> str:
         # Keep reverse conversion stable via whichever renderer the app uses today.
         return self._fallback.blocks_to_markdown(blocks)
@@ -0,0 +1,198 @@
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+
+Page = Dict[str, Any]
+# (property_type, property_value, utc) -> flattened value or a skip sentinel
+ValueExtractor = Callable[[str, Dict[str, Any], bool], Any]
+
+NUMBER_TYPES = frozenset({"number"})
+BOOL_TYPES = frozenset({"checkbox"})
+DATETIME_TYPES = frozenset({"date", "created_time", "last_edited_time"})
+CATEGORICAL_TYPES = frozenset({"select", "status"})
+
+
+class _GrowableArray:
+    """Numpy buffer with amortized O(1) appends."""
+
+    def __init__(self, dtype: Any, fill_value: Any, capacity: int) -> None:
+        self._data = np.full(max(1, capacity), fill_value, dtype=dtype)
+        self._fill_value = fill_value
+        self._size = 0
+
+    def reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        if needed <= len(self._data):
+            return
+        capacity = max(needed, len(self._data) * 2)
+        grown = np.full(capacity, self._fill_value, dtype=self._data.dtype)
+        grown[: self._size] = self._data[: self._size]
+        self._data = grown
+
+    def extend(self, values: np.ndarray) -> None:
+        self.reserve(len(values))
+        self._data[self._size : self._size + len(values)] = values
+        self._size += len(values)
+
+    def values(self) -> np.ndarray:
+        return self._data[: self._size]
+
+
+class ColumnarFrameBuilder:
+    """Builds a DataFrame from data source query batches using typed column buffers.
+
+    The data source schema decides each column's storage up front: `number` goes to
+    float64 (NaN for empty), `checkbox` to bool, `date`/`created_time`/`last_edited_time`
+    to datetime64[ns, UTC] parsed once per batch, and `select`/`status` to integer codes
+    that become a categorical with the schema's options. Remaining types are kept as
+    Python objects, extracted the same way as row records.
+    """
+
+    def __init__(
+        self,
+        schema_properties: Dict[str, Any],
+        extract_value: ValueExtractor,
+        allowed_types: frozenset,
+        skip: Any,
+        include_page_ids: bool = True,
+        utc: bool = True,
+        capacity: int = 100,
+    ) -> None:
+        self._extract_value = extract_value
+        self._skip = skip
+        self._include_page_ids = include_page_ids
+        self._utc = utc
+        self._size = 0
+        self._page_ids: List[str] = []
+        self._columns: Dict[str, str] = {}
+        self._numbers: Dict[str, _GrowableArray] = {}
+        self._bools: Dict[str, _GrowableArray] = {}
+        self._datetimes: Dict[str, _GrowableArray] = {}
+        self._codes: Dict[str, _GrowableArray] = {}
+        self._categories: Dict[str, Dict[str, int]] = {}
+        self._objects: Dict[str, List[Any]] = {}
+
+        for name, definition in schema_properties.items():
+            if not isinstance(definition, dict):
+                continue
+            property_type = definition.get("type", "")
+            if property_type not in allowed_types:
+                continue
+            self._columns[name] = property_type
+            if property_type in NUMBER_TYPES:
+                self._numbers[name] = _GrowableArray(np.float64, np.nan, capacity)
+            elif property_type in BOOL_TYPES:
+                self._bools[name] = _GrowableArray(np.bool_, False, capacity)
+            elif property_type in DATETIME_TYPES:
+                self._datetimes[name] = _GrowableArray(np.int64, np.iinfo(np.int64).min, capacity)
+            elif property_type in CATEGORICAL_TYPES:
+                self._codes[name] = _GrowableArray(np.int32, -1, capacity)
+                options = definition.get(property_type, {})
+                options = options.get("options", []) if isinstance(options, dict) else []
+                categories: Dict[str, int] = {}
+                for option in options:
+                    option_name = option.get("name") if isinstance(option, dict) else None
+                    if isinstance(option_name, str) and option_name not in categories:
+                        categories[option_name] = len(categories)
+                self._categories[name] = categories
+            else:
+                self._objects[name] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, pages: List[Page]) -> None:
+        """Appends one batch of raw page objects to the column buffers."""
+        pages = [page for page in pages if isinstance(page, dict)]
+        if not pages:
+            return
+        count = len(pages)
+        properties_list = [
+            page.get("properties") if isinstance(page.get("properties"), dict) else {}
+            for page in pages
+        ]
+        if self._include_page_ids:
+            self._page_ids.extend(page.get("id", "") for page in pages)
+
+        for name, buffer in self._numbers.items():
+            values = np.full(count, np.nan, dtype=np.float64)
+            for idx, properties in enumerate(properties_list):
+                number_value = (properties.get(name) or {}).get("number")
+                if isinstance(number_value, (int, float)) and not isinstance(number_value, bool):
+                    values[idx] = number_value
+            buffer.extend(values)
+
+        for name, buffer in self._bools.items():
+            buffer.extend(
+                np.fromiter(
+                    (bool((properties.get(name) or {}).get("checkbox", False)) for properties in properties_list),
+                    dtype=np.bool_,
+                    count=count,
+                )
+            )
+
+        for name, buffer in self._datetimes.items():
+            property_type = self._columns[name]
+            raw_values: List[Optional[str]] = []
+            for properties in properties_list:
+                value = properties.get(name) or {}
+                if property_type == "date":
+                    date_value = value.get("date")
+                    raw = date_value.get("start") if isinstance(date_value, dict) else None
+                else:
+                    raw = value.get(property_type)
+                raw_values.append(raw if isinstance(raw, str) and raw else None)
+            parsed = pd.to_datetime(raw_values, utc=True, errors="coerce", format="ISO8601")
+            buffer.extend(parsed.as_unit("ns").asi8)
+
+        for name, buffer in self._codes.items():
+            property_type = self._columns[name]
+            categories = self._categories[name]
+            codes = np.full(count, -1, dtype=np.int32)
+            for idx, properties in enumerate(properties_list):
+                option = (properties.get(name) or {}).get(property_type)
+                option_name = option.get("name") if isinstance(option, dict) else None
+                if not isinstance(option_name, str):
+                    continue
+                code = categories.get(option_name)
+                if code is None:
+                    code = categories[option_name] = len(categories)
+                codes[idx] = code
+            buffer.extend(codes)
+
+        for name, column in self._objects.items():
+            property_type = self._columns[name]
+            for properties in properties_list:
+                value = properties.get(name)
+                extracted = (
+                    self._extract_value(property_type, value, self._utc)
+                    if isinstance(value, dict)
+                    else self._skip
+                )
+                column.append(None if extracted is self._skip else extracted)
+
+        self._size += count
+
+    def build(self) -> pd.DataFrame:
+        """Materializes the buffered columns as a DataFrame in schema order."""
+        data: Dict[str, Any] = {}
+        if self._include_page_ids:
+            data["notion_page_id"] = pd.array(self._page_ids, dtype=object)
+        for name in self._columns:
+            if name in self._numbers:
+                data[name] = self._numbers[name].values()
+            elif name in self._bools:
+                data[name] = self._bools[name].values()
+            elif name in self._datetimes:
+                data[name] = pd.DatetimeIndex(
+                    self._datetimes[name].values().view("datetime64[ns]")
+                ).tz_localize("UTC")
+            elif name in self._codes:
+                data[name] = pd.Categorical.from_codes(
+                    self._codes[name].values(),
+                    categories=list(self._categories[name]),
+                )
+            else:
+                data[name] = self._objects[name]
+        return pd.DataFrame(data, index=pd.RangeIndex(self._size))
@@ -0,0 +1,209 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+
+FilterLike = Union["Filter", Dict[str, Any]]
+SortLike = Union["Sort", Dict[str, Any]]
+
+# Property types whose range comparisons use before/after instead of greater/less than.
+_DATE_TYPES = frozenset({"date", "created_time", "last_edited_time"})
+
+
+class Filter:
+    """A compiled Notion data source filter.
+
+    Combine filters with `&` and `|`; nested groups of the same operator are
+    flattened. `to_dict()` returns the JSON body for the query's `filter` field.
+    """
+
+    def __init__(self, body: Dict[str, Any]) -> None:
+        self._body = body
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._body
+
+    def _combine(self, operator: str, other: FilterLike) -> "Filter":
+        operands: List[Dict[str, Any]] = []
+        for operand in (self, other):
+            body = compile_filter(operand)
+            if set(body) == {operator}:
+                operands.extend(body[operator])
+            else:
+                operands.append(body)
+        return Filter({operator: operands})
+
+    def __and__(self, other: FilterLike) -> "Filter":
+        return self._combine("and", other)
+
+    def __or__(self, other: FilterLike) -> "Filter":
+        return self._combine("or", other)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Filter):
+            return self._body == other._body
+        return self._body == other
+
+    def __repr__(self) -> str:
+        return f"Filter({self._body!r})"
+
+
+class Property:
+    """Builds filter conditions for one data source property.
+
+    Pick the property type with an attribute (`Property("Score").number`), then use a
+    comparison operator or a named condition:
+
+        (Property("Score").number >= 3) & Property("Stage").status.equals("Done")
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __getattr__(self, property_type: str) -> "Condition":
+        if property_type.startswith("_"):
+            raise AttributeError(property_type)
+        return Condition({"property": self.name}, property_type)
+
+
+class Condition:
+    """Operators for one typed property or timestamp filter."""
+
+    def __init__(self, target: Dict[str, Any], property_type: str) -> None:
+        self._target = target
+        self._type = property_type
+
+    def _where(self, operator: str, value: Any = True) -> Filter:
+        return Filter({**self._target, self._type: {operator: _to_json_value(value)}})
+
+    def equals(self, value: Any) -> Filter:
+        return self._where("equals", value)
+
+    def does_not_equal(self, value: Any) -> Filter:
+        return self._where("does_not_equal", value)
+
+    def contains(self, value: Any) -> Filter:
+        return self._where("contains", value)
+
+    def does_not_contain(self, value: Any) -> Filter:
+        return self._where("does_not_contain", value)
+
+    def starts_with(self, value: str) -> Filter:
+        return self._where("starts_with", value)
+
+    def ends_with(self, value: str) -> Filter:
+        return self._where("ends_with", value)
+
+    def is_empty(self) -> Filter:
+        return self._where("is_empty")
+
+    def is_not_empty(self) -> Filter:
+        return self._where("is_not_empty")
+
+    def before(self, value: Any) -> Filter:
+        return self._where("before", value)
+
+    def after(self, value: Any) -> Filter:
+        return self._where("after", value)
+
+    def on_or_before(self, value: Any) -> Filter:
+        return self._where("on_or_before", value)
+
+    def on_or_after(self, value: Any) -> Filter:
+        return self._where("on_or_after", value)
+
+    def __eq__(self, value: Any) -> Filter:  # type: ignore[override]
+        return self.equals(value)
+
+    def __ne__(self, value: Any) -> Filter:  # type: ignore[override]
+        return self.does_not_equal(value)
+
+    def __gt__(self, value: Any) -> Filter:
+        return self.after(value) if self._type in _DATE_TYPES else self._where("greater_than", value)
+
+    def __ge__(self, value: Any) -> Filter:
+        return self.on_or_after(value) if self._type in _DATE_TYPES else self._where("greater_than_or_equal_to", value)
+
+    def __lt__(self, value: Any) -> Filter:
+        return self.before(value) if self._type in _DATE_TYPES else self._where("less_than", value)
+
+    def __le__(self, value: Any) -> Filter:
+        return self.on_or_before(value) if self._type in _DATE_TYPES else self._where("less_than_or_equal_to", value)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def created_time() -> Condition:
+    """Filter on the page's built-in creation timestamp."""
+    return Condition({"timestamp": "created_time"}, "created_time")
+
+
+def last_edited_time() -> Condition:
+    """Filter on the page's built-in last edited timestamp."""
+    return Condition({"timestamp": "last_edited_time"}, "last_edited_time")
+
+
+def and_(*filters: FilterLike) -> Filter:
+    """Matches pages that satisfy every filter."""
+    return Filter({"and": [compile_filter(item) for item in filters]})
+
+
+def or_(*filters: FilterLike) -> Filter:
+    """Matches pages that satisfy at least one filter."""
+    return Filter({"or": [compile_filter(item) for item in filters]})
+
+
+@dataclass(frozen=True)
+class Sort:
+    """One entry of a data source query's `sorts` list."""
+
+    property: Optional[str] = None
+    timestamp: Optional[str] = None
+    direction: str = "ascending"
+
+    def __post_init__(self) -> None:
+        if (self.property is None) == (self.timestamp is None):
+            raise ValueError("Sort needs exactly one of property or timestamp")
+        if self.direction not in {"ascending", "descending"}:
+            raise ValueError("Sort direction must be 'ascending' or 'descending'")
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.property is not None:
+            return {"property": self.property, "direction": self.direction}
+        return {"timestamp": self.timestamp, "direction": self.direction}
+
+
+def ascending(property_name: str) -> Sort:
+    return Sort(property=property_name)
+
+
+def descending(property_name: str) -> Sort:
+    return Sort(property=property_name, direction="descending")
+
+
+def compile_filter(value: FilterLike) -> Dict[str, Any]:
+    """Returns Notion filter JSON for a `Filter` or an already-built filter dict."""
+    if isinstance(value, Filter):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return value
+    raise TypeError(f"Expected a Filter or dict, got {type(value).__name__}")
+
+
+def compile_sorts(values: Sequence[SortLike]) -> List[Dict[str, Any]]:
+    """Returns Notion sorts JSON for a list of `Sort` objects and/or sort dicts."""
+    compiled: List[Dict[str, Any]] = []
+    for value in values:
+        if isinstance(value, Sort):
+            compiled.append(value.to_dict())
+        elif isinstance(value, dict):
+            compiled.append(value)
+        else:
+            raise TypeError(f"Expected a Sort or dict, got {type(value).__name__}")
+    return compiled
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
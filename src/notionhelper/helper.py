@@ -1,19 +1,33 @@
-from typing import Optional, Dict, List, Any, Union, Iterator
+from typing import Optional, Dict, List, Any, Union, Iterable, Iterator, Callable, TypeVar
 import pandas as pd
 import os
 import requests
 import mimetypes
 import json
+import math
 import re
 import time
 import logging
+import queue
+import threading
 import warnings
 from urllib.parse import urlparse, parse_qs
-from datetime import datetime
+from datetime import date, datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import numpy as np
+from requests.adapters import HTTPAdapter
 
 from .converter_adapter import ConverterAdapter, InternalConverterAdapter, NotionBlockifyAdapter
 from .retry_policy import RetryPolicy
+from .rate_limiter import RateLimiter, TokenBucketRateLimiter
+from .dataframe_builder import ColumnarFrameBuilder
+from .record_extractor import CompiledRecordExtractor
+from .filters import FilterLike, SortLike, compile_filter, compile_sorts, last_edited_time
+from .sync import SQLiteSnapshot, SyncResult
+from .page_cache import PageCache
+from .schema_cache import SchemaCache
+from .bulk import BulkResult, RowResult
+from .key_index import KeyIndex
 from .errors import (
     NotionAPIError,
     AuthError,
@@ -29,6 +43,95 @@ LOGGER = logging.getLogger(__name__)
 
 DEFAULT_NOTION_API_VERSION = "2025-09-03"
 MARKDOWN_NOTION_API_VERSION = "2026-03-11"
+FILE_UPLOADS_URL = "https://api.notion.com/v1/file_uploads"
+# Files above this size must use Notion's multi-part upload mode.
+MULTI_PART_UPLOAD_THRESHOLD = 20 * 1024 * 1024
+DEFAULT_UPLOAD_PART_SIZE = 10 * 1024 * 1024
+# Notion's bounds for every part of a multi-part upload except the last.
+MIN_UPLOAD_PART_SIZE = 5 * 1024 * 1024
+MAX_UPLOAD_PART_SIZE = 20 * 1024 * 1024
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Property types flattened into row records / DataFrame columns.
+RECORD_PROPERTY_TYPES = frozenset(
+    {
+        "title",
+        "status",
+        "number",
+        "date",
+        "url",
+        "checkbox",
+        "rich_text",
+        "email",
+        "select",
+        "people",
+        "phone_number",
+        "multi_select",
+        "created_time",
+        "created_by",
+        "rollup",
+        "relation",
+        "last_edited_by",
+        "last_edited_time",
+        "formula",
+        "file",
+    }
+)
+# Property types encode_property_value can write.
+WRITABLE_PROPERTY_TYPES = frozenset(
+    {
+        "title",
+        "rich_text",
+        "number",
+        "checkbox",
+        "select",
+        "status",
+        "multi_select",
+        "date",
+        "url",
+        "email",
+        "phone_number",
+        "relation",
+        "people",
+    }
+)
+# Strings accepted for checkbox properties (compared lowercased and stripped).
+_CHECKBOX_STRINGS = {"true": True, "false": False, "yes": True, "no": False, "1": True, "0": False}
+# Block levels Notion accepts in one append request: the appended blocks plus two levels of children.
+_APPEND_NESTING_LEVELS = 3
+# Blocks that are invalid without their children, with the levels their smallest valid tree spans.
+# When too deep, they keep every child inline and are split further down instead.
+_APPEND_REQUIRED_CHILDREN = {"column_list": 3, "column": 2, "table": 2}
+# Maximum entries in any `children` array of an append request.
+_MAX_APPEND_CHILDREN = 100
+# Notion's request body limits: serialized size and block elements (nested blocks included).
+MAX_APPEND_PAYLOAD_BYTES = 500_000
+MAX_APPEND_BLOCK_ELEMENTS = 1000
+# Bytes reserved for the `{"children": [...], "after": "..."}` envelope around packed blocks.
+_APPEND_ENVELOPE_BYTES = 80
+# Sentinel returned by property extractors for values that produce no column.
+_SKIP = object()
+_DATE_ONLY_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Markdown block syntax, tried only on lines whose first character can start that block.
+_MD_FENCE_PATTERN = re.compile(r"^```([a-zA-Z0-9_+\- ]*)\s*$")
+_MD_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*)$")
+_MD_RULE_PATTERN = re.compile(r"^([-*_])(?:\s*\1){2,}\s*$")
+_MD_BULLET_PATTERN = re.compile(r"^[-*+]\s+(.*)$")
+_MD_ORDERED_PATTERN = re.compile(r"^\d+\.\s+(.*)$")
+_MD_TABLE_SEPARATOR_CELL_PATTERN = re.compile(r"^:?-{3,}:?$")
+# Inline markdown tokens. At a given position the first alternative wins, so one search
+# finds the same token as searching for each kind separately and taking the earliest.
+_MD_INLINE_PATTERN = re.compile(
+    r"(?P<link>\[([^\]]+)\]\((https?://[^\s)]+)\))"
+    r"|(?P<code>`([^`\n]+)`)"
+    r"|(?P<bold>\*\*(.+?)\*\*)"
+    r"|(?P<strike>~~(.+?)~~)"
+    r"|(?P<italic>(?<!\*)\*([^*\n]+)\*(?!\*))"
+)
+_MD_INLINE_ANNOTATIONS = {"bold": "bold", "strike": "strikethrough", "italic": "italic"}
+_UTC_ISO_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d{1,9}))?(?:Z|\+00:00)")
 
 
 class NotionHelper:
@@ -43,6 +146,9 @@ class NotionHelper:
     _make_request(method, url, payload=None, api_version=DEFAULT_NOTION_API_VERSION):
         Internal helper to make authenticated requests to the Notion API.
 
+    close():
+        Closes the pooled HTTP session owned by this helper.
+
     get_database(database_id):
         Retrieves the database object, which contains a list of data sources.
 
@@ -98,6 +204,16 @@ class NotionHelper:
         request_timeout: float = 30.0,
         converter_adapter: Optional[ConverterAdapter] = None,
         retry_policy: Optional[RetryPolicy] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_workers: int = 4,
+        page_cache: Optional[PageCache] = None,
+        schema_cache: Optional[SchemaCache] = None,
+        key_index: Optional[KeyIndex] = None,
     ):
         """Initializes the NotionHelper instance with the provided token.
 
@@ -109,7 +225,28 @@ class NotionHelper:
             request_timeout (float): Timeout (seconds) for HTTP requests.
             converter_adapter (ConverterAdapter, optional): Custom markdown/block conversion adapter.
             retry_policy (RetryPolicy, optional): Global retry policy; overrides retry params when provided.
+            pool_connections (int): Number of per-host connection pools kept by the HTTP session.
+            pool_maxsize (int): Maximum number of keep-alive connections per host.
+            pool_block (bool): If True, block when all pooled connections for a host are busy
+                instead of opening throwaway connections.
+            keep_alive (bool): Reuse TCP/TLS connections between requests. Set to False to send
+                `Connection: close` on every request.
+            session (requests.Session, optional): Externally managed session. The helper will not
+                close a session it did not create.
+            rate_limiter (RateLimiter, optional): Proactive limiter consulted before every request
+                attempt, e.g. `TokenBucketRateLimiter(rate=3.0, burst=3)`.
+            max_workers (int): Worker threads used for concurrent fetches such as block tree
+                hydration. Use 1 to make every request sequentially.
+            page_cache (PageCache, optional): On-disk cache for page block trees and native
+                markdown, revalidated against each page's `last_edited_time`.
+            schema_cache (SchemaCache, optional): In-process TTL cache for `get_database` and
+                `get_data_source` results, e.g. `SchemaCache(ttl=300)`.
+            key_index (KeyIndex, optional): Key property -> page ID index used by upserts,
+                e.g. `KeyIndex("keys.sqlite")` to keep it between runs. Defaults to an
+                in-memory index created on first use.
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
         self.notion_token = notion_token
         self.debug = debug
         if retry_policy is None:
@@ -156,6 +293,68 @@ class NotionHelper:
             "video",
         }
         self._converter_adapter = converter_adapter or self._build_default_converter_adapter()
+        self._owns_session = session is None
+        self._session = session if session is not None else self._build_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+        self._header_cache: Dict[tuple[str, bool], Dict[str, str]] = {}
+        self.rate_limiter = rate_limiter
+        self.max_workers = max_workers
+        self._property_extractors = self._build_property_extractors()
+        self.page_cache = page_cache
+        self.schema_cache = schema_cache
+        self.key_index = key_index
+        self._key_index_lock = threading.RLock()
+
+    def _build_session(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: bool,
+    ) -> requests.Session:
+        """Builds the pooled HTTP session used for all Notion requests."""
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be >= 1")
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self) -> None:
+        """Closes the pooled HTTP session if it is owned by this helper."""
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "NotionHelper":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+
+    def _request_headers(self, api_version: str, json_body: bool = True) -> Dict[str, str]:
+        """Returns cached auth headers for an API version and body type."""
+        cache_key = (api_version, json_body)
+        headers = self._header_cache.get(cache_key)
+        if headers is None:
+            headers = {
+                "Authorization": f"Bearer {self.notion_token}",
+                "Notion-Version": api_version,
+            }
+            if json_body:
+                headers["Content-Type"] = "application/json"
+            self._header_cache[cache_key] = headers
+        return headers
 
     def set_retry_policy(self, retry_policy: RetryPolicy) -> None:
         """Overrides the active retry policy."""
@@ -164,11 +363,47 @@ class NotionHelper:
         self.retry_base_delay = self.retry_policy.base_delay
         self.request_timeout = self.retry_policy.timeout
 
+    def set_rate_limiter(self, rate_limiter: Optional[RateLimiter]) -> None:
+        """Sets (or clears, with None) the proactive request rate limiter."""
+        self.rate_limiter = rate_limiter
+
+    def set_page_cache(self, page_cache: Optional[PageCache]) -> None:
+        """Sets (or clears with None) the on-disk page content cache."""
+        self.page_cache = page_cache
+
+    def set_schema_cache(self, schema_cache: Optional[SchemaCache]) -> None:
+        """Sets (or clears with None) the in-process database/data source schema cache."""
+        self.schema_cache = schema_cache
+
+    def set_key_index(self, key_index: Optional[KeyIndex]) -> None:
+        """Sets the upsert key index; with None a fresh in-memory index is created on next use."""
+        self.key_index = key_index
+
+    def invalidate_schema_cache(
+        self,
+        data_source_id: Optional[str] = None,
+        database_id: Optional[str] = None,
+    ) -> None:
+        """Drops cached schemas; with no arguments the whole cache is cleared."""
+        if self.schema_cache is None:
+            return
+        if data_source_id is None and database_id is None:
+            self.schema_cache.invalidate()
+            return
+        if data_source_id is not None:
+            self.schema_cache.invalidate(self._schema_cache_key("data_source", data_source_id))
+        if database_id is not None:
+            self.schema_cache.invalidate(self._schema_cache_key("database", database_id))
+
+    def _schema_cache_key(self, kind: str, object_id: str) -> tuple[str, str]:
+        return kind, self._normalize_notion_id(object_id) or object_id
+
     def _build_default_converter_adapter(self) -> ConverterAdapter:
         """Builds the default conversion adapter stack."""
         fallback = InternalConverterAdapter(
             markdown_to_blocks_fn=self._internal_markdown_to_blocks,
             blocks_to_markdown_fn=self._blocks_to_markdown,
+            iter_markdown_blocks_fn=self._iter_markdown_blocks,
         )
         return NotionBlockifyAdapter(fallback=fallback)
 
@@ -206,7 +441,7 @@ class NotionHelper:
             stripped = value.strip()
             if not stripped:
                 return ""
-            if re.fullmatch(r"\d{4}-\d{2}-\d{2}", stripped):
+            if _DATE_ONLY_PATTERN.fullmatch(stripped):
                 return stripped
         parsed = self.parse_datetime_utc(value, utc=utc)
         if parsed is None:
@@ -216,6 +451,104 @@ class NotionHelper:
             iso_value = iso_value.replace("+00:00", "Z")
         return iso_value
 
+    def parse_datetime_utc_batch(self, values: List[Any], utc: bool = True) -> List[Optional[pd.Timestamp]]:
+        """Parses many datetime-like values with one vectorized `pd.to_datetime` call.
+
+        Returns one Timestamp (or None) per input, matching `parse_datetime_utc`.
+        Values the ISO 8601 parser rejects fall back to the scalar path.
+        """
+        results: List[Optional[pd.Timestamp]] = [None] * len(values)
+        pending_idx: List[int] = []
+        pending_values: List[str] = []
+        for idx, value in enumerate(values):
+            if value is None:
+                continue
+            if isinstance(value, str):
+                stripped = value.strip()
+                if stripped:
+                    pending_idx.append(idx)
+                    pending_values.append(stripped)
+            else:
+                results[idx] = self.parse_datetime_utc(value, utc=utc)
+
+        parsed = self._to_datetime_iso8601(pending_values, utc=utc)
+        for pos, idx in enumerate(pending_idx):
+            timestamp = parsed[pos] if parsed is not None else pd.NaT
+            if pd.isna(timestamp):
+                results[idx] = self.parse_datetime_utc(pending_values[pos], utc=utc)
+            else:
+                results[idx] = timestamp
+        return results
+
+    def normalize_datetime_iso_batch(self, values: List[Any], utc: bool = True) -> List[str]:
+        """Batched `normalize_datetime_iso`; returns one ISO 8601 string per input.
+
+        Date-only strings and UTC timestamps already in `...Z` / `...+00:00` form are
+        rewritten without parsing. Everything else is parsed in one vectorized call.
+        """
+        results: List[str] = [""] * len(values)
+        pending_idx: List[int] = []
+        pending_values: List[str] = []
+        for idx, value in enumerate(values):
+            if value is None:
+                continue
+            if not isinstance(value, str):
+                results[idx] = self.normalize_datetime_iso(value, utc=utc)
+                continue
+            stripped = value.strip()
+            if not stripped:
+                continue
+            if _DATE_ONLY_PATTERN.fullmatch(stripped):
+                results[idx] = stripped
+                continue
+            if utc:
+                match = _UTC_ISO_PATTERN.fullmatch(stripped)
+                formatted = self._format_utc_iso_match(match) if match else None
+                if formatted is not None:
+                    results[idx] = formatted
+                    continue
+            pending_idx.append(idx)
+            pending_values.append(stripped)
+
+        parsed = self._to_datetime_iso8601(pending_values, utc=utc)
+        for pos, idx in enumerate(pending_idx):
+            timestamp = parsed[pos] if parsed is not None else pd.NaT
+            if pd.isna(timestamp):
+                results[idx] = self.normalize_datetime_iso(pending_values[pos], utc=utc)
+                continue
+            iso_value = timestamp.isoformat()
+            results[idx] = iso_value.replace("+00:00", "Z") if utc else iso_value
+        return results
+
+    def _to_datetime_iso8601(self, values: List[str], utc: bool = True) -> Optional[pd.DatetimeIndex]:
+        """Vectorized ISO 8601 parse; None when the batch cannot be parsed as a whole."""
+        if not values:
+            return None
+        try:
+            parsed = pd.to_datetime(values, utc=utc, errors="coerce", format="ISO8601")
+        except (ValueError, TypeError):
+            # Mixed UTC offsets without utc=True cannot share one index.
+            return None
+        return parsed if isinstance(parsed, pd.DatetimeIndex) else None
+
+    def _format_utc_iso_match(self, match: "re.Match[str]") -> Optional[str]:
+        """Renders a `_UTC_ISO_PATTERN` match exactly like `Timestamp.isoformat()` + Z.
+
+        Returns None when the date or time is out of range (e.g. month 13 or February 30),
+        so the caller falls back to full parsing.
+        """
+        base, fraction = match.group(1), match.group(2)
+        try:
+            datetime.fromisoformat(base)
+        except ValueError:
+            return None
+        if not fraction or not fraction.strip("0"):
+            return f"{base}Z"
+        fraction = fraction.ljust(9, "0")
+        if fraction.endswith("000"):
+            fraction = fraction[:6]
+        return f"{base}.{fraction}Z"
+
     def normalize_notion_date(self, date_value: Optional[Dict[str, Any]], utc: bool = True) -> Dict[str, Any]:
         """Normalizes a Notion date object (`start`, `end`, `time_zone`) to ISO 8601."""
         if not isinstance(date_value, dict):
@@ -295,6 +628,9 @@ class NotionHelper:
         """Splits text into chunks that each fit Notion's UTF-16 length limit."""
         if not value:
             return [""]
+        # Every code point is one or two UTF-16 units, so most strings need no counting.
+        if len(value) * 2 <= max_utf16_units or self._utf16_units(value) <= max_utf16_units:
+            return [value]
 
         chunks = []
         current_chars: List[str] = []
@@ -480,109 +816,76 @@ class NotionHelper:
         if isinstance(inherited_annotations, dict):
             annotations.update(inherited_annotations)
 
-        token_patterns = [
-            ("link", re.compile(r"\[([^\]]+)\]\((https?://[^\s)]+)\)")),
-            ("code", re.compile(r"`([^`\n]+)`")),
-            ("bold", re.compile(r"\*\*(.+?)\*\*")),
-            ("strike", re.compile(r"~~(.+?)~~")),
-            ("italic", re.compile(r"(?<!\*)\*([^*\n]+)\*(?!\*)")),
-        ]
-
-        earliest_match = None
-        earliest_kind = None
-        for kind, pattern in token_patterns:
-            match = pattern.search(value)
-            if not match:
-                continue
-            if earliest_match is None or match.start() < earliest_match.start():
-                earliest_match = match
-                earliest_kind = kind
-
-        if earliest_match is None or earliest_kind is None:
-            return [{"text": value, "annotations": annotations, "href": inherited_href}]
-
         segments: List[Dict[str, Any]] = []
-        prefix = value[:earliest_match.start()]
-        if prefix:
-            segments.append({"text": prefix, "annotations": annotations.copy(), "href": inherited_href})
-
-        token_inner = earliest_match.group(1)
-        token_href = inherited_href
-        nested_annotations = annotations.copy()
-
-        if earliest_kind == "link":
-            token_href = earliest_match.group(2)
-        elif earliest_kind == "code":
-            nested_annotations["code"] = True
-            segments.append({"text": token_inner, "annotations": nested_annotations, "href": token_href})
-            suffix = value[earliest_match.end():]
-            if suffix:
+        while value:
+            match = _MD_INLINE_PATTERN.search(value)
+            if match is None:
+                segments.append({"text": value, "annotations": annotations.copy(), "href": inherited_href})
+                break
+
+            prefix = value[:match.start()]
+            if prefix:
+                segments.append({"text": prefix, "annotations": annotations.copy(), "href": inherited_href})
+
+            kind = match.lastgroup
+            # The token's own groups follow its named group: inner text, then the link URL.
+            token_group = _MD_INLINE_PATTERN.groupindex[kind]
+            token_inner = match.group(token_group + 1)
+            token_href = inherited_href
+            nested_annotations = annotations.copy()
+            if kind == "code":
+                nested_annotations["code"] = True
+                segments.append({"text": token_inner, "annotations": nested_annotations, "href": token_href})
+            else:
+                if kind == "link":
+                    token_href = match.group(token_group + 2)
+                else:
+                    nested_annotations[_MD_INLINE_ANNOTATIONS[kind]] = True
                 segments.extend(
                     self._parse_inline_markdown_segments(
-                        suffix,
-                        inherited_annotations=annotations,
-                        inherited_href=inherited_href,
+                        token_inner,
+                        inherited_annotations=nested_annotations,
+                        inherited_href=token_href,
                         depth=depth + 1,
                     )
                 )
-            return segments
-        elif earliest_kind == "bold":
-            nested_annotations["bold"] = True
-        elif earliest_kind == "strike":
-            nested_annotations["strikethrough"] = True
-        elif earliest_kind == "italic":
-            nested_annotations["italic"] = True
-
-        segments.extend(
-            self._parse_inline_markdown_segments(
-                token_inner,
-                inherited_annotations=nested_annotations,
-                inherited_href=token_href,
-                depth=depth + 1,
-            )
-        )
-
-        suffix = value[earliest_match.end():]
-        if suffix:
-            segments.extend(
-                self._parse_inline_markdown_segments(
-                    suffix,
-                    inherited_annotations=annotations,
-                    inherited_href=inherited_href,
-                    depth=depth + 1,
-                )
-            )
+            # Continue after the token at the same depth: only nesting counts towards the limit.
+            value = value[match.end():]
         return segments
 
     def _markdown_inline_to_rich_text(self, value: str) -> List[Dict[str, Any]]:
         """Converts inline markdown (bold/italic/strike/code/links) to Notion rich_text."""
-        segments = self._parse_inline_markdown_segments(value)
-        rich_text_items: List[Dict[str, Any]] = []
-        for segment in segments:
-            text = segment.get("text", "")
+        # Segments already carry complete annotations, so only chunking is left to do.
+        rich_text: List[Dict[str, Any]] = []
+        for segment in self._parse_inline_markdown_segments(value):
+            text = segment["text"]
             if not text:
                 continue
-            text_payload: Dict[str, Any] = {"content": text}
-            href = segment.get("href")
-            if isinstance(href, str) and href:
-                text_payload["link"] = {"url": href}
-            rich_text_items.append(
-                {
-                    "type": "text",
-                    "text": text_payload,
-                    "annotations": segment.get("annotations", {}),
-                }
-            )
-        return self._normalize_rich_text(rich_text_items)
+            href = segment["href"]
+            for chunk in self._chunk_text(text, 2000):
+                text_payload: Dict[str, Any] = {"content": chunk}
+                if isinstance(href, str) and href:
+                    text_payload["link"] = {"url": href}
+                rich_text.append({"type": "text", "text": text_payload, "annotations": segment["annotations"].copy()})
+        return rich_text
 
     def _parse_markdown_table(self, lines: List[str], start_idx: int) -> Optional[tuple[Dict[str, Any], int]]:
         """Parses a simple markdown table starting at start_idx."""
         first = lines[start_idx].strip()
-        if "|" not in first:
+        if "|" not in first or start_idx + 1 >= len(lines):
             return None
 
-        table_lines: List[str] = []
-        idx = start_idx
+        # Check the separator row before collecting rows, so a paragraph line with a pipe
+        # costs one lookahead instead of a scan to the end of the paragraph.
+        sep_line = lines[start_idx + 1].strip()
+        if "|" not in sep_line:
+            return None
+        sep_cells = [cell.strip() for cell in sep_line.strip("|").split("|")]
+        if not all(_MD_TABLE_SEPARATOR_CELL_PATTERN.match(cell) for cell in sep_cells):
+            return None
+
+        table_lines: List[str] = [first, sep_line]
+        idx = start_idx + 2
         while idx < len(lines):
             candidate = lines[idx].strip()
             if not candidate or "|" not in candidate:
@@ -590,14 +893,6 @@ class NotionHelper:
             table_lines.append(candidate)
             idx += 1
 
-        if len(table_lines) < 2:
-            return None
-
-        sep_line = table_lines[1].strip()
-        sep_cells = [cell.strip() for cell in sep_line.strip("|").split("|")]
-        if not sep_cells or not all(re.match(r"^:?-{3,}:?$", cell) for cell in sep_cells):
-            return None
-
         header_cells = [cell.strip() for cell in table_lines[0].strip("|").split("|")]
         col_count = len(header_cells)
         if col_count == 0:
@@ -645,158 +940,109 @@ class NotionHelper:
 
     def _internal_markdown_to_blocks(self, markdown: str) -> List[Dict[str, Any]]:
         """Internal markdown parser for critical block types."""
+        return list(self._iter_markdown_blocks(markdown))
+
+    def _iter_markdown_to_blocks(self, markdown: str) -> Iterator[Dict[str, Any]]:
+        """Yields markdown blocks from the configured adapter, lazily when it supports that."""
+        iter_blocks = getattr(self._converter_adapter, "iter_markdown_blocks", None)
+        if callable(iter_blocks):
+            return iter(iter_blocks(markdown))
+        return iter(self._markdown_to_blocks(markdown))
+
+    def _iter_markdown_blocks(self, markdown: str) -> Iterator[Dict[str, Any]]:
+        """Yields blocks for the internal markdown parser in one pass over the lines.
+
+        Each line is classified by its first non-blank character, and only the block
+        patterns that can start with that character are tried. Blocks are yielded as soon
+        as they are complete, so callers can send the first ones while the rest is parsed.
+        """
         lines = markdown.splitlines()
-        blocks: List[Dict[str, Any]] = []
         paragraph_lines: List[str] = []
 
-        def flush_paragraph() -> None:
-            if not paragraph_lines:
-                return
+        def paragraph() -> Optional[Dict[str, Any]]:
             text = " ".join(part.strip() for part in paragraph_lines if part.strip()).strip()
             paragraph_lines.clear()
             if not text:
-                return
-            blocks.append(
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {"rich_text": self._markdown_inline_to_rich_text(text)},
-                }
-            )
+                return None
+            return {
+                "object": "block",
+                "type": "paragraph",
+                "paragraph": {"rich_text": self._markdown_inline_to_rich_text(text)},
+            }
+
+        def text_block(block_type: str, text: str) -> Dict[str, Any]:
+            return {
+                "object": "block",
+                "type": block_type,
+                block_type: {"rich_text": self._markdown_inline_to_rich_text(text)},
+            }
 
-        in_code_fence = False
-        code_language = "plain text"
-        code_lines: List[str] = []
+        def code_block(language: str, code_lines: List[str]) -> Dict[str, Any]:
+            return {
+                "object": "block",
+                "type": "code",
+                "code": {"language": language, "rich_text": self._plain_text_rich_text("\n".join(code_lines))},
+            }
 
+        line_count = len(lines)
         line_idx = 0
-        while line_idx < len(lines):
+        while line_idx < line_count:
             line = lines[line_idx]
             stripped = line.strip()
-
-            if in_code_fence:
-                if stripped.startswith("```"):
-                    blocks.append(
-                        {
-                            "object": "block",
-                            "type": "code",
-                            "code": {
-                                "language": code_language,
-                                "rich_text": self._plain_text_rich_text("\n".join(code_lines)),
-                            },
-                        }
-                    )
-                    in_code_fence = False
-                    code_language = "plain text"
-                    code_lines = []
-                else:
-                    code_lines.append(line.rstrip("\n"))
-                line_idx += 1
-                continue
-
-            fence_match = re.match(r"^```([a-zA-Z0-9_+\- ]*)\s*$", stripped)
-            if fence_match:
-                flush_paragraph()
-                in_code_fence = True
-                parsed_language = fence_match.group(1).strip()
-                code_language = parsed_language if parsed_language else "plain text"
-                code_lines = []
-                line_idx += 1
-                continue
+            line_idx += 1
 
             if not stripped:
-                flush_paragraph()
-                line_idx += 1
-                continue
-
-            heading_match = re.match(r"^(#{1,6})\s+(.*)$", stripped)
-            if heading_match:
-                flush_paragraph()
-                level = min(len(heading_match.group(1)), 3)
-                text = heading_match.group(2).strip()
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": f"heading_{level}",
-                        f"heading_{level}": {"rich_text": self._markdown_inline_to_rich_text(text)},
-                    }
-                )
-                line_idx += 1
-                continue
-
-            if re.match(r"^([-*_])(?:\s*\1){2,}\s*$", stripped):
-                flush_paragraph()
-                blocks.append({"object": "block", "type": "divider", "divider": {}})
-                line_idx += 1
-                continue
-
-            quote_match = re.match(r"^>\s?(.*)$", stripped)
-            if quote_match:
-                flush_paragraph()
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "quote",
-                        "quote": {"rich_text": self._markdown_inline_to_rich_text(quote_match.group(1).strip())},
-                    }
-                )
-                line_idx += 1
-                continue
-
-            unordered_match = re.match(r"^[-*+]\s+(.*)$", stripped)
-            if unordered_match:
-                flush_paragraph()
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "bulleted_list_item",
-                        "bulleted_list_item": {
-                            "rich_text": self._markdown_inline_to_rich_text(unordered_match.group(1).strip())
-                        },
-                    }
-                )
-                line_idx += 1
-                continue
-
-            ordered_match = re.match(r"^\d+\.\s+(.*)$", stripped)
-            if ordered_match:
-                flush_paragraph()
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "numbered_list_item",
-                        "numbered_list_item": {
-                            "rich_text": self._markdown_inline_to_rich_text(ordered_match.group(1).strip())
-                        },
-                    }
-                )
-                line_idx += 1
+                if paragraph_lines and (block := paragraph()):
+                    yield block
                 continue
 
-            table_parse = self._parse_markdown_table(lines, line_idx)
-            if table_parse:
-                flush_paragraph()
-                table_block, next_idx = table_parse
-                blocks.append(table_block)
-                line_idx = next_idx
+            first = stripped[0]
+            block: Optional[Dict[str, Any]] = None
+            if first == "`":
+                fence_match = _MD_FENCE_PATTERN.match(stripped)
+                if fence_match:
+                    if paragraph_lines and (pending := paragraph()):
+                        yield pending
+                    code_lines: List[str] = []
+                    while line_idx < line_count and not lines[line_idx].strip().startswith("```"):
+                        code_lines.append(lines[line_idx])
+                        line_idx += 1
+                    line_idx += 1  # Closing fence (or end of input).
+                    yield code_block(fence_match.group(1).strip() or "plain text", code_lines)
+                    continue
+            elif first == "#":
+                heading_match = _MD_HEADING_PATTERN.match(stripped)
+                if heading_match:
+                    level = min(len(heading_match.group(1)), 3)
+                    block = text_block(f"heading_{level}", heading_match.group(2).strip())
+            elif first in "-*_+":
+                if first != "+" and _MD_RULE_PATTERN.match(stripped):
+                    block = {"object": "block", "type": "divider", "divider": {}}
+                elif first != "_":
+                    bullet_match = _MD_BULLET_PATTERN.match(stripped)
+                    if bullet_match:
+                        block = text_block("bulleted_list_item", bullet_match.group(1).strip())
+            elif first == ">":
+                block = text_block("quote", stripped[1:].strip())
+            elif first.isdigit():
+                ordered_match = _MD_ORDERED_PATTERN.match(stripped)
+                if ordered_match:
+                    block = text_block("numbered_list_item", ordered_match.group(1).strip())
+
+            if block is None and "|" in stripped:
+                table_parse = self._parse_markdown_table(lines, line_idx - 1)
+                if table_parse:
+                    block, line_idx = table_parse
+
+            if block is None:
+                paragraph_lines.append(line)
                 continue
+            if paragraph_lines and (pending := paragraph()):
+                yield pending
+            yield block
 
-            paragraph_lines.append(line)
-            line_idx += 1
-
-        if in_code_fence:
-            blocks.append(
-                {
-                    "object": "block",
-                    "type": "code",
-                    "code": {
-                        "language": code_language,
-                        "rich_text": self._plain_text_rich_text("\n".join(code_lines)),
-                    },
-                }
-            )
-
-        flush_paragraph()
-        return blocks
+        if paragraph_lines and (block := paragraph()):
+            yield block
 
     def _make_request(
         self,
@@ -807,17 +1053,16 @@ class NotionHelper:
         params: Optional[Dict[str, Any]] = None,
         retry_policy: Optional[RetryPolicy] = None,
         request_timeout: Optional[float] = None,
+        files: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Internal helper to make authenticated requests to the Notion API.
         Handles headers, JSON serialization, retries/backoff, and structured error reporting.
+        When `files` is provided, the body is sent as multipart/form-data with `payload`
+        as plain form fields.
         """
         effective_policy = self._build_retry_policy(retry_policy, request_timeout)
-        headers = {
-            "Authorization": f"Bearer {self.notion_token}",
-            "Content-Type": "application/json",
-            "Notion-Version": api_version,
-        }
+        headers = self._request_headers(api_version, json_body=files is None)
         request_method = method.upper()
         if request_method not in {"GET", "POST", "PATCH"}:
             raise ValueError(f"Unsupported HTTP method: {method}")
@@ -834,23 +1079,35 @@ class NotionHelper:
 
         for attempt in range(effective_policy.max_retries + 1):
             response = None
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
             try:
                 if request_method == "GET":
-                    response = requests.get(
+                    response = self._session.get(
                         url,
                         headers=headers,
                         params=params,
                         timeout=effective_policy.timeout,
                     )
+                elif request_method == "POST" and files is not None:
+                    self._rewind_files(files)
+                    response = self._session.post(
+                        url,
+                        headers=headers,
+                        data=payload,
+                        files=files,
+                        timeout=effective_policy.timeout,
+                    )
                 elif request_method == "POST":
-                    response = requests.post(
+                    response = self._session.post(
                         url,
                         headers=headers,
+                        params=params,
                         data=json.dumps(payload),
                         timeout=effective_policy.timeout,
                     )
                 else:
-                    response = requests.patch(
+                    response = self._session.patch(
                         url,
                         headers=headers,
                         data=json.dumps(payload),
@@ -858,14 +1115,7 @@ class NotionHelper:
                     )
 
                 if response.status_code in effective_policy.retry_statuses and attempt < effective_policy.max_retries:
-                    retry_after = response.headers.get("Retry-After") if response.headers else None
-                    retry_after_value: Optional[float] = None
-                    if retry_after:
-                        try:
-                            retry_after_value = float(retry_after)
-                        except ValueError:
-                            retry_after_value = None
-                    delay = effective_policy.compute_delay(attempt, retry_after=retry_after_value)
+                    delay = effective_policy.compute_delay(attempt, retry_after=self._retry_after_seconds(response))
                     LOGGER.warning(
                         "Transient Notion error status=%s on %s %s. Retrying in %.2fs (attempt %s/%s).",
                         response.status_code,
@@ -946,6 +1196,23 @@ class NotionHelper:
 
         raise RuntimeError("Request retry loop exited unexpectedly")
 
+    def _retry_after_seconds(self, response: Any) -> Optional[float]:
+        """Parses the Retry-After header of a response, if present."""
+        retry_after = response.headers.get("Retry-After") if response.headers else None
+        if not retry_after:
+            return None
+        try:
+            return float(retry_after)
+        except ValueError:
+            return None
+
+    def _rewind_files(self, files: Dict[str, Any]) -> None:
+        """Seeks multipart file objects back to the start so retries resend the full body."""
+        for value in files.values():
+            file_obj = value[1] if isinstance(value, tuple) and len(value) > 1 else value
+            if hasattr(file_obj, "seek"):
+                file_obj.seek(0)
+
     def _build_retry_policy(
         self,
         retry_policy: Optional[RetryPolicy] = None,
@@ -1031,7 +1298,7 @@ class NotionHelper:
                 json.dumps(payload["children"][bad_index], indent=2),
             )
 
-    def get_database(self, database_id: str) -> Dict[str, Any]:
+    def get_database(self, database_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """Retrieves the schema of a Notion database given its database_id.
         With API version 2025-09-03, this now returns the database object
         which contains a list of data sources. To get the actual schema (properties),
@@ -1041,6 +1308,8 @@ class NotionHelper:
         ----------
         database_id : str
             The unique identifier of the Notion database.
+        use_cache : bool
+            Serve from the schema cache when one is configured. Defaults to True.
 
         Returns
         -------
@@ -1048,9 +1317,14 @@ class NotionHelper:
             A dictionary representing the database object, including its data sources.
         """
         url = f"https://api.notion.com/v1/databases/{database_id}"
-        return self._make_request("GET", url)
+        if self.schema_cache is None or not use_cache:
+            return self._make_request("GET", url)
+        return self.schema_cache.get_or_load(
+            self._schema_cache_key("database", database_id),
+            lambda: self._make_request("GET", url),
+        )
 
-    def get_data_source(self, data_source_id: str) -> Dict[str, Any]:
+    def get_data_source(self, data_source_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """Retrieves a specific data source given its data_source_id.
         This is used to get the schema (properties) of a data source.
 
@@ -1058,6 +1332,8 @@ class NotionHelper:
         ----------
         data_source_id : str
             The unique identifier of the Notion data source.
+        use_cache : bool
+            Serve from the schema cache when one is configured. Defaults to True.
 
         Returns
         -------
@@ -1065,7 +1341,12 @@ class NotionHelper:
             A dictionary representing the data source object, including its properties.
         """
         url = f"https://api.notion.com/v1/data_sources/{data_source_id}"
-        return self._make_request("GET", url)
+        if self.schema_cache is None or not use_cache:
+            return self._make_request("GET", url)
+        return self.schema_cache.get_or_load(
+            self._schema_cache_key("data_source", data_source_id),
+            lambda: self._make_request("GET", url),
+        )
 
     def notion_search_db(self, query: str = "", filter_object_type: str = "page") -> List[Dict[str, Any]]:
         """Searches for pages or data sources in Notion.
@@ -1255,19 +1536,65 @@ class NotionHelper:
 
         Returns:
             dict: Native page_markdown response containing markdown, truncation info, and unknown block IDs.
+
+        With a page cache configured, one page GET revalidates the cached response.
+        Responses containing synced blocks are not cached, because edits to a synced
+        block's original do not change this page's `last_edited_time`.
         """
+        last_edited_time = self._page_last_edited_time(page_id) if self.page_cache is not None else None
+        return self._get_page_markdown(page_id, include_transcript, last_edited_time)
+
+    def _get_page_markdown(
+        self,
+        page_id: str,
+        include_transcript: bool,
+        last_edited_time: Optional[str],
+    ) -> Dict[str, Any]:
         url = f"https://api.notion.com/v1/pages/{page_id}/markdown"
         params = {"include_transcript": True} if include_transcript else None
-        return self._make_request(
-            "GET",
-            url,
-            api_version=MARKDOWN_NOTION_API_VERSION,
-            params=params,
+        return self._cached_page_content(
+            page_id,
+            "markdown_transcript" if include_transcript else "markdown",
+            last_edited_time,
+            lambda: self._make_request(
+                "GET",
+                url,
+                api_version=MARKDOWN_NOTION_API_VERSION,
+                params=params,
+            ),
+            cacheable=lambda response: "<synced_block" not in str(response.get("markdown", "")),
         )
 
-    def update_page_markdown(
+    def _page_last_edited_time(self, page_id: str) -> Optional[str]:
+        """Fetches a page's `last_edited_time` for cache revalidation."""
+        page = self._make_request("GET", f"https://api.notion.com/v1/pages/{page_id}")
+        last_edited_time = page.get("last_edited_time") if isinstance(page, dict) else None
+        return last_edited_time if isinstance(last_edited_time, str) else None
+
+    def _cached_page_content(
         self,
         page_id: str,
+        kind: str,
+        last_edited_time: Optional[str],
+        load: Callable[[], _T],
+        cacheable: Optional[Callable[[_T], bool]] = None,
+    ) -> _T:
+        """Serves `kind` content for a page from the page cache, loading and storing it on a miss.
+
+        Loaded values for which `cacheable` returns False are returned without being stored.
+        """
+        if self.page_cache is None or not last_edited_time:
+            return load()
+        cached = self.page_cache.get(page_id, kind, last_edited_time)
+        if cached is not None:
+            return cached
+        value = load()
+        if cacheable is None or cacheable(value):
+            self.page_cache.put(page_id, kind, last_edited_time, value)
+        return value
+
+    def _build_markdown_update_payload(
+        self,
         command: str,
         *,
         content_updates: Optional[List[Dict[str, Any]]] = None,
@@ -1277,11 +1604,7 @@ class NotionHelper:
         content_range: Optional[str] = None,
         allow_deleting_content: bool = False,
     ) -> Dict[str, Any]:
-        """Updates page content using Notion's native markdown update endpoint.
-
-        Supported commands are `update_content`, `replace_content`, `insert_content`,
-        and `replace_content_range`.
-        """
+        """Builds and validates the request body for the markdown update endpoint."""
         command = command.strip()
         payload: Dict[str, Any] = {"type": command}
 
@@ -1322,7 +1645,34 @@ class NotionHelper:
                 "command must be one of: update_content, replace_content, "
                 "insert_content, replace_content_range"
             )
+        return payload
+
+    def update_page_markdown(
+        self,
+        page_id: str,
+        command: str,
+        *,
+        content_updates: Optional[List[Dict[str, Any]]] = None,
+        new_str: Optional[str] = None,
+        content: Optional[str] = None,
+        after: Optional[str] = None,
+        content_range: Optional[str] = None,
+        allow_deleting_content: bool = False,
+    ) -> Dict[str, Any]:
+        """Updates page content using Notion's native markdown update endpoint.
 
+        Supported commands are `update_content`, `replace_content`, `insert_content`,
+        and `replace_content_range`.
+        """
+        payload = self._build_markdown_update_payload(
+            command,
+            content_updates=content_updates,
+            new_str=new_str,
+            content=content,
+            after=after,
+            content_range=content_range,
+            allow_deleting_content=allow_deleting_content,
+        )
         url = f"https://api.notion.com/v1/pages/{page_id}/markdown"
         return self._make_request(
             "PATCH",
@@ -1335,9 +1685,58 @@ class NotionHelper:
         self,
         page_id: str,
         prefetched_blocks_page: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+        last_edited_time: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Retrieves all child blocks for a page/block and hydrates nested children.
+
+        With a page cache configured, the tree is served from the cache while the page's
+        `last_edited_time` is unchanged. Subtrees of nested child pages, databases and
+        synced blocks are always re-fetched, since edits inside them (or to a synced
+        block's original elsewhere) do not touch the parent's timestamp.
+        """
+        if self.page_cache is None or prefetched_blocks_page is not None:
+            content_blocks = self._list_block_children(page_id, prefetched_blocks_page=prefetched_blocks_page)
+            return self._hydrate_block_children(content_blocks, max_workers=max_workers)
+
+        if last_edited_time is None:
+            last_edited_time = self._page_last_edited_time(page_id)
+        fetched = False
+
+        def load() -> List[Dict[str, Any]]:
+            nonlocal fetched
+            fetched = True
+            content_blocks = self._list_block_children(page_id)
+            return self._hydrate_block_children(content_blocks, max_workers=max_workers)
+
+        content_blocks = self._cached_page_content(page_id, "blocks", last_edited_time, load)
+        if not fetched:
+            volatile = list(self._iter_volatile_blocks(content_blocks))
+            if volatile:
+                self._hydrate_block_children(volatile, max_workers=max_workers)
+        return content_blocks
+
+    def _iter_volatile_blocks(self, blocks: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yields child_page/child_database/synced_block blocks with children, without descending into them."""
+        for block in blocks:
+            if not isinstance(block, dict):
+                continue
+            block_type = block.get("type")
+            if block_type in ("child_page", "child_database", "synced_block"):
+                if block.get("has_children"):
+                    yield block
+                continue
+            block_payload = block.get(block_type, {}) if isinstance(block_type, str) else {}
+            if isinstance(block_payload, dict) and isinstance(block_payload.get("children"), list):
+                yield from self._iter_volatile_blocks(block_payload["children"])
+
+    def _list_block_children(
+        self,
+        block_id: str,
+        prefetched_blocks_page: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        """Retrieves all child blocks for a page/block and hydrates nested children."""
-        blocks_url = f"https://api.notion.com/v1/blocks/{page_id}/children"
+        """Retrieves the direct children of a page/block, following pagination cursors."""
+        blocks_url = f"https://api.notion.com/v1/blocks/{block_id}/children"
         content_blocks: List[Dict[str, Any]] = []
         next_cursor = None if prefetched_blocks_page is None else prefetched_blocks_page.get("next_cursor")
         first_iteration = True
@@ -1356,27 +1755,81 @@ class NotionHelper:
             next_cursor = blocks.get("next_cursor")
             if not next_cursor:
                 break
+        return content_blocks
 
-        return self._hydrate_block_children(content_blocks)
+    def _hydrate_block_children(
+        self,
+        blocks: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Hydrates nested block children for blocks that support block children.
 
-    def _hydrate_block_children(self, blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Hydrates nested block children for blocks that support block children."""
-        hydrated: List[Dict[str, Any]] = []
-        for block in blocks:
-            if not isinstance(block, dict):
-                continue
-            if block.get("has_children") and block.get("id"):
-                block_id = block["id"]
-                children = self._get_page_blocks(block_id)
+        The tree is walked level by level: every `has_children` block at a given depth is
+        fetched in parallel, bounded by `max_workers`, before descending to the next depth.
+        """
+        hydrated = [block for block in blocks if isinstance(block, dict)]
+        level = hydrated
+        while level:
+            parents = [block for block in level if block.get("has_children") and block.get("id")]
+            children_lists = self._map_concurrently(
+                lambda block: self._list_block_children(block["id"]),
+                parents,
+                max_workers=max_workers,
+            )
+            next_level: List[Dict[str, Any]] = []
+            for block, children in zip(parents, children_lists):
+                children = [child for child in children if isinstance(child, dict)]
                 block_type = block.get("type")
                 if isinstance(block_type, str):
                     block_payload = block.get(block_type, {})
                     if isinstance(block_payload, dict):
                         block_payload["children"] = children
                         block[block_type] = block_payload
-            hydrated.append(block)
+                next_level.extend(children)
+            level = next_level
         return hydrated
 
+    def _map_concurrently(
+        self,
+        fn: Callable[[_T], _R],
+        items: List[_T],
+        max_workers: Optional[int] = None,
+    ) -> List[_R]:
+        """Applies fn to items on a bounded thread pool, preserving input order."""
+        workers = min(max_workers or self.max_workers, len(items))
+        if workers <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, items))
+
+    def _imap_bounded(
+        self,
+        fn: Callable[[_T], _R],
+        items: Iterable[_T],
+        max_workers: Optional[int] = None,
+    ) -> Iterator[_R]:
+        """Applies fn to a lazy stream of items on a bounded pool, yielding results as they complete.
+
+        At most `2 * max_workers` items are in flight, so `items` is consumed incrementally.
+        """
+        workers = max(1, max_workers or self.max_workers)
+        if workers == 1:
+            for item in items:
+                yield fn(item)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: set = set()
+            for item in items:
+                pending.add(executor.submit(fn, item))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
     def _expand_child_pages(
         self,
         blocks: List[Dict[str, Any]],
@@ -1387,6 +1840,7 @@ class NotionHelper:
         max_child_page_depth: int,
         child_page_depth: int,
         visited_page_ids: set[str],
+        max_workers: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Fetches child_page blocks with get_page and embeds their page payload."""
         expanded: List[Dict[str, Any]] = []
@@ -1411,6 +1865,7 @@ class NotionHelper:
                         include_transcript=include_transcript,
                         expand_child_pages=True,
                         max_child_page_depth=max_child_page_depth,
+                        max_workers=max_workers,
                         _child_page_depth=child_page_depth + 1,
                         _visited_page_ids=visited_page_ids | {child_page_id},
                     )
@@ -1426,6 +1881,7 @@ class NotionHelper:
                     max_child_page_depth=max_child_page_depth,
                     child_page_depth=child_page_depth,
                     visited_page_ids=visited_page_ids,
+                    max_workers=max_workers,
                 )
                 block[block_type] = block_payload
 
@@ -1466,6 +1922,9 @@ class NotionHelper:
         include_transcript: bool = False,
         expand_child_pages: bool = True,
         max_child_page_depth: int = 3,
+        crawl_child_pages: bool = False,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """Retrieves the JSON of the page properties and an array of blocks on a Notion page given its page_id.
@@ -1480,6 +1939,13 @@ class NotionHelper:
             expand_child_pages (bool): When True, recursively calls get_page for child_page
                 blocks and embeds the result.
             max_child_page_depth (int): Maximum recursion depth for child_page expansion.
+            crawl_child_pages (bool): When True, child pages are expanded breadth-first: all
+                pages discovered at one depth are fetched concurrently, and a page linked from
+                several places is fetched once (later occurrences are left unexpanded).
+            max_workers (int | None): Global cap on concurrent requests for block hydration and
+                crawling. Defaults to the helper's `max_workers`.
+            progress_callback (callable | None): Crawl mode only. Called as
+                `progress_callback(fetched, discovered)` after each child page is fetched.
             **kwargs: Deprecated aliases accepted for compatibility:
                 - returnmarkdown
                 - returnMarkdown
@@ -1536,18 +2002,61 @@ class NotionHelper:
         if use_markdown_api is None:
             use_markdown_api = return_markdown
 
+        properties, native_markdown, content_blocks = self._load_page(
+            page_id,
+            return_markdown=return_markdown,
+            use_markdown_api=use_markdown_api,
+            include_transcript=include_transcript,
+            max_workers=max_workers,
+        )
+        if expand_child_pages and crawl_child_pages:
+            self._crawl_child_pages(
+                content_blocks,
+                root_page_id=page_id,
+                return_markdown=return_markdown,
+                use_markdown_api=use_markdown_api,
+                include_transcript=include_transcript,
+                max_child_page_depth=max_child_page_depth,
+                max_workers=max_workers,
+                progress_callback=progress_callback,
+            )
+        elif expand_child_pages:
+            content_blocks = self._expand_child_pages(
+                content_blocks,
+                return_markdown=return_markdown,
+                use_markdown_api=use_markdown_api,
+                include_transcript=include_transcript,
+                max_child_page_depth=max_child_page_depth,
+                child_page_depth=child_page_depth,
+                visited_page_ids=visited_page_ids,
+                max_workers=max_workers,
+            )
+        child_pages = self._collect_expanded_child_pages(content_blocks) if expand_child_pages else []
+        return self._build_page_result(properties, native_markdown, content_blocks, return_markdown, child_pages)
+
+    def _load_page(
+        self,
+        page_id: str,
+        *,
+        return_markdown: bool,
+        use_markdown_api: bool,
+        include_transcript: bool,
+        max_workers: Optional[int] = None,
+    ) -> tuple[Dict[str, Any], Optional[str], List[Dict[str, Any]]]:
+        """Fetches page properties, native markdown (when requested) and the hydrated block tree."""
         # Retrieve the page properties
         page_url = f"https://api.notion.com/v1/pages/{page_id}"
         page = self._make_request("GET", page_url)
         properties = page.get("properties", {})
+        last_edited_time = page.get("last_edited_time")
+        if not isinstance(last_edited_time, str):
+            # "" (not None) so the block loader does not revalidate with another GET.
+            last_edited_time = ""
         prefetched_blocks_page: Optional[Dict[str, Any]] = None
         native_markdown: Optional[str] = None
 
         if return_markdown and use_markdown_api:
-            markdown_response = self.get_page_markdown(
-                page_id,
-                include_transcript=include_transcript,
-            )
+            markdown_response = self._get_page_markdown(page_id, include_transcript, last_edited_time)
             if isinstance(markdown_response, dict) and "markdown" in markdown_response:
                 native_markdown = markdown_response.get("markdown", "")
             # Gracefully fall back to legacy block retrieval if callers/tests mock the
@@ -1555,19 +2064,23 @@ class NotionHelper:
             elif isinstance(markdown_response, dict) and "results" in markdown_response:
                 prefetched_blocks_page = markdown_response
 
-        content_blocks = self._get_page_blocks(page_id, prefetched_blocks_page=prefetched_blocks_page)
-        if expand_child_pages:
-            content_blocks = self._expand_child_pages(
-                content_blocks,
-                return_markdown=return_markdown,
-                use_markdown_api=use_markdown_api,
-                include_transcript=include_transcript,
-                max_child_page_depth=max_child_page_depth,
-                child_page_depth=child_page_depth,
-                visited_page_ids=visited_page_ids,
-            )
-        child_pages = self._collect_expanded_child_pages(content_blocks) if expand_child_pages else []
+        content_blocks = self._get_page_blocks(
+            page_id,
+            prefetched_blocks_page=prefetched_blocks_page,
+            max_workers=max_workers,
+            last_edited_time=last_edited_time,
+        )
+        return properties, native_markdown, content_blocks
 
+    def _build_page_result(
+        self,
+        properties: Dict[str, Any],
+        native_markdown: Optional[str],
+        content_blocks: List[Dict[str, Any]],
+        return_markdown: bool,
+        child_pages: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Builds the get_page return payload."""
         # Convert to markdown if requested
         if return_markdown:
             content = (
@@ -1584,13 +2097,97 @@ class NotionHelper:
             result["child_pages"] = child_pages
         return result
 
-    def create_database(self, parent_page_id: str, database_title: str, initial_data_source_properties: Dict[str, Any], initial_data_source_title: Optional[str] = None) -> Dict[str, Any]:
-        """Creates a new database in Notion with an initial data source.
-
-        This method creates a new database under a specified parent page with the provided title
-        and defines the schema for its initial data source.
-
-        Parameters:
+    def _crawl_child_pages(
+        self,
+        blocks: List[Dict[str, Any]],
+        *,
+        root_page_id: str,
+        return_markdown: bool,
+        use_markdown_api: bool,
+        include_transcript: bool,
+        max_child_page_depth: int,
+        max_workers: Optional[int],
+        progress_callback: Optional[Callable[[int, int], None]],
+    ) -> None:
+        """Expands child_page blocks breadth-first, fetching each depth concurrently.
+
+        Discovery and deduplication run on the calling thread between levels, so the
+        visited set is only ever mutated by one thread; workers just fetch pages.
+        """
+        workers = max_workers or self.max_workers
+        visited_page_ids = {root_page_id}
+        progress_lock = threading.Lock()
+        progress = {"fetched": 0, "discovered": 0}
+        crawled: List[tuple[Dict[str, Any], List[Dict[str, Any]]]] = []
+        level: List[List[Dict[str, Any]]] = [blocks]
+        depth = 0
+
+        while level and depth < max_child_page_depth:
+            pending: List[Dict[str, Any]] = []
+            for level_blocks in level:
+                for block in self._iter_child_page_blocks(level_blocks):
+                    child_page_id = block.get("id")
+                    if isinstance(child_page_id, str) and child_page_id not in visited_page_ids:
+                        visited_page_ids.add(child_page_id)
+                        pending.append(block)
+            if not pending:
+                break
+            progress["discovered"] += len(pending)
+            # Split the global cap between page fetches and each page's block hydration.
+            hydration_workers = max(1, workers // len(pending))
+
+            def fetch(block: Dict[str, Any]) -> tuple[Dict[str, Any], List[Dict[str, Any]]]:
+                properties, native_markdown, content_blocks = self._load_page(
+                    block["id"],
+                    return_markdown=return_markdown,
+                    use_markdown_api=use_markdown_api,
+                    include_transcript=include_transcript,
+                    max_workers=hydration_workers,
+                )
+                page_result = self._build_page_result(
+                    properties, native_markdown, content_blocks, return_markdown, child_pages=[]
+                )
+                if progress_callback is not None:
+                    with progress_lock:
+                        progress["fetched"] += 1
+                        progress_callback(progress["fetched"], progress["discovered"])
+                return page_result, content_blocks
+
+            fetched = self._map_concurrently(fetch, pending, max_workers=workers)
+            level = []
+            for block, (page_result, content_blocks) in zip(pending, fetched):
+                child_payload = block.get("child_page", {})
+                child_payload = child_payload if isinstance(child_payload, dict) else {}
+                child_payload["page"] = page_result
+                block["child_page"] = child_payload
+                crawled.append((page_result, content_blocks))
+                level.append(content_blocks)
+            depth += 1
+
+        for page_result, content_blocks in crawled:
+            child_pages = self._collect_expanded_child_pages(content_blocks)
+            if child_pages:
+                page_result["child_pages"] = child_pages
+
+    def _iter_child_page_blocks(self, blocks: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yields child_page blocks anywhere in a hydrated block tree, in document order."""
+        for block in blocks:
+            if not isinstance(block, dict):
+                continue
+            block_type = block.get("type")
+            if block_type == "child_page":
+                yield block
+            block_payload = block.get(block_type, {}) if isinstance(block_type, str) else {}
+            if isinstance(block_payload, dict) and isinstance(block_payload.get("children"), list):
+                yield from self._iter_child_page_blocks(block_payload["children"])
+
+    def create_database(self, parent_page_id: str, database_title: str, initial_data_source_properties: Dict[str, Any], initial_data_source_title: Optional[str] = None) -> Dict[str, Any]:
+        """Creates a new database in Notion with an initial data source.
+
+        This method creates a new database under a specified parent page with the provided title
+        and defines the schema for its initial data source.
+
+        Parameters:
             parent_page_id (str): The unique identifier of the parent page.
             database_title (str): The title for the new database container.
             initial_data_source_properties (dict): A dictionary defining the property schema for the initial data source.
@@ -1617,7 +2214,10 @@ class NotionHelper:
             },
         }
         url = "https://api.notion.com/v1/databases"
-        return self._make_request("POST", url, payload)
+        response = self._make_request("POST", url, payload)
+        if self.schema_cache is not None and isinstance(response.get("id"), str):
+            self.schema_cache.set(self._schema_cache_key("database", response["id"]), response)
+        return response
 
     def update_data_source(self, data_source_id: str, properties: Optional[Dict[str, Any]] = None, title: Optional[List[Dict[str, Any]]] = None, icon: Optional[Dict[str, Any]] = None, in_trash: Optional[bool] = None, parent: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Updates the attributes of a specified data source.
@@ -1652,7 +2252,23 @@ class NotionHelper:
             raise ValueError("No update parameters provided. Please provide at least one of: properties, title, icon, in_trash, parent.")
 
         url = f"https://api.notion.com/v1/data_sources/{data_source_id}"
-        return self._make_request("PATCH", url, payload)
+        response = self._make_request("PATCH", url, payload)
+        if self.schema_cache is not None:
+            self._refresh_cached_data_source(data_source_id, response)
+        return response
+
+    def _refresh_cached_data_source(self, data_source_id: str, response: Dict[str, Any]) -> None:
+        """Stores an updated data source and drops the parent database entries that list it."""
+        key = self._schema_cache_key("data_source", data_source_id)
+        previous = self.schema_cache.peek(key) or {}
+        for source in (previous, response):
+            parent = source.get("parent") if isinstance(source, dict) else None
+            if isinstance(parent, dict) and isinstance(parent.get("database_id"), str):
+                self.schema_cache.invalidate(self._schema_cache_key("database", parent["database_id"]))
+        if isinstance(response, dict) and isinstance(response.get("properties"), dict):
+            self.schema_cache.set(key, response)
+        else:
+            self.schema_cache.invalidate(key)
 
     def new_page_to_data_source(
         self,
@@ -1671,29 +2287,665 @@ class NotionHelper:
         Returns:
             dict: The JSON response from the Notion API containing details about the created page.
         """
+        payload, api_version = self._build_new_page_payload(data_source_id, page_properties, markdown)
+        url = "https://api.notion.com/v1/pages"
+        return self._make_request("POST", url, payload, api_version=api_version)
+
+    def _build_new_page_payload(
+        self,
+        data_source_id: str,
+        page_properties: Optional[Dict[str, Any]],
+        markdown: Optional[str],
+    ) -> tuple[Dict[str, Any], str]:
+        """Builds the page creation payload and the API version it requires."""
         if page_properties is None:
             page_properties = {}
         if not page_properties and markdown is None:
             raise ValueError("Either page_properties or markdown must be provided")
 
-        payload = {
+        payload: Dict[str, Any] = {
             "parent": {"data_source_id": data_source_id},
         }
         if page_properties:
             payload["properties"] = page_properties
         if markdown is not None:
             payload["markdown"] = markdown
-        url = "https://api.notion.com/v1/pages"
         api_version = (
             MARKDOWN_NOTION_API_VERSION if markdown is not None else DEFAULT_NOTION_API_VERSION
         )
-        return self._make_request("POST", url, payload, api_version=api_version)
+        return payload, api_version
+
+    def bulk_create_pages(
+        self,
+        data_source_id: str,
+        rows: Union[Iterable[Dict[str, Any]], pd.DataFrame],
+        column_map: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        resume_from: Optional[BulkResult] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> BulkResult:
+        """Creates many pages in a data source with bounded, rate-paced concurrency.
+
+        Failures are recorded per row instead of aborting the run, except for
+        authentication errors, which stop dispatching further rows.
+
+        Parameters:
+            data_source_id (str): The unique identifier of the Notion data source.
+            rows (iterable | DataFrame): Notion property payload dicts (as accepted by
+                `new_page_to_data_source`), or a DataFrame whose values are encoded using the
+                data source schema.
+            column_map (dict, optional): DataFrame only. Maps column names to property names.
+                Defaults to every column whose name matches a writable property.
+            max_workers (int, optional): Concurrent requests. Defaults to the helper's `max_workers`.
+            rate_limiter (RateLimiter, optional): Paces page creation. Defaults to the helper's
+                limiter when one is set, otherwise a `TokenBucketRateLimiter()` at Notion's
+                average of 3 requests per second.
+            resume_from (BulkResult, optional): Report from an earlier run over the same rows;
+                rows it lists as created are skipped and the reports are merged.
+            progress_callback (callable, optional): Called as `progress_callback(done, failed)`
+                after each attempted row.
+
+        Returns:
+            BulkResult: One `RowResult` per attempted row, ordered by row index.
+        """
+        if isinstance(rows, pd.DataFrame):
+            items: Iterable[tuple[int, Any]] = enumerate(
+                self._encode_dataframe_properties(rows, self._schema_properties(data_source_id), column_map)
+            )
+        else:
+            items = enumerate(rows)
+
+        def create(index: int, properties: Dict[str, Any], pace: Callable[[], Any]) -> RowResult:
+            page = self.new_page_to_data_source(data_source_id, properties)
+            return RowResult(index, "created", page_id=page.get("id"))
+
+        return self._run_bulk_writes(
+            items,
+            create,
+            max_workers=max_workers,
+            rate_limiter=rate_limiter,
+            resume_from=resume_from,
+            progress_callback=progress_callback,
+        )
+
+    def write_dataframe_to_data_source(
+        self,
+        df: pd.DataFrame,
+        data_source_id: str,
+        mode: str = "append",
+        key_property: Optional[str] = None,
+        column_map: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        resume_from: Optional[BulkResult] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> BulkResult:
+        """Writes DataFrame rows to a data source as pages.
+
+        The target schema is read once and each column is encoded as a whole for its
+        property type: NaN/inf/NaT cells are omitted, datetimes become ISO 8601, list
+        cells become multi_select/relation/people values and booleans become checkboxes.
+        Rows are sent with the same bounded, rate-paced dispatch as `bulk_create_pages`.
+
+        Parameters:
+            df (pandas.DataFrame): Rows to write.
+            data_source_id (str): The unique identifier of the Notion data source.
+            mode (str): "append" creates one page per row. "upsert" updates the page whose
+                `key_property` matches the row and creates a page otherwise, looking pages up
+                in the helper's key index (see `upsert_page`).
+            key_property (str, optional): Property identifying a row; required for "upsert".
+            column_map (dict, optional): Maps column names to property names. Defaults to
+                every column whose name matches a writable property.
+            max_workers, rate_limiter, resume_from, progress_callback: As in `bulk_create_pages`.
+
+        Returns:
+            BulkResult: Per-row report with status "created", "updated" or "failed".
+        """
+        if mode not in {"append", "upsert"}:
+            raise ValueError("mode must be 'append' or 'upsert'")
+        schema_properties = self._schema_properties(data_source_id)
+        column_map = self._resolve_column_map(df, schema_properties, column_map)
+        encoded_rows = self._encode_dataframe_properties(df, schema_properties, column_map)
+
+        if mode == "append":
+            def write(index: int, properties: Dict[str, Any], pace: Callable[[], Any]) -> RowResult:
+                page = self.new_page_to_data_source(data_source_id, properties)
+                return RowResult(index, "created", page_id=page.get("id"))
+        else:
+            if not key_property:
+                raise ValueError("key_property is required for mode='upsert'")
+            key_columns = [column for column, name in column_map.items() if name == key_property]
+            if not key_columns:
+                raise ValueError(f"No column is mapped to key property '{key_property}'")
+            key_type = schema_properties[key_property].get("type")
+            keys = [self._property_key(value, key_type) for value in df[key_columns[0]].tolist()]
+            present_keys = [key for key in keys if key is not None]
+            if len(present_keys) != len(set(present_keys)):
+                raise ValueError(f"Duplicate values in key column '{key_columns[0]}'")
+            key_index = self._ensure_key_index(data_source_id, key_property, schema_properties)
+
+            def write(index: int, properties: Dict[str, Any], pace: Callable[[], Any]) -> RowResult:
+                key = keys[index]
+                if key is None:
+                    raise ValueError(f"Missing value for key property '{key_property}'")
+                status, page_id, _ = self._upsert_with_index(
+                    key_index, data_source_id, key_property, key, properties, pace=pace
+                )
+                return RowResult(index, status, page_id=page_id)
+
+        return self._run_bulk_writes(
+            enumerate(encoded_rows),
+            write,
+            max_workers=max_workers,
+            rate_limiter=rate_limiter,
+            resume_from=resume_from,
+            progress_callback=progress_callback,
+        )
+
+    def upsert_page(
+        self,
+        data_source_id: str,
+        page_properties: Dict[str, Any],
+        key_property: str,
+        key: Any = None,
+    ) -> Dict[str, Any]:
+        """Updates the page whose `key_property` equals the key, or creates it.
+
+        Pages are found through the helper's key index, which is built once per
+        (data source, key property) from a query projected to the key property and then
+        kept current from create/update responses. Each call after that is a single
+        PATCH or POST. Pages created outside this helper after the index was built are
+        not seen until `build_key_index` is called again.
+
+        Parameters:
+            data_source_id (str): The unique identifier of the Notion data source.
+            page_properties (dict): Notion property payloads, as for `new_page_to_data_source`.
+            key_property (str): Property whose value identifies the page.
+            key (optional): Key value; read from `page_properties[key_property]` when omitted.
+
+        Returns:
+            dict: The created or updated page.
+        """
+        key_payload = page_properties.get(key_property)
+        if key is not None:
+            key = self._property_key(key, self._payload_property_type(key_payload))
+        else:
+            key = self._payload_key(key_payload)
+        if key is None:
+            raise ValueError(f"Missing value for key property '{key_property}'")
+        key_index = self._ensure_key_index(data_source_id, key_property)
+        return self._upsert_with_index(key_index, data_source_id, key_property, key, page_properties)[2]
+
+    def upsert_pages(
+        self,
+        data_source_id: str,
+        rows: Iterable[Dict[str, Any]],
+        key_property: str,
+        max_workers: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        resume_from: Optional[BulkResult] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> BulkResult:
+        """Upserts many property payloads by key with the dispatch of `bulk_create_pages`.
+
+        Keys are read from each row's `key_property` payload and must be unique within
+        the call (a ValueError is raised before anything is written otherwise); rows
+        without a key fail individually.
+
+        Returns:
+            BulkResult: Per-row report with status "created", "updated" or "failed".
+        """
+        rows = list(rows)
+        keys = [self._payload_key(row.get(key_property)) for row in rows]
+        present_keys = [key for key in keys if key is not None]
+        if len(present_keys) != len(set(present_keys)):
+            raise ValueError(f"Duplicate values for key property '{key_property}'")
+        key_index = self._ensure_key_index(data_source_id, key_property)
+
+        def write(index: int, properties: Dict[str, Any], pace: Callable[[], Any]) -> RowResult:
+            if keys[index] is None:
+                raise ValueError(f"Missing value for key property '{key_property}'")
+            status, page_id, _ = self._upsert_with_index(
+                key_index, data_source_id, key_property, keys[index], properties, pace=pace
+            )
+            return RowResult(index, status, page_id=page_id)
+
+        return self._run_bulk_writes(
+            enumerate(rows),
+            write,
+            max_workers=max_workers,
+            rate_limiter=rate_limiter,
+            resume_from=resume_from,
+            progress_callback=progress_callback,
+        )
+
+    def build_key_index(
+        self,
+        data_source_id: str,
+        key_property: str,
+        schema_properties: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """(Re)builds the key index for one key property and returns its number of keys.
+
+        Reads every page once with `filter_properties` limited to the key property.
+        When several pages share a key, the first one returned is used.
+        """
+        if schema_properties is None:
+            schema_properties = self._schema_properties(data_source_id)
+        definition = schema_properties.get(key_property)
+        if not isinstance(definition, dict):
+            raise ValueError(f"Unknown data source property: {key_property}")
+        property_id = definition.get("id")
+        entries = []
+        for page in self.iter_data_source_pages(
+            data_source_id,
+            filter_properties=[property_id] if property_id else None,
+        ):
+            value = (page.get("properties") or {}).get(key_property)
+            page_id = self._normalize_notion_id(page.get("id", "")) or page.get("id")
+            if not isinstance(value, dict) or not page_id:
+                continue
+            property_type = value.get("type", "")
+            key = self._property_key(self._extract_property_value(property_type, value), property_type)
+            if key is not None:
+                entries.append((key, page_id))
+        key_index = self._get_key_index()
+        key_index.replace(self._key_index_source(data_source_id), key_property, entries)
+        return len(key_index.items(self._key_index_source(data_source_id), key_property))
+
+    def _get_key_index(self) -> KeyIndex:
+        with self._key_index_lock:
+            if self.key_index is None:
+                self.key_index = KeyIndex()
+            return self.key_index
+
+    def _key_index_source(self, data_source_id: str) -> str:
+        return self._normalize_notion_id(data_source_id) or data_source_id
+
+    def _ensure_key_index(
+        self,
+        data_source_id: str,
+        key_property: str,
+        schema_properties: Optional[Dict[str, Any]] = None,
+    ) -> KeyIndex:
+        """Returns the key index, building the (data source, key property) entry on first use."""
+        key_index = self._get_key_index()
+        if not key_index.is_built(self._key_index_source(data_source_id), key_property):
+            with self._key_index_lock:
+                if not key_index.is_built(self._key_index_source(data_source_id), key_property):
+                    self.build_key_index(data_source_id, key_property, schema_properties)
+        return key_index
+
+    def _upsert_with_index(
+        self,
+        key_index: KeyIndex,
+        data_source_id: str,
+        key_property: str,
+        key: str,
+        page_properties: Dict[str, Any],
+        pace: Optional[Callable[[], Any]] = None,
+    ) -> tuple[str, Optional[str], Dict[str, Any]]:
+        """Writes one keyed row with a single PATCH or POST; returns (status, page_id, page).
+
+        A stale index entry costs extra requests (the failed PATCH, a page GET, then the
+        POST). The caller paces the first request; `pace()` is called before each extra one.
+        """
+        source = self._key_index_source(data_source_id)
+        page_id = key_index.get(source, key_property, key)
+        page: Optional[Dict[str, Any]] = None
+        if page_id is not None:
+            try:
+                page = self.update_page_properties(page_id, page_properties)
+            except NotFoundError:
+                key_index.remove_page(page_id)
+            except ValidationError:
+                # Trashed pages reject edits with a generic validation_error; confirm the
+                # page state before falling back to creating a fresh page.
+                if pace is not None:
+                    pace()
+                if not self._page_is_trashed(page_id):
+                    raise
+                key_index.remove_page(page_id)
+        if page is not None:
+            status, page_id = "updated", page.get("id") or page_id
+        else:
+            if page_id is not None and pace is not None:
+                pace()
+            page = self.new_page_to_data_source(data_source_id, page_properties)
+            status, page_id = "created", page.get("id")
+        if page_id:
+            self._record_page_key(key_index, source, key_property, key, page_id, page)
+        return status, page_id, page
+
+    def _page_is_trashed(self, page_id: str) -> bool:
+        """Returns True when the page is in the trash (or no longer exists)."""
+        try:
+            page = self._make_request("GET", f"https://api.notion.com/v1/pages/{page_id}")
+        except NotFoundError:
+            return True
+        return bool(page.get("in_trash") or page.get("archived"))
+
+    def _record_page_key(
+        self,
+        key_index: KeyIndex,
+        source: str,
+        key_property: str,
+        key: str,
+        page_id: str,
+        page: Dict[str, Any],
+    ) -> None:
+        """Updates the key index from a create/update response."""
+        page_id = self._normalize_notion_id(page_id) or page_id
+        value = (page.get("properties") or {}).get(key_property)
+        if isinstance(value, dict):
+            property_type = value.get("type", "")
+            response_key = self._property_key(self._extract_property_value(property_type, value), property_type)
+            key = response_key if response_key is not None else key
+        key_index.set(source, key_property, key, page_id)
+
+    def _payload_key(self, payload: Any) -> Optional[str]:
+        """Reads the key from a property write payload such as `{"title": [...]}`."""
+        property_type = self._payload_property_type(payload)
+        value = payload.get(property_type) if property_type else None
+        if property_type in {"title", "rich_text"}:
+            first = value[0] if isinstance(value, list) and value else {}
+            value = first.get("plain_text") or (first.get("text") or {}).get("content")
+        elif property_type in {"select", "status"}:
+            value = (value or {}).get("name")
+        elif property_type == "date":
+            value = (value or {}).get("start")
+        elif isinstance(value, (dict, list)):
+            return None
+        return self._property_key(value, property_type)
+
+    def _payload_property_type(self, payload: Any) -> Optional[str]:
+        if not isinstance(payload, dict):
+            return None
+        return payload.get("type") or next((name for name in payload if name in WRITABLE_PROPERTY_TYPES), None)
+
+    def _property_key(self, value: Any, property_type: Optional[str] = None) -> Optional[str]:
+        """Normalizes a key value so DataFrame cells and extracted properties compare equal.
+
+        Dates (datetime-like values, or any value of a `date` property) become the ISO 8601
+        form `normalize_datetime_iso` gives extracted date properties.
+        """
+        if isinstance(value, np.datetime64):
+            value = pd.Timestamp(value)
+        elif isinstance(value, np.generic):
+            value = value.item()
+        if value is _SKIP or self._is_missing_cell(value) or (isinstance(value, str) and not value):
+            return None
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, datetime) or property_type == "date":
+            return self.normalize_datetime_iso(value) or None
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value)
+
+    def _run_bulk_writes(
+        self,
+        items: Iterable[tuple[int, Any]],
+        write: Callable[[int, Dict[str, Any], Callable[[], Any]], RowResult],
+        max_workers: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        resume_from: Optional[BulkResult] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> BulkResult:
+        """Runs `write(index, properties, pace)` for each row on a bounded pool and collects a BulkResult.
+
+        One rate limiter token is taken before each row; `write` calls `pace()` before
+        every further request it makes for the row. A row given as an exception instance
+        (e.g. a value that failed to encode) is recorded as failed without a request.
+        """
+        completed = resume_from.completed_indices if resume_from is not None else set()
+        if rate_limiter is None and self.rate_limiter is None:
+            rate_limiter = TokenBucketRateLimiter()
+        abort = threading.Event()
+        report = BulkResult()
+        failures = 0
+
+        def pace() -> None:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+
+        def run(item: tuple[int, Any]) -> RowResult:
+            index, properties = item
+            try:
+                if isinstance(properties, Exception):
+                    raise properties
+                pace()
+                return write(index, properties, pace)
+            except AuthError as exc:
+                abort.set()
+                report.aborted = str(exc)
+                return RowResult(index, "failed", error=str(exc), error_type=type(exc).__name__)
+            except (NotionAPIError, ValueError, TypeError) as exc:
+                return RowResult(index, "failed", error=str(exc), error_type=type(exc).__name__)
+
+        def dispatch() -> Iterator[tuple[int, Any]]:
+            for item in items:
+                if abort.is_set():
+                    return
+                if item[0] not in completed:
+                    yield item
+
+        for result in self._imap_bounded(run, dispatch(), max_workers=max_workers):
+            report.rows.append(result)
+            failures += 0 if result.ok else 1
+            if progress_callback is not None:
+                progress_callback(len(report.rows), failures)
+
+        report.rows.sort(key=lambda row: row.index)
+        return resume_from.merge(report) if resume_from is not None else report
+
+    def _schema_properties(self, data_source_id: str) -> Dict[str, Any]:
+        """Returns the `properties` schema of a data source (through the schema cache, if any)."""
+        properties = self.get_data_source(data_source_id).get("properties", {})
+        return properties if isinstance(properties, dict) else {}
+
+    def _resolve_column_map(
+        self,
+        df: pd.DataFrame,
+        schema_properties: Dict[str, Any],
+        column_map: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
+        """Validates a column -> property map; defaults to columns named after writable properties."""
+        if column_map is None:
+            return {
+                column: column
+                for column in df.columns
+                if isinstance(schema_properties.get(column), dict)
+                and schema_properties[column].get("type") in WRITABLE_PROPERTY_TYPES
+            }
+        missing = [name for name in column_map.values() if name not in schema_properties]
+        if missing:
+            raise ValueError(f"Unknown data source properties: {', '.join(missing)}")
+        unknown_columns = [column for column in column_map if column not in df.columns]
+        if unknown_columns:
+            raise ValueError(f"Unknown DataFrame columns: {', '.join(map(str, unknown_columns))}")
+        return column_map
+
+    def _encode_dataframe_properties(
+        self,
+        df: pd.DataFrame,
+        schema_properties: Dict[str, Any],
+        column_map: Optional[Dict[str, str]] = None,
+    ) -> List[Union[Dict[str, Any], ValueError]]:
+        """Encodes DataFrame rows as Notion property payloads, one column at a time.
+
+        Each row becomes a properties dict, or a ValueError when one of its cells
+        cannot be written to its property type. Missing and non-finite values are omitted.
+        """
+        column_map = self._resolve_column_map(df, schema_properties, column_map)
+        encoded_columns = []
+        for column, name in column_map.items():
+            property_type = schema_properties[name].get("type", "")
+            if property_type not in WRITABLE_PROPERTY_TYPES:
+                raise ValueError(f"Property type '{property_type}' cannot be written (property '{name}')")
+            encoded_columns.append((name, self._encode_series(property_type, df[column])))
+
+        if not encoded_columns:
+            return [{} for _ in range(len(df))]
+        names = [name for name, _ in encoded_columns]
+        rows: List[Union[Dict[str, Any], ValueError]] = []
+        for cells in zip(*(cells for _, cells in encoded_columns)):
+            properties: Dict[str, Any] = {}
+            error: Optional[ValueError] = None
+            for name, cell in zip(names, cells):
+                if cell is None:
+                    continue
+                if isinstance(cell, ValueError):
+                    error = error or ValueError(f"{name}: {cell}")
+                    continue
+                properties[name] = cell
+            rows.append(error if error is not None else properties)
+        return rows
+
+    def _encode_series(self, property_type: str, series: pd.Series) -> List[Any]:
+        """Encodes one column as property values; None marks cells to omit."""
+        present = series.notna().to_numpy(dtype=bool)
+        if property_type == "number":
+            numeric = pd.to_numeric(series, errors="coerce")
+            values = numeric.to_numpy(dtype=float, na_value=np.nan)
+            finite = np.isfinite(values)
+            invalid = present & np.isnan(values)
+            return [
+                {"number": value} if ok else (ValueError(f"{original!r} is not a number") if bad else None)
+                for value, ok, bad, original in zip(values.tolist(), finite, invalid, series.tolist())
+            ]
+        if property_type == "checkbox":
+            return [self._encode_checkbox_cell(value) if ok else None for value, ok in zip(series.tolist(), present)]
+        if property_type == "date":
+            return [
+                ({"date": {"start": start}} if start else ValueError(f"{original!r} is not a date")) if ok else None
+                for start, ok, original in zip(self._series_to_iso(series, present), present, series.tolist())
+            ]
+        if property_type in ("title", "rich_text"):
+            return [
+                {property_type: self._text_property_chunks(str(value))} if ok else None
+                for value, ok in zip(series.tolist(), present)
+            ]
+        if property_type in ("select", "status"):
+            return [{property_type: {"name": str(value)}} if ok else None for value, ok in zip(series.tolist(), present)]
+        if property_type in ("url", "email", "phone_number"):
+            return [{property_type: str(value)} if ok else None for value, ok in zip(series.tolist(), present)]
+        # multi_select, relation and people hold list-like cells, encoded one by one.
+        return [
+            self.encode_property_value(property_type, value) if not self._is_missing_cell(value) else None
+            for value in series.tolist()
+        ]
+
+    def _encode_checkbox_cell(self, value: Any) -> Union[Dict[str, Any], ValueError]:
+        try:
+            return {"checkbox": self._checkbox_value(value)}
+        except ValueError as exc:
+            return exc
+
+    def _checkbox_value(self, value: Any) -> bool:
+        """Reads booleans, 0/1 and true/false/yes/no/1/0 strings; anything else raises ValueError."""
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)) and value in (0, 1):
+            return bool(value)
+        if isinstance(value, str) and value.strip().lower() in _CHECKBOX_STRINGS:
+            return _CHECKBOX_STRINGS[value.strip().lower()]
+        raise ValueError(f"Cannot write {value!r} to a checkbox property")
+
+    def _series_to_iso(self, series: pd.Series, present: np.ndarray) -> List[str]:
+        """Formats a column of datetime-like values as ISO 8601 strings ("" when missing/invalid)."""
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            timestamps = series.dt.tz_convert("UTC") if series.dt.tz is not None else series.dt.tz_localize("UTC")
+            has_fraction = bool((timestamps.dt.microsecond[present] != 0).any())
+            formatted = timestamps.dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ" if has_fraction else "%Y-%m-%dT%H:%M:%SZ")
+            return [value if ok else "" for value, ok in zip(formatted.tolist(), present)]
+        values = [
+            value.isoformat() if isinstance(value, date) and not isinstance(value, datetime) else value
+            for value in series.tolist()
+        ]
+        return self.normalize_datetime_iso_batch(
+            [value if ok else None for value, ok in zip(values, present)]
+        )
+
+    def _text_property_chunks(self, text: str) -> List[Dict[str, Any]]:
+        # A string of at most 1000 code points is at most 2000 UTF-16 units.
+        chunks = [text] if len(text) <= 1000 else self._chunk_text(text, 2000)
+        return [{"type": "text", "text": {"content": chunk}} for chunk in chunks]
+
+    def _is_missing_cell(self, value: Any) -> bool:
+        if isinstance(value, (list, tuple, set, dict, np.ndarray)):
+            return False
+        return value is None or bool(pd.isna(value))
+
+    def encode_property_value(self, property_type: str, value: Any) -> Optional[Dict[str, Any]]:
+        """Encodes a Python value as a Notion property value of the given type.
+
+        Returns None for missing values (None, NaN, NaT) and non-finite numbers, which
+        callers omit from the payload. Numbers accept numeric strings; checkboxes accept
+        booleans, 0/1 and "true"/"false"/"yes"/"no"/"1"/"0". Raises ValueError for values
+        or types that cannot be written.
+        """
+        if isinstance(value, np.datetime64):
+            value = pd.Timestamp(value)
+        elif isinstance(value, np.generic):
+            value = value.item()
+        if value is None or value is pd.NaT or (isinstance(value, float) and math.isnan(value)):
+            return None
+        if property_type in ("title", "rich_text"):
+            return {property_type: self._text_property_chunks(str(value))}
+        if property_type == "number":
+            # Parsed like the DataFrame path: strings pandas cannot read as a number are errors.
+            number = float(pd.to_numeric(value, errors="coerce")) if isinstance(value, str) else float(value)
+            if math.isnan(number):
+                raise ValueError(f"Cannot write {value!r} to a number property")
+            return {"number": number} if math.isfinite(number) else None
+        if property_type == "checkbox":
+            return {"checkbox": self._checkbox_value(value)}
+        if property_type in ("select", "status"):
+            return {property_type: {"name": str(value)}}
+        if property_type == "multi_select":
+            names = [value] if isinstance(value, str) else list(value)
+            return {"multi_select": [{"name": str(name)} for name in names]}
+        if property_type == "date":
+            if isinstance(value, date) and not isinstance(value, datetime):
+                start = value.isoformat()
+            else:
+                start = self.normalize_datetime_iso(value)
+            if not start:
+                raise ValueError(f"Cannot write {value!r} to a date property")
+            return {"date": {"start": start}}
+        if property_type in ("url", "email", "phone_number"):
+            return {property_type: str(value)}
+        if property_type in ("relation", "people"):
+            ids = [value] if isinstance(value, str) else list(value)
+            return {property_type: [{"id": str(item_id)} for item_id in ids]}
+        raise ValueError(f"Property type '{property_type}' cannot be written")
+
+    def update_page_properties(self, page_id: str, page_properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Updates property values on an existing page.
+
+        Parameters:
+            page_id (str): The Notion page ID.
+            page_properties (dict): Property values keyed by property name, in the same format
+                as `new_page_to_data_source`.
+
+        Returns:
+            dict: The updated page object.
+        """
+        url = f"https://api.notion.com/v1/pages/{page_id}"
+        return self._make_request("PATCH", url, {"properties": page_properties})
 
     def trash_page(self, page_id: str) -> Dict[str, Any]:
         """Moves a Notion page to trash."""
         url = f"https://api.notion.com/v1/pages/{page_id}"
         payload = {"in_trash": True}
-        return self._make_request("PATCH", url, payload)
+        response = self._make_request("PATCH", url, payload)
+        if self.key_index is not None:
+            self.key_index.remove_page(self._normalize_notion_id(page_id) or page_id)
+        return response
 
     def restore_page(self, page_id: str) -> Dict[str, Any]:
         """Restores a Notion page from trash."""
@@ -1708,6 +2960,10 @@ class NotionHelper:
         sanitize: bool = True,
         blocks: Optional[List[Dict[str, Any]]] = None,
         batch_size: int = 100,
+        pipeline: bool = False,
+        max_workers: Optional[int] = None,
+        max_payload_bytes: int = MAX_APPEND_PAYLOAD_BYTES,
+        max_block_elements: int = MAX_APPEND_BLOCK_ELEMENTS,
     ) -> Dict[str, Any]:
         """Appends blocks or markdown text to a Notion page body.
 
@@ -1717,6 +2973,344 @@ class NotionHelper:
             sanitize (bool): If True, run block/rich_text sanitization before request.
             blocks (list[dict] | None): Backward-compatible alias for body when passing blocks.
             batch_size (int): Number of child blocks per append request (Notion max is 100).
+            pipeline (bool): If True, send batches concurrently instead of one after another.
+                The first block of every batch is appended up front (one request per 100
+                batches), then the rest of each batch is appended concurrently with
+                `after=<ID of its first block>`, so the final order does not depend on which
+                request finishes first. Those concurrent appends to one parent also retry
+                Notion's 409 `conflict_error`.
+            max_workers (int, optional): Concurrent requests in pipeline mode and for nested
+                follow-up appends. Defaults to the helper's `max_workers`.
+            max_payload_bytes (int): Serialized request body budget per append request.
+            max_block_elements (int): Block budget per append request, counting nested children.
+
+        Each request packs as many consecutive blocks as fit under `batch_size` and both
+        budgets; a single block that exceeds a budget on its own is sent alone. The
+        response includes `batch_timings` with the duration of every top-level request.
+
+        Block trees nested deeper than Notion accepts in one request (three levels) are
+        split automatically: each request carries at most three levels, and deeper children
+        are appended afterwards to the IDs returned for their parents, concurrently across
+        parents. The response then reports `nested_request_count`.
+        """
+        # Sequential appends stream: each batch is sent as soon as it is full, while the
+        # rest of a markdown body is still being parsed.
+        payload_blocks, batch_size = self._prepare_append_blocks(
+            body, blocks, sanitize, batch_size, stream=not pipeline
+        )
+
+        url = f"https://api.notion.com/v1/blocks/{page_id}/children"
+        budgets = (batch_size, max_payload_bytes, max_block_elements)
+        deferred: Dict[int, List[Dict[str, Any]]] = {}
+        batches = self._iter_append_batches(self._iter_split_append_tree(payload_blocks, deferred), *budgets)
+        if pipeline:
+            batches = list(batches)
+        if pipeline and len(batches) > 1:
+            response = self._append_batches_pipelined(url, batches, max_workers, budgets)
+        else:
+            responses: List[Dict[str, Any]] = []
+            timings: List[Dict[str, Any]] = []
+            for index, batch in enumerate(batches):
+                started = time.perf_counter()
+                responses.append(self._make_request("PATCH", url, {"children": batch}))
+                timings.append({
+                    "phase": "batch",
+                    "batch": index,
+                    "blocks": len(batch),
+                    "seconds": time.perf_counter() - started,
+                })
+            if not responses:
+                return {"object": "list", "results": []}
+            response = {**self._merge_append_responses(responses), "batch_timings": timings}
+
+        if deferred:
+            pending = self._deferred_children(response.get("results"), deferred, url)
+            response = {
+                **response,
+                "nested_request_count": self._append_nested_children(pending, budgets, max_workers),
+            }
+        return response
+
+    def _pack_append_batches(
+        self,
+        blocks: List[Dict[str, Any]],
+        batch_size: int = _MAX_APPEND_CHILDREN,
+        max_payload_bytes: int = MAX_APPEND_PAYLOAD_BYTES,
+        max_block_elements: int = MAX_APPEND_BLOCK_ELEMENTS,
+    ) -> List[List[Dict[str, Any]]]:
+        """Greedily packs consecutive blocks into append batches under count, byte and element budgets.
+
+        Greedy packing gives the fewest batches for an order-preserving split.
+        """
+        return list(self._iter_append_batches(blocks, batch_size, max_payload_bytes, max_block_elements))
+
+    def _iter_append_batches(
+        self,
+        blocks: Iterable[Dict[str, Any]],
+        batch_size: int = _MAX_APPEND_CHILDREN,
+        max_payload_bytes: int = MAX_APPEND_PAYLOAD_BYTES,
+        max_block_elements: int = MAX_APPEND_BLOCK_ELEMENTS,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Lazy form of `_pack_append_batches`: yields each batch as soon as it is complete."""
+        if max_payload_bytes < 1 or max_block_elements < 1:
+            raise ValueError("max_payload_bytes and max_block_elements must be >= 1")
+        current: List[Dict[str, Any]] = []
+        current_bytes = _APPEND_ENVELOPE_BYTES
+        current_elements = 0
+        for block in blocks:
+            # json.dumps matches the serialization used by _make_request; ", " separates blocks.
+            block_bytes = len(json.dumps(block)) + 2
+            block_elements = self._count_block_elements(block)
+            if current and (
+                current_bytes + block_bytes > max_payload_bytes
+                or current_elements + block_elements > max_block_elements
+            ):
+                yield current
+                current, current_bytes, current_elements = [], _APPEND_ENVELOPE_BYTES, 0
+            current.append(block)
+            current_bytes += block_bytes
+            current_elements += block_elements
+            # A full batch goes out without waiting for the next block to be produced.
+            if len(current) >= batch_size:
+                yield current
+                current, current_bytes, current_elements = [], _APPEND_ENVELOPE_BYTES, 0
+        if current:
+            yield current
+
+    def _count_block_elements(self, block: Any) -> int:
+        """Counts a block and all of its nested children."""
+        block_type = block.get("type") if isinstance(block, dict) else None
+        block_payload = block.get(block_type) if isinstance(block_type, str) else None
+        children = block_payload.get("children") if isinstance(block_payload, dict) else None
+        if not isinstance(children, list):
+            return 1
+        return 1 + sum(self._count_block_elements(child) for child in children)
+
+    def _split_append_tree(
+        self,
+        blocks: List[Dict[str, Any]],
+    ) -> tuple[List[Dict[str, Any]], Dict[int, List[tuple[tuple[int, ...], List[Dict[str, Any]]]]]]:
+        """Trims blocks to what one append request accepts.
+
+        Returns the trimmed blocks and, by block index, the children left out as
+        `(path, children)` pairs: `path` is the child-index path from the block to the
+        parent that receives them, `()` being the block itself. A block keeps the leading
+        children whose subtrees fit (at most 100); the rest are appended to the block once
+        it exists, which keeps their order. Column lists, columns and tables keep all their
+        children, since Notion rejects them empty, and are split below those children.
+        """
+        deferred: Dict[int, List[tuple[tuple[int, ...], List[Dict[str, Any]]]]] = {}
+        sendable = list(self._iter_split_append_tree(blocks, deferred))
+        return sendable, deferred
+
+    def _iter_split_append_tree(
+        self,
+        blocks: Iterable[Dict[str, Any]],
+        deferred: Dict[int, List[tuple[tuple[int, ...], List[Dict[str, Any]]]]],
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazy form of `_split_append_tree`: yields trimmed blocks and fills `deferred` as it goes."""
+        for index, block in enumerate(blocks):
+            trimmed, left_out = self._trim_append_block(block, _APPEND_NESTING_LEVELS)
+            if left_out:
+                deferred[index] = left_out
+            yield trimmed
+
+    def _trim_append_block(
+        self,
+        block: Dict[str, Any],
+        levels: int,
+    ) -> tuple[Dict[str, Any], List[tuple[tuple[int, ...], List[Dict[str, Any]]]]]:
+        """Trims one block's subtree to `levels` block levels; returns it with the `(path, children)` left out."""
+        block_type = block.get("type")
+        block_payload = block.get(block_type) if isinstance(block_type, str) else None
+        children = block_payload.get("children") if isinstance(block_payload, dict) else None
+        if not isinstance(children, list) or self._fits_append_request(block, levels):
+            return block, []
+
+        trimmed_payload = dict(block_payload)
+        left_out: List[tuple[tuple[int, ...], List[Dict[str, Any]]]] = []
+        if levels >= _APPEND_REQUIRED_CHILDREN.get(block_type, levels + 1):
+            kept_children = []
+            for child_index, child in enumerate(children[:_MAX_APPEND_CHILDREN]):
+                trimmed_child, child_left_out = self._trim_append_block(child, levels - 1)
+                kept_children.append(trimmed_child)
+                left_out.extend(((child_index,) + path, items) for path, items in child_left_out)
+            if len(children) > _MAX_APPEND_CHILDREN:
+                left_out.append(((), children[_MAX_APPEND_CHILDREN:]))
+            trimmed_payload["children"] = kept_children
+            return {**block, block_type: trimmed_payload}, left_out
+
+        kept = 0
+        while (
+            kept < len(children)
+            and kept < _MAX_APPEND_CHILDREN
+            and self._fits_append_request(children[kept], levels - 1)
+        ):
+            kept += 1
+        if kept:
+            trimmed_payload["children"] = children[:kept]
+        else:
+            trimmed_payload.pop("children")
+        return {**block, block_type: trimmed_payload}, [((), children[kept:])]
+
+    def _fits_append_request(self, block: Any, levels: int) -> bool:
+        """Returns True if a block's subtree spans at most `levels` block levels and 100-child arrays."""
+        if levels < 1:
+            return False
+        block_type = block.get("type") if isinstance(block, dict) else None
+        block_payload = block.get(block_type) if isinstance(block_type, str) else None
+        children = block_payload.get("children") if isinstance(block_payload, dict) else None
+        if not children:
+            return True
+        if levels <= 1 or len(children) > _MAX_APPEND_CHILDREN:
+            return False
+        return all(self._fits_append_request(child, levels - 1) for child in children)
+
+    def _deferred_children(
+        self,
+        results: Any,
+        deferred: Dict[int, List[tuple[tuple[int, ...], List[Dict[str, Any]]]]],
+        url: str,
+    ) -> List[tuple[str, List[Dict[str, Any]]]]:
+        """Pairs deferred children with the IDs of the blocks that receive them.
+
+        Top-level parents come from the append response; parents further down (inside
+        column lists, columns and tables) are found by listing their ancestors' children.
+        """
+        listed: Dict[str, List[Dict[str, Any]]] = {}
+        pending = []
+        for index, items in deferred.items():
+            if not isinstance(results, list) or index >= len(results) or not results[index].get("id"):
+                raise NotionAPIError(
+                    "Append response did not return the block IDs needed to append nested children",
+                    request_path=url,
+                )
+            for path, children in items:
+                parent_id = results[index]["id"]
+                for child_index in path:
+                    if parent_id not in listed:
+                        listed[parent_id] = self._list_block_children(parent_id)
+                    siblings = listed[parent_id]
+                    if child_index >= len(siblings) or not siblings[child_index].get("id"):
+                        raise NotionAPIError(
+                            "Could not find the nested block that receives deferred children",
+                            request_path=url,
+                        )
+                    parent_id = siblings[child_index]["id"]
+                pending.append((parent_id, children))
+        return pending
+
+    def _append_nested_children(
+        self,
+        pending: List[tuple[str, List[Dict[str, Any]]]],
+        budgets: tuple[int, int, int],
+        max_workers: Optional[int] = None,
+    ) -> int:
+        """Appends deferred subtrees level by level, concurrently across parents; returns the request count."""
+
+        def append_children(item: tuple[str, List[Dict[str, Any]]]) -> tuple[int, List[tuple[str, List[Dict[str, Any]]]]]:
+            parent_id, children = item
+            url = f"https://api.notion.com/v1/blocks/{parent_id}/children"
+            sendable, deferred = self._split_append_tree(children)
+            results: List[Dict[str, Any]] = []
+            request_count = 0
+            for batch in self._pack_append_batches(sendable, *budgets):
+                response = self._make_request("PATCH", url, {"children": batch})
+                request_count += 1
+                if isinstance(response, dict) and isinstance(response.get("results"), list):
+                    results.extend(response["results"])
+            return request_count, self._deferred_children(results, deferred, url) if deferred else []
+
+        total = 0
+        while pending:
+            outcomes = self._map_concurrently(append_children, pending, max_workers=max_workers)
+            total += sum(count for count, _ in outcomes)
+            pending = [item for _, items in outcomes for item in items]
+        return total
+
+    def _append_batches_pipelined(
+        self,
+        url: str,
+        batches: List[List[Dict[str, Any]]],
+        max_workers: Optional[int] = None,
+        budgets: tuple[int, int, int] = (_MAX_APPEND_CHILDREN, MAX_APPEND_PAYLOAD_BYTES, MAX_APPEND_BLOCK_ELEMENTS),
+    ) -> Dict[str, Any]:
+        """Appends batches concurrently, each anchored after its own first block."""
+        timings: List[Dict[str, Any]] = []
+        responses: List[Dict[str, Any]] = []
+        anchors: List[Dict[str, Any]] = []
+        first = 0
+        _, max_payload_bytes, max_block_elements = budgets
+        for heads in self._pack_append_batches(
+            [batch[0] for batch in batches], _MAX_APPEND_CHILDREN, max_payload_bytes, max_block_elements
+        ):
+            started = time.perf_counter()
+            response = self._make_request("PATCH", url, {"children": heads})
+            timings.append({
+                "phase": "anchors",
+                "batch": first,
+                "blocks": len(heads),
+                "seconds": time.perf_counter() - started,
+            })
+            results = response.get("results") if isinstance(response, dict) else None
+            if not isinstance(results, list) or len(results) < len(heads):
+                raise NotionAPIError(
+                    "Append response did not return the anchor blocks needed for pipelined append",
+                    request_path=url,
+                )
+            responses.append(response)
+            anchors.extend(results[-len(heads):])
+            first += len(heads)
+
+        # Concurrent appends to the same parent can collide with 409 conflict_error. Each
+        # one is anchored after its own block, so a retry lands in the same place.
+        policy = self._build_retry_policy()
+        policy.retry_statuses.add(409)
+
+        def send(index: int) -> tuple[Dict[str, Any], float]:
+            started = time.perf_counter()
+            response = self._make_request(
+                "PATCH",
+                url,
+                {"children": batches[index][1:], "after": anchors[index]["id"]},
+                retry_policy=policy,
+            )
+            return response, time.perf_counter() - started
+
+        pending = [index for index, batch in enumerate(batches) if len(batch) > 1]
+        sent = dict(zip(pending, self._map_concurrently(send, pending, max_workers=max_workers)))
+
+        merged_results: List[Dict[str, Any]] = []
+        for index, anchor in enumerate(anchors):
+            merged_results.append(anchor)
+            if index not in sent:
+                continue
+            response, seconds = sent[index]
+            responses.append(response)
+            timings.append({"phase": "body", "batch": index, "blocks": len(batches[index]) - 1, "seconds": seconds})
+            if isinstance(response, dict) and isinstance(response.get("results"), list):
+                merged_results.extend(response["results"])
+
+        return {
+            "object": "list",
+            "results": merged_results,
+            "batch_count": len(responses),
+            "responses": responses,
+            "batch_timings": timings,
+        }
+
+    def _prepare_append_blocks(
+        self,
+        body: Optional[Union[str, List[Dict[str, Any]]]],
+        blocks: Optional[List[Dict[str, Any]]],
+        sanitize: bool,
+        batch_size: int,
+        stream: bool = False,
+    ) -> tuple[Iterable[Dict[str, Any]], int]:
+        """Resolves append_page_body input into sanitized blocks and an effective batch size.
+
+        With `stream=True`, markdown is converted and sanitized lazily and an iterator is
+        returned; otherwise a list.
         """
         if body is None and blocks is not None:
             body = blocks
@@ -1725,29 +3319,26 @@ class NotionHelper:
         elif body is None:
             raise ValueError("Either body or blocks must be provided")
 
-        if isinstance(body, str):
-            payload_blocks = self._markdown_to_blocks(body)
-        elif isinstance(body, list):
-            payload_blocks = body
-        else:
+        if not isinstance(body, (str, list)):
             raise TypeError("body must be a markdown string or a list of Notion blocks")
-
-        if sanitize:
-            payload_blocks = self._sanitize_blocks(payload_blocks)
-
         if batch_size < 1:
             raise ValueError("batch_size must be >= 1")
-        batch_size = min(batch_size, 100)
 
-        url = f"https://api.notion.com/v1/blocks/{page_id}/children"
-        if not payload_blocks:
-            return {"object": "list", "results": []}
+        if stream:
+            payload_blocks: Iterable[Dict[str, Any]] = (
+                self._iter_markdown_to_blocks(body) if isinstance(body, str) else body
+            )
+            if sanitize:
+                payload_blocks = filter(None, map(self._sanitize_notion_block, payload_blocks))
+            return payload_blocks, min(batch_size, 100)
 
-        responses = []
-        for start_idx in range(0, len(payload_blocks), batch_size):
-            payload = {"children": payload_blocks[start_idx:start_idx + batch_size]}
-            responses.append(self._make_request("PATCH", url, payload))
+        payload_blocks = self._markdown_to_blocks(body) if isinstance(body, str) else body
+        if sanitize:
+            payload_blocks = self._sanitize_blocks(payload_blocks)
+        return payload_blocks, min(batch_size, 100)
 
+    def _merge_append_responses(self, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merges per-batch append responses into a single list response."""
         if len(responses) == 1:
             return responses[0]
 
@@ -1771,32 +3362,110 @@ class NotionHelper:
         start_cursor: Optional[str] = None,
         retry_policy: Optional[RetryPolicy] = None,
         request_timeout: Optional[float] = None,
+        prefetch: int = 0,
+        filter: Optional[FilterLike] = None,
+        sorts: Optional[List[SortLike]] = None,
+        filter_properties: Optional[List[str]] = None,
     ) -> Iterator[Dict[str, Any]]:
-        """Yields pages from a data source incrementally using cursor pagination."""
+        """Yields pages from a data source incrementally using cursor pagination.
+
+        With `prefetch > 0`, a background thread keeps up to `prefetch` result pages
+        (of at most `page_size` rows each) queued ahead of the consumer, so the next
+        query runs while the current batch is being processed.
+
+        `filter` and `sorts` are applied by Notion before results are returned; pass
+        Notion filter/sort JSON or build them with `notionhelper.filters`.
+        `filter_properties` lists property IDs to include in each returned page, so
+        other property values are not transferred.
+        """
+        for batch in self._data_source_batches(
+            data_source_id,
+            limit=limit,
+            page_size=page_size,
+            start_cursor=start_cursor,
+            retry_policy=retry_policy,
+            request_timeout=request_timeout,
+            prefetch=prefetch,
+            filter=filter,
+            sorts=sorts,
+            filter_properties=filter_properties,
+        ):
+            yield from batch
+
+    def _data_source_batches(
+        self,
+        data_source_id: str,
+        limit: Optional[int] = None,
+        page_size: int = 100,
+        start_cursor: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        request_timeout: Optional[float] = None,
+        prefetch: int = 0,
+        filter: Optional[FilterLike] = None,
+        sorts: Optional[List[SortLike]] = None,
+        filter_properties: Optional[List[str]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Validates query options and returns an iterator over result batches."""
         if page_size < 1:
             raise ValueError("page_size must be >= 1")
         page_size = min(page_size, 100)
         if limit is not None and limit < 0:
             raise ValueError("limit must be >= 0")
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
         if limit == 0:
-            return
+            return iter(())
+
+        query: Dict[str, Any] = {}
+        if filter is not None:
+            query["filter"] = compile_filter(filter)
+        if sorts:
+            query["sorts"] = compile_sorts(sorts)
+        params = {"filter_properties": list(filter_properties)} if filter_properties else None
+
+        batches = self._iter_data_source_result_batches(
+            data_source_id,
+            limit=limit,
+            page_size=page_size,
+            start_cursor=start_cursor,
+            retry_policy=retry_policy,
+            request_timeout=request_timeout,
+            query=query,
+            params=params,
+        )
+        if prefetch:
+            batches = self._prefetch(batches, prefetch)
+        return batches
 
+    def _iter_data_source_result_batches(
+        self,
+        data_source_id: str,
+        limit: Optional[int],
+        page_size: int,
+        start_cursor: Optional[str],
+        retry_policy: Optional[RetryPolicy],
+        request_timeout: Optional[float],
+        query: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yields the page objects of each data source query response."""
         url = f"https://api.notion.com/v1/data_sources/{data_source_id}/query"
         has_more = True
         cursor = start_cursor
-        yielded = 0
+        fetched = 0
 
         while has_more:
-            payload: Dict[str, Any] = {"page_size": page_size}
+            payload: Dict[str, Any] = {**(query or {}), "page_size": page_size}
             if cursor:
                 payload["start_cursor"] = cursor
             if limit is not None:
-                payload["page_size"] = min(page_size, limit - yielded)
+                payload["page_size"] = min(page_size, limit - fetched)
 
             response = self._make_request(
                 "POST",
                 url,
                 payload,
+                params=params,
                 retry_policy=retry_policy,
                 request_timeout=request_timeout,
             )
@@ -1804,19 +3473,59 @@ class NotionHelper:
             if not isinstance(results, list):
                 break
 
-            for page in results:
-                if not isinstance(page, dict):
-                    continue
-                yield page
-                yielded += 1
-                if limit is not None and yielded >= limit:
-                    return
+            batch = [page for page in results if isinstance(page, dict)]
+            if limit is not None:
+                batch = batch[:limit - fetched]
+            fetched += len(batch)
+            yield batch
+            if limit is not None and fetched >= limit:
+                return
 
             has_more = bool(response.get("has_more", False))
             cursor = response.get("next_cursor", None)
             if has_more and not cursor:
                 break
 
+    def _prefetch(self, items: Iterator[_T], depth: int) -> Iterator[_T]:
+        """Runs an iterator on a background thread, buffering up to `depth` items ahead.
+
+        Exceptions raised by the producer are re-raised in the consumer. Closing the
+        returned generator early stops the producer after its in-flight item.
+        """
+        buffer: "queue.Queue[tuple[str, Any]]" = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+
+        def put(item: tuple[str, Any]) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for item in items:
+                    if not put(("item", item)):
+                        return
+                put(("done", None))
+            except BaseException as exc:
+                put(("error", exc))
+
+        producer = threading.Thread(target=produce, name="notionhelper-prefetch", daemon=True)
+        producer.start()
+        try:
+            while True:
+                kind, value = buffer.get()
+                if kind == "done":
+                    return
+                if kind == "error":
+                    raise value
+                yield value
+        finally:
+            stop.set()
+
     def get_data_source_page_ids(
         self,
         data_source_id: str,
@@ -1859,104 +3568,146 @@ class NotionHelper:
         page: Dict[str, Any],
         include_page_ids: bool = True,
         utc: bool = True,
+        native_datetimes: bool = False,
     ) -> Dict[str, Any]:
         """Converts a raw page payload to a flat row record."""
-        properties = page.get("properties", {})
-        if not isinstance(properties, dict):
-            properties = {}
-
-        row: Dict[str, Any] = {}
-        if include_page_ids:
-            row["notion_page_id"] = page.get("id", "")
-
-        allowed_properties = {
-            "title",
-            "status",
-            "number",
-            "date",
-            "url",
-            "checkbox",
-            "rich_text",
-            "email",
-            "select",
-            "people",
-            "phone_number",
-            "multi_select",
-            "created_time",
-            "created_by",
-            "rollup",
-            "relation",
-            "last_edited_by",
-            "last_edited_time",
-            "formula",
-            "file",
+        return self._pages_to_records(
+            [page],
+            include_page_ids=include_page_ids,
+            utc=utc,
+            native_datetimes=native_datetimes,
+        )[0]
+
+    def _pages_to_records(
+        self,
+        pages: List[Dict[str, Any]],
+        include_page_ids: bool = True,
+        utc: bool = True,
+        native_datetimes: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Converts a chunk of raw page payloads to flat row records."""
+        extractor = self.compile_record_extractor(
+            {},
+            include_page_ids=include_page_ids,
+            utc=utc,
+            native_datetimes=native_datetimes,
+        )
+        return extractor.extract(pages)
+
+    def compile_record_extractor(
+        self,
+        schema: Dict[str, Any],
+        columns: Optional[List[str]] = None,
+        include_page_ids: bool = True,
+        utc: bool = True,
+        native_datetimes: bool = False,
+    ) -> CompiledRecordExtractor:
+        """Builds a reusable row extractor for one data source schema.
+
+        Parameters:
+            schema (dict): A `get_data_source(...)` response, its `properties` mapping, or
+                a page's `properties`. Properties seen later on pages are added on the fly,
+                so `{}` compiles from the first page converted.
+            columns (list, optional): Property names to extract. Other properties are
+                skipped without being read. None extracts every supported property.
+            include_page_ids (bool): Adds a `notion_page_id` column.
+            utc (bool): Normalize datetimes to UTC.
+            native_datetimes (bool): Return datetime cells as pandas Timestamps instead of
+                ISO 8601 strings.
+
+        Returns:
+            CompiledRecordExtractor: Call `.extract(pages)` to convert a list of pages.
+        """
+        properties = schema if isinstance(schema, dict) else {}
+        if "object" in properties and isinstance(properties.get("properties"), dict):
+            properties = properties["properties"]
+        parse_datetimes = self.parse_datetime_utc_batch if native_datetimes else self.normalize_datetime_iso_batch
+        return CompiledRecordExtractor(
+            properties,
+            extractors=self._property_extractors,
+            parse_datetimes=lambda values, use_utc: parse_datetimes(values, utc=use_utc),
+            skip=_SKIP,
+            columns=columns,
+            include_page_ids=include_page_ids,
+            utc=utc,
+            native_datetimes=native_datetimes,
+        )
+
+    def _build_property_extractors(self) -> Dict[str, Callable[[Dict[str, Any], bool], Any]]:
+        """Maps each record property type to its value extractor."""
+        return {
+            "title": self._extract_title,
+            "status": self._extract_status,
+            "number": self._extract_number,
+            "date": self._extract_date,
+            "url": lambda value, utc: value.get("url", ""),
+            "checkbox": lambda value, utc: value.get("checkbox", False),
+            "rich_text": self._extract_rich_text_property,
+            "email": lambda value, utc: value.get("email", ""),
+            "select": self._extract_select,
+            "people": self._extract_people,
+            "phone_number": lambda value, utc: value.get("phone_number", ""),
+            "multi_select": self._extract_multi_select,
+            "created_time": lambda value, utc: self.normalize_datetime_iso(value.get("created_time", ""), utc=utc),
+            "created_by": lambda value, utc: (value.get("created_by") or {}).get("name", ""),
+            "rollup": self._extract_rollup,
+            "relation": lambda value, utc: [relation.get("id", "") for relation in value.get("relation") or []],
+            "last_edited_by": lambda value, utc: (value.get("last_edited_by") or {}).get("name", ""),
+            "last_edited_time": lambda value, utc: self.normalize_datetime_iso(value.get("last_edited_time", ""), utc=utc),
+            "formula": self._extract_formula,
+            "file": lambda value, utc: [file.get("name", "") for file in value.get("files") or []],
         }
 
-        for key, value in properties.items():
-            if not isinstance(value, dict):
-                continue
-            property_type = value.get("type", "")
-            if property_type not in allowed_properties:
-                continue
-            if property_type == "title":
-                title_list = value.get("title", [])
-                row[key] = title_list[0].get("plain_text", "") if title_list else ""
-            elif property_type == "status":
-                row[key] = value.get("status", {}).get("name", "")
-            elif property_type == "number":
-                number_value = value.get("number", None)
-                row[key] = float(number_value) if isinstance(number_value, (int, float)) else None
-            elif property_type == "date":
-                date_field = self.normalize_notion_date(value.get("date", {}), utc=utc)
-                row[key] = date_field.get("start", "") if date_field else ""
-            elif property_type == "url":
-                row[key] = value.get("url", "")
-            elif property_type == "checkbox":
-                row[key] = value.get("checkbox", False)
-            elif property_type == "rich_text":
-                rich_text_field = value.get("rich_text", [])
-                row[key] = rich_text_field[0].get("plain_text", "") if rich_text_field else ""
-            elif property_type == "email":
-                row[key] = value.get("email", "")
-            elif property_type == "select":
-                select_field = value.get("select", {})
-                row[key] = select_field.get("name", "") if select_field else ""
-            elif property_type == "people":
-                people_list = value.get("people", [])
-                if people_list:
-                    person = people_list[0]
-                    row[key] = {"name": person.get("name", ""), "email": person.get("person", {}).get("email", "")}
-            elif property_type == "phone_number":
-                row[key] = value.get("phone_number", "")
-            elif property_type == "multi_select":
-                multi_select_field = value.get("multi_select", [])
-                row[key] = [item.get("name", "") for item in multi_select_field]
-            elif property_type == "created_time":
-                row[key] = self.normalize_datetime_iso(value.get("created_time", ""), utc=utc)
-            elif property_type == "created_by":
-                created_by = value.get("created_by", {})
-                row[key] = created_by.get("name", "")
-            elif property_type == "rollup":
-                rollup_field = value.get("rollup", {}).get("array", [])
-                row[key] = [
-                    self.normalize_notion_date(item.get("date", {}), utc=utc).get("start", "")
-                    for item in rollup_field
-                ]
-            elif property_type == "relation":
-                relation_list = value.get("relation", [])
-                row[key] = [relation.get("id", "") for relation in relation_list]
-            elif property_type == "last_edited_by":
-                last_edited_by = value.get("last_edited_by", {})
-                row[key] = last_edited_by.get("name", "")
-            elif property_type == "last_edited_time":
-                row[key] = self.normalize_datetime_iso(value.get("last_edited_time", ""), utc=utc)
-            elif property_type == "formula":
-                formula_value = value.get("formula", {})
-                row[key] = formula_value.get(formula_value.get("type", ""), "")
-            elif property_type == "file":
-                files = value.get("files", [])
-                row[key] = [file.get("name", "") for file in files]
-        return row
+    def _extract_property_value(self, property_type: str, value: Dict[str, Any], utc: bool = True) -> Any:
+        """Flattens one page property value; returns `_SKIP` when the property yields no column."""
+        extractor = self._property_extractors.get(property_type)
+        if extractor is None:
+            return _SKIP
+        return extractor(value, utc)
+
+    def _extract_title(self, value: Dict[str, Any], utc: bool = True) -> str:
+        title_list = value.get("title") or []
+        return title_list[0].get("plain_text", "") if title_list else ""
+
+    def _extract_status(self, value: Dict[str, Any], utc: bool = True) -> str:
+        return (value.get("status") or {}).get("name", "")
+
+    def _extract_number(self, value: Dict[str, Any], utc: bool = True) -> Optional[float]:
+        number_value = value.get("number", None)
+        return float(number_value) if isinstance(number_value, (int, float)) else None
+
+    def _extract_date(self, value: Dict[str, Any], utc: bool = True) -> Optional[str]:
+        date_field = self.normalize_notion_date(value.get("date", {}), utc=utc)
+        return date_field.get("start", "") if date_field else ""
+
+    def _extract_rich_text_property(self, value: Dict[str, Any], utc: bool = True) -> str:
+        rich_text_field = value.get("rich_text") or []
+        return rich_text_field[0].get("plain_text", "") if rich_text_field else ""
+
+    def _extract_select(self, value: Dict[str, Any], utc: bool = True) -> str:
+        select_field = value.get("select", {})
+        return select_field.get("name", "") if select_field else ""
+
+    def _extract_people(self, value: Dict[str, Any], utc: bool = True) -> Any:
+        people_list = value.get("people") or []
+        if not people_list:
+            return _SKIP
+        person = people_list[0]
+        return {"name": person.get("name", ""), "email": (person.get("person") or {}).get("email", "")}
+
+    def _extract_multi_select(self, value: Dict[str, Any], utc: bool = True) -> List[str]:
+        return [item.get("name", "") for item in value.get("multi_select") or []]
+
+    def _extract_rollup(self, value: Dict[str, Any], utc: bool = True) -> List[Any]:
+        rollup_field = (value.get("rollup") or {}).get("array") or []
+        return [
+            self.normalize_notion_date(item.get("date", {}), utc=utc).get("start", "")
+            for item in rollup_field
+        ]
+
+    def _extract_formula(self, value: Dict[str, Any], utc: bool = True) -> Any:
+        formula_value = value.get("formula") or {}
+        return formula_value.get(formula_value.get("type", ""), "")
 
     def iter_data_source_page_records(
         self,
@@ -1968,8 +3719,30 @@ class NotionHelper:
         start_cursor: Optional[str] = None,
         retry_policy: Optional[RetryPolicy] = None,
         request_timeout: Optional[float] = None,
+        prefetch: int = 0,
+        native_datetimes: bool = False,
+        columns: Optional[List[str]] = None,
+        filter: Optional[FilterLike] = None,
+        sorts: Optional[List[SortLike]] = None,
+        filter_properties: Optional[List[str]] = None,
     ) -> Iterator[Dict[str, Any]]:
-        """Yields flattened row records from a data source before dataframe conversion."""
+        """Yields flattened row records from a data source before dataframe conversion.
+
+        Rows are built by one `compile_record_extractor` plan reused across every page.
+        Pages are converted in chunks of `page_size` so datetime cells are parsed in
+        one batch per chunk. With native_datetimes=True, datetime cells are pandas
+        Timestamps (None when empty) rather than ISO 8601 strings. Pass `columns` to
+        extract only those properties. `filter`, `sorts` and `filter_properties` are
+        passed to `iter_data_source_pages`.
+        """
+        extractor = self.compile_record_extractor(
+            {},
+            columns=columns,
+            include_page_ids=include_page_ids,
+            utc=utc,
+            native_datetimes=native_datetimes,
+        )
+        chunk: List[Dict[str, Any]] = []
         for page in self.iter_data_source_pages(
             data_source_id=data_source_id,
             limit=limit,
@@ -1977,8 +3750,17 @@ class NotionHelper:
             start_cursor=start_cursor,
             retry_policy=retry_policy,
             request_timeout=request_timeout,
+            prefetch=prefetch,
+            filter=filter,
+            sorts=sorts,
+            filter_properties=filter_properties,
         ):
-            yield self._page_properties_to_record(page, include_page_ids=include_page_ids, utc=utc)
+            chunk.append(page)
+            if len(chunk) >= page_size:
+                yield from extractor.extract(chunk)
+                chunk = []
+        if chunk:
+            yield from extractor.extract(chunk)
 
     def get_data_source_pages_as_dataframe(
         self,
@@ -1988,6 +3770,13 @@ class NotionHelper:
         utc: bool = True,
         retry_policy: Optional[RetryPolicy] = None,
         request_timeout: Optional[float] = None,
+        prefetch: int = 0,
+        columnar: bool = False,
+        native_datetimes: bool = False,
+        columns: Optional[List[str]] = None,
+        filter: Optional[FilterLike] = None,
+        sorts: Optional[List[SortLike]] = None,
+        filter_properties: Optional[List[str]] = None,
     ) -> pd.DataFrame:
         """Retrieves all pages from a Notion data source and returns them as a Pandas DataFrame.
 
@@ -2004,11 +3793,55 @@ class NotionHelper:
                                   Defaults to True.
             retry_policy (RetryPolicy, optional): Per-call retry policy override.
             request_timeout (float, optional): Per-call timeout override.
+            prefetch (int, optional): Number of result pages to fetch ahead in the background
+                while rows are being converted. 0 disables read-ahead.
+            columnar (bool, optional): If True, read the data source schema first and append each
+                batch of results straight into typed column buffers: float64 for number, bool for
+                checkbox, datetime64[ns, UTC] for date/created_time/last_edited_time and categorical
+                for select/status. Avoids building one dict per row. Defaults to False.
+            native_datetimes (bool, optional): If True, date/created_time/last_edited_time
+                columns are returned as datetime64 instead of ISO 8601 strings. Columnar
+                frames always use datetime64. Defaults to False.
+            columns (list, optional): Property names to include. Other properties are skipped
+                during extraction. Defaults to None (all supported properties).
+            filter (Filter or dict, optional): Server-side filter, e.g.
+                `Property("Stage").status == "Done"` from `notionhelper.filters`.
+            sorts (list, optional): Server-side sort order, e.g. `[descending("Due")]`.
+            filter_properties (list, optional): Property IDs Notion should return for each
+                page. Cuts payload size on wide data sources.
 
         Returns:
             pandas.DataFrame: A DataFrame where each row represents a page with columns corresponding to page properties.
                               If include_page_ids is True, an additional column 'notion_page_id' is included.
         """
+        if columnar:
+            schema = self.get_data_source(data_source_id).get("properties", {})
+            schema = schema if isinstance(schema, dict) else {}
+            if columns is not None:
+                schema = {name: definition for name, definition in schema.items() if name in columns}
+            builder = ColumnarFrameBuilder(
+                schema,
+                extract_value=self._extract_property_value,
+                allowed_types=RECORD_PROPERTY_TYPES,
+                skip=_SKIP,
+                include_page_ids=include_page_ids,
+                utc=utc,
+            )
+            for batch in self._data_source_batches(
+                data_source_id,
+                limit=limit,
+                retry_policy=retry_policy,
+                request_timeout=request_timeout,
+                prefetch=prefetch,
+                filter=filter,
+                sorts=sorts,
+                filter_properties=filter_properties,
+            ):
+                builder.append(batch)
+            df = builder.build()
+            pd.options.display.float_format = "{:.3f}".format
+            return df
+
         records = list(
             self.iter_data_source_page_records(
                 data_source_id=data_source_id,
@@ -2017,54 +3850,253 @@ class NotionHelper:
                 utc=utc,
                 retry_policy=retry_policy,
                 request_timeout=request_timeout,
+                prefetch=prefetch,
+                native_datetimes=native_datetimes,
+                columns=columns,
+                filter=filter,
+                sorts=sorts,
+                filter_properties=filter_properties,
             )
         )
         df = pd.DataFrame(records)
         pd.options.display.float_format = "{:.3f}".format
         return df
 
-    def upload_file(self, file_path: str) -> Dict[str, Any]:
-        """Uploads a file to Notion and returns the file upload object."""
+    def sync_data_source(
+        self,
+        data_source_id: str,
+        snapshot: Union[str, "os.PathLike[str]", SQLiteSnapshot],
+        full_refresh: bool = False,
+        page_size: int = 100,
+        retry_policy: Optional[RetryPolicy] = None,
+        request_timeout: Optional[float] = None,
+        prefetch: int = 0,
+    ) -> SyncResult:
+        """Incrementally syncs a data source into a local SQLite snapshot.
+
+        The first run (or `full_refresh=True`) reads every page. Later runs query only
+        pages whose `last_edited_time` is on or after the stored watermark, merge them
+        into the snapshot and return the delta. Pages returned again at the watermark
+        timestamp without changes are not reported.
+
+        Parameters:
+            data_source_id (str): The identifier of the Notion data source.
+            snapshot (str, PathLike or SQLiteSnapshot): SQLite file path, or an open snapshot.
+            full_refresh (bool): Re-read everything and also report pages that disappeared
+                (deleted or moved to trash) as `removed`. Incremental runs cannot see removals.
+            page_size (int): Query page size.
+            retry_policy (RetryPolicy, optional): Per-call retry policy override.
+            request_timeout (float, optional): Per-call timeout override.
+            prefetch (int): Result pages to read ahead in the background.
+
+        Returns:
+            SyncResult: `added`/`updated` raw pages, `removed` page IDs and the new watermark.
+        """
+        store = snapshot if isinstance(snapshot, SQLiteSnapshot) else SQLiteSnapshot(snapshot)
+        try:
+            watermark = store.get_watermark(data_source_id)
+            incremental = watermark is not None and not full_refresh
+            result = SyncResult(
+                data_source_id=data_source_id,
+                watermark=watermark if incremental else None,
+                full_refresh=not incremental,
+            )
+            seen: set = set()
+            newest = self.parse_datetime_utc(result.watermark) if result.watermark else None
+
+            for page in self.iter_data_source_pages(
+                data_source_id,
+                page_size=page_size,
+                retry_policy=retry_policy,
+                request_timeout=request_timeout,
+                prefetch=prefetch,
+                filter=last_edited_time().on_or_after(watermark) if incremental else None,
+            ):
+                page_id = page.get("id")
+                if not page_id:
+                    continue
+                seen.add(page_id)
+                previous = store.get_page(data_source_id, page_id)
+                if previous is None:
+                    result.added.append(page)
+                elif previous != page:
+                    result.updated.append(page)
+
+                edited_at = self.parse_datetime_utc(page.get("last_edited_time"))
+                if edited_at is not None and (newest is None or edited_at > newest):
+                    newest = edited_at
+                    result.watermark = self.normalize_datetime_iso(edited_at)
+
+            if not incremental:
+                result.removed = sorted(store.page_ids(data_source_id) - seen)
+            store.apply(
+                data_source_id,
+                result.changed,
+                result.removed,
+                result.watermark,
+            )
+            return result
+        finally:
+            if store is not snapshot:
+                store.close()
+
+    def upload_file(
+        self,
+        file_path: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        part_size: int = DEFAULT_UPLOAD_PART_SIZE,
+    ) -> Dict[str, Any]:
+        """Uploads a file to Notion and returns the file upload object.
+
+        Files larger than 20MB are sent with `upload_file_multipart`, which streams
+        them from disk in `part_size` parts and can resume an interrupted upload.
+        `progress_callback(bytes_sent, total_bytes)` is called after each part, or once
+        when a single-part upload completes.
+        """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
+        total_bytes = os.path.getsize(file_path) if os.path.isfile(file_path) else 0
+        multi_part = total_bytes > MULTI_PART_UPLOAD_THRESHOLD
+        if multi_part:
+            self._check_upload_part_size(total_bytes, part_size)
 
         try:
+            if multi_part:
+                return self.upload_file_multipart(file_path, part_size=part_size, progress_callback=progress_callback)
+
             # Step 1: Create a File Upload object
-            create_upload_url = "https://api.notion.com/v1/file_uploads"
-            headers = {
-                "Authorization": f"Bearer {self.notion_token}",
-                "Content-Type": "application/json",
-                "Notion-Version": "2025-09-03",
-            }
-            response = requests.post(create_upload_url, headers=headers, json={})
-            response.raise_for_status()
-            upload_data = response.json()
+            upload_data = self._make_request("POST", FILE_UPLOADS_URL, {})
             upload_url = upload_data["upload_url"]
 
             # Step 2: Upload file contents
             with open(file_path, "rb") as f:
-                upload_headers = {
-                    "Authorization": f"Bearer {self.notion_token}",
-                    "Notion-Version": "2025-09-03",
-                }
                 files = {'file': (os.path.basename(file_path), f, mimetypes.guess_type(file_path)[0] or 'application/octet-stream')}
-                upload_response = requests.post(upload_url, headers=upload_headers, files=files)
-                upload_response.raise_for_status()
-
-            return upload_response.json()
-        except requests.RequestException as e:
-            raise Exception(f"Failed to upload file {file_path}: {str(e)}")
+                result = self._make_request("POST", upload_url, files=files)
+            if progress_callback is not None:
+                progress_callback(total_bytes, total_bytes)
+            return result
+        except NotionAPIError as e:
+            raise Exception(f"Failed to upload file {file_path}: {str(e)}") from e
         except Exception as e:
-            raise Exception(f"Error uploading file {file_path}: {str(e)}")
+            raise Exception(f"Error uploading file {file_path}: {str(e)}") from e
+
+    def upload_file_multipart(
+        self,
+        file_path: str,
+        part_size: int = DEFAULT_UPLOAD_PART_SIZE,
+        state_path: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """Uploads a file with Notion's multi-part mode and returns the completed file upload object.
+
+        The file is read one part at a time, so memory use is bounded by `part_size`
+        (Notion accepts 5-20MB for every part but the last). Each part is sent through
+        `_make_request` and shares the retry policy. Completed parts are recorded in a
+        JSON state file. After a crash, calling this again for the same unchanged file
+        resumes with the first part not yet sent, as long as Notion still has the
+        pending upload.
+
+        Parameters:
+            file_path (str): Path of the file to upload.
+            part_size (int): Bytes per part.
+            state_path (str, optional): Resume state file. Defaults to
+                `<file_path>.notion-upload.json`; it is removed once the upload completes.
+            progress_callback (callable, optional): Called as `progress_callback(bytes_sent, total_bytes)`
+                after each part, including parts skipped on resume.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        stat = os.stat(file_path)
+        total_bytes = stat.st_size
+        self._check_upload_part_size(total_bytes, part_size)
+        number_of_parts = max(1, math.ceil(total_bytes / part_size))
+        filename = os.path.basename(file_path)
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        state_path = state_path or f"{file_path}.notion-upload.json"
+        fingerprint = {
+            "size": total_bytes,
+            "mtime_ns": stat.st_mtime_ns,
+            "part_size": part_size,
+            "number_of_parts": number_of_parts,
+        }
+
+        state = self._load_upload_state(state_path, fingerprint)
+        if state is None:
+            upload = self._make_request(
+                "POST",
+                FILE_UPLOADS_URL,
+                {
+                    "mode": "multi_part",
+                    "number_of_parts": number_of_parts,
+                    "filename": filename,
+                    "content_type": content_type,
+                },
+            )
+            state = {**fingerprint, "file_upload_id": upload["id"], "completed_parts": []}
+            self._save_upload_state(state_path, state)
+        upload_id = state["file_upload_id"]
+        completed = set(state["completed_parts"])
+
+        with open(file_path, "rb") as handle:
+            for part_number in range(1, number_of_parts + 1):
+                offset = (part_number - 1) * part_size
+                if part_number not in completed:
+                    handle.seek(offset)
+                    chunk = handle.read(part_size)
+                    self._make_request(
+                        "POST",
+                        f"{FILE_UPLOADS_URL}/{upload_id}/send",
+                        {"part_number": str(part_number)},
+                        files={"file": (filename, chunk, content_type)},
+                    )
+                    completed.add(part_number)
+                    state["completed_parts"] = sorted(completed)
+                    self._save_upload_state(state_path, state)
+                if progress_callback is not None:
+                    progress_callback(min(offset + part_size, total_bytes), total_bytes)
+
+        result = self._make_request("POST", f"{FILE_UPLOADS_URL}/{upload_id}/complete", {})
+        try:
+            os.remove(state_path)
+        except OSError:
+            pass
+        return result
+
+    def _check_upload_part_size(self, total_bytes: int, part_size: int) -> None:
+        """Raises ValueError for a part size Notion would reject for a file of this size."""
+        if part_size < 1 or part_size > MAX_UPLOAD_PART_SIZE:
+            raise ValueError("part_size must be at most 20MB")
+        if total_bytes > part_size and part_size < MIN_UPLOAD_PART_SIZE:
+            raise ValueError("part_size must be at least 5MB when a file needs more than one part")
+
+    def _load_upload_state(self, state_path: str, fingerprint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Returns saved multi-part state if it matches the file and Notion still has the upload pending."""
+        try:
+            with open(state_path, "r", encoding="utf-8") as handle:
+                state = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or any(state.get(key) != value for key, value in fingerprint.items()):
+            return None
+        try:
+            upload = self._make_request("GET", f"{FILE_UPLOADS_URL}/{state.get('file_upload_id')}")
+        except NotionAPIError:
+            return None
+        return state if upload.get("status") == "pending" else None
+
+    def _save_upload_state(self, state_path: str, state: Dict[str, Any]) -> None:
+        """Writes multi-part resume state atomically; a state file that cannot be written only disables resume."""
+        temp_path = f"{state_path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump(state, handle)
+            os.replace(temp_path, state_path)
+        except OSError as exc:
+            LOGGER.warning("Could not write upload state %s: %s", state_path, exc)
 
     def attach_file_to_page(self, page_id: str, file_upload_id: str) -> Dict[str, Any]:
         """Attaches an uploaded file to a specific page."""
         attach_url = f"https://api.notion.com/v1/blocks/{page_id}/children"
-        headers = {
-            "Authorization": f"Bearer {self.notion_token}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2025-09-03",
-        }
         data = {
             "children": [
                 {
@@ -2078,17 +4110,11 @@ class NotionHelper:
                 }
             ]
         }
-        response = requests.patch(attach_url, headers=headers, json=data)
-        return response.json()
+        return self._make_request("PATCH", attach_url, data)
 
     def embed_image_to_page(self, page_id: str, file_upload_id: str) -> Dict[str, Any]:
         """Embeds an uploaded image to a specific page."""
         attach_url = f"https://api.notion.com/v1/blocks/{page_id}/children"
-        headers = {
-            "Authorization": f"Bearer {self.notion_token}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2025-09-03",
-        }
         data = {
             "children": [
                 {
@@ -2102,19 +4128,13 @@ class NotionHelper:
                 }
             ]
         }
-        response = requests.patch(attach_url, headers=headers, json=data)
-        return response.json()
+        return self._make_request("PATCH", attach_url, data)
 
     def attach_file_to_page_property(
         self, page_id: str, property_name: str, file_upload_id: str, file_name: str
     ) -> Dict[str, Any]:
         """Attaches a file to a Files & Media property on a specific page."""
         update_url = f"https://api.notion.com/v1/pages/{page_id}"
-        headers = {
-            "Authorization": f"Bearer {self.notion_token}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2025-09-03",
-        }
         data = {
             "properties": {
                 property_name: {
@@ -2128,8 +4148,7 @@ class NotionHelper:
                 }
             }
         }
-        response = requests.patch(update_url, headers=headers, json=data)
-        return response.json()
+        return self._make_request("PATCH", update_url, data)
 
     def one_step_image_embed(self, page_id: str, file_path: str) -> Dict[str, Any]:
         """Uploads an image and embeds it in a Notion page in one step."""
@@ -2180,11 +4199,6 @@ class NotionHelper:
 
         # 3. Update the page property with the full list
         update_url = f"https://api.notion.com/v1/pages/{page_id}"
-        headers = {
-            "Authorization": f"Bearer {self.notion_token}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2025-09-03",
-        }
         data = {
             "properties": {
                 property_name: {
@@ -2192,5 +4206,4 @@ class NotionHelper:
                 }
             }
         }
-        response = requests.patch(update_url, headers=headers, json=data)
-        return response.json()
+        return self._make_request("PATCH", update_url, data)
@@ -0,0 +1,122 @@
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+import os
+import sqlite3
+import threading
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_keys (
+    data_source_id TEXT NOT NULL,
+    key_property TEXT NOT NULL,
+    key TEXT NOT NULL,
+    page_id TEXT NOT NULL,
+    PRIMARY KEY (data_source_id, key_property, key)
+);
+CREATE INDEX IF NOT EXISTS page_keys_page_id ON page_keys (page_id);
+CREATE TABLE IF NOT EXISTS built_indexes (
+    data_source_id TEXT NOT NULL,
+    key_property TEXT NOT NULL,
+    PRIMARY KEY (data_source_id, key_property)
+);
+"""
+
+
+class KeyIndex:
+    """Local key property value -> page ID index used by `NotionHelper.upsert_page`.
+
+    One index is kept per (data_source_id, key_property). It is built once from a
+    query projected to the key property and then kept current from the pages returned
+    by creates and updates. Stored in SQLite: pass a file path to persist it between
+    runs, or ":memory:" (the default) for a per-process index. Safe to share between
+    threads.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"] = ":memory:") -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "KeyIndex":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+
+    def is_built(self, data_source_id: str, key_property: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM built_indexes WHERE data_source_id = ? AND key_property = ?",
+                (data_source_id, key_property),
+            ).fetchone()
+        return row is not None
+
+    def get(self, data_source_id: str, key_property: str, key: str) -> Optional[str]:
+        """Returns the page ID stored for a key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT page_id FROM page_keys WHERE data_source_id = ? AND key_property = ? AND key = ?",
+                (data_source_id, key_property, key),
+            ).fetchone()
+        return row[0] if row else None
+
+    def items(self, data_source_id: str, key_property: str) -> Dict[str, str]:
+        """Returns every key -> page ID pair of one index."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, page_id FROM page_keys WHERE data_source_id = ? AND key_property = ?",
+                (data_source_id, key_property),
+            ).fetchall()
+        return dict(rows)
+
+    def set(self, data_source_id: str, key_property: str, key: str, page_id: str) -> None:
+        """Points a key at a page, dropping any other key that pointed at the same page."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM page_keys WHERE data_source_id = ? AND key_property = ? AND page_id = ? AND key != ?",
+                (data_source_id, key_property, page_id, key),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO page_keys (data_source_id, key_property, key, page_id) VALUES (?, ?, ?, ?)",
+                (data_source_id, key_property, key, page_id),
+            )
+
+    def replace(self, data_source_id: str, key_property: str, entries: Iterable[Tuple[str, str]]) -> None:
+        """Replaces one index with (key, page_id) pairs and marks it built, in one transaction.
+
+        When a key appears more than once, the first page wins.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM page_keys WHERE data_source_id = ? AND key_property = ?",
+                (data_source_id, key_property),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO page_keys (data_source_id, key_property, key, page_id) VALUES (?, ?, ?, ?)",
+                [(data_source_id, key_property, key, page_id) for key, page_id in entries],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO built_indexes (data_source_id, key_property) VALUES (?, ?)",
+                (data_source_id, key_property),
+            )
+
+    def remove_page(self, page_id: str) -> None:
+        """Drops a page from every index, e.g. after it was trashed."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM page_keys WHERE page_id = ?", (page_id,))
+
+    def invalidate(self, data_source_id: Optional[str] = None, key_property: Optional[str] = None) -> None:
+        """Drops one index, every index of a data source, or (with no arguments) all of them."""
+        where, params = "", ()
+        if data_source_id is not None:
+            where, params = " WHERE data_source_id = ?", (data_source_id,)
+            if key_property is not None:
+                where += " AND key_property = ?"
+                params += (key_property,)
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM page_keys{where}", params)
+            self._conn.execute(f"DELETE FROM built_indexes{where}", params)
@@ -0,0 +1,140 @@
+from array import array
+from typing import Dict, List, Optional, Tuple
+import math
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+
+WINDOW_COLUMNS = ["metric", "step_start", "step_end", "count", "min", "max", "mean", "last"]
+
+
+class MetricBuffer:
+    """Per-step metric values of one run, waiting to be flushed to Notion.
+
+    Each metric keeps its steps and values in two `array("d")` buffers (8 bytes per
+    number), so a long training loop can log every step without building Python
+    objects per point. `snapshot()` and `discard()` let a writer send the buffered
+    points and drop only what was sent, so points logged during a flush (or left by a
+    failed one) stay for the next flush. Safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._steps: Dict[str, array] = {}
+        self._values: Dict[str, array] = {}
+        self._next_step: Dict[str, float] = {}
+        self._size = 0
+        self.started: Optional[float] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, name: str, value: float, step: Optional[float] = None) -> float:
+        """Buffers one point and returns its step; `step` defaults to the metric's previous step + 1."""
+        value = float(value)
+        with self._lock:
+            if step is None:
+                step = self._next_step.get(name, 0.0)
+            step = float(step)
+            if name not in self._steps:
+                self._steps[name] = array("d")
+                self._values[name] = array("d")
+            self._steps[name].append(step)
+            self._values[name].append(value)
+            self._next_step[name] = step + 1
+            self._size += 1
+            if self.started is None:
+                self.started = time.monotonic()
+        return step
+
+    def snapshot(self) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Returns copies of the buffered (steps, values) per metric, in logging order."""
+        with self._lock:
+            return {
+                name: (np.array(steps, dtype=np.float64), np.array(self._values[name], dtype=np.float64))
+                for name, steps in self._steps.items()
+                if steps
+            }
+
+    def discard(self, counts: Dict[str, int]) -> None:
+        """Drops the first `counts[name]` points of each metric, e.g. after they were written."""
+        with self._lock:
+            for name, count in counts.items():
+                count = min(count, len(self._steps.get(name, ())))
+                if count:
+                    del self._steps[name][:count]
+                    del self._values[name][:count]
+                    self._size -= count
+            self.started = time.monotonic() if self._size else None
+
+
+def aggregate_windows(name: str, steps: np.ndarray, values: np.ndarray, max_rows: int = 100) -> pd.DataFrame:
+    """Summarizes one metric's points as at most `max_rows` windows of consecutive points.
+
+    Every window holds the same number of points (the last may be shorter) and reports its
+    first and last step, point count, min, max, mean and last value.
+    """
+    if max_rows < 1:
+        raise ValueError("max_rows must be >= 1")
+    size = len(values)
+    if size == 0:
+        return pd.DataFrame(columns=WINDOW_COLUMNS)
+    window = math.ceil(size / max_rows)
+    starts = np.arange(0, size, window)
+    ends = np.minimum(starts + window, size) - 1
+    counts = ends - starts + 1
+    return pd.DataFrame(
+        {
+            "metric": name,
+            "step_start": steps[starts],
+            "step_end": steps[ends],
+            "count": counts,
+            "min": np.minimum.reduceat(values, starts),
+            "max": np.maximum.reduceat(values, starts),
+            "mean": np.add.reduceat(values, starts) / counts,
+            "last": values[ends],
+        },
+        columns=WINDOW_COLUMNS,
+    )
+
+
+def window_table_blocks(name: str, windows: pd.DataFrame) -> List[Dict]:
+    """Renders aggregated windows as a heading plus a Notion table block."""
+    header = ["Step", "Min", "Max", "Mean", "Last"]
+    rows = [header]
+    for window in windows.itertuples(index=False):
+        step = _format_step(window.step_start)
+        if window.step_end != window.step_start:
+            step = f"{step}–{_format_step(window.step_end)}"
+        rows.append([step] + [f"{value:.6g}" for value in (window.min, window.max, window.mean, window.last)])
+    first, last = _format_step(windows["step_start"].iloc[0]), _format_step(windows["step_end"].iloc[-1])
+    heading = {
+        "object": "block",
+        "type": "heading_3",
+        "heading_3": {"rich_text": [{"type": "text", "text": {"content": f"{name} (steps {first}–{last})"}}]},
+    }
+    table = {
+        "object": "block",
+        "type": "table",
+        "table": {
+            "table_width": len(header),
+            "has_column_header": True,
+            "has_row_header": False,
+            "children": [
+                {
+                    "object": "block",
+                    "type": "table_row",
+                    "table_row": {"cells": [[{"type": "text", "text": {"content": cell}}] for cell in row]},
+                }
+                for row in rows
+            ],
+        },
+    }
+    return [heading, table]
+
+
+def _format_step(step: float) -> str:
+    return str(int(step)) if float(step).is_integer() else f"{step:g}"
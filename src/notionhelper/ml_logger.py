@@ -1,10 +1,17 @@
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable
 import pandas as pd
 import numpy as np
 import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 
+from .filters import Property, ascending, descending
 from .helper import NotionHelper
+from .metric_buffer import MetricBuffer, aggregate_windows, window_table_blocks
+from .spool import ExperimentSpool, SpooledRun
 
 
 class MLNotionHelper(NotionHelper):
@@ -17,9 +24,31 @@ class MLNotionHelper(NotionHelper):
     Methods
     -------
     log_ml_experiment(data_source_id, config, metrics, plots, target_metric,
-                     higher_is_better, file_paths, file_property_name):
+                     higher_is_better, file_paths, file_property_name, max_workers,
+                     background_uploads):
         Logs an ML experiment run with metrics, plots, and artifacts.
 
+    wait_for_uploads(timeout):
+        Waits for uploads started with background_uploads=True.
+
+    start_background_logging(spool_path, ...):
+        Starts a worker that writes queued runs to Notion from a durable local spool.
+
+    queue_ml_experiment(data_source_id, config, metrics, ...):
+        Queues a run for the background worker and returns immediately.
+
+    flush(timeout):
+        Waits until every queued run has been written (or given up on).
+
+    invalidate_leaderboard(data_source_id):
+        Drops cached best scores so the next run re-queries them.
+
+    log_metric(run, name, value, step):
+        Buffers one step of a metric curve for a run page.
+
+    flush_metrics(run, format, max_rows):
+        Writes buffered metric curves to their run pages as aggregated windows.
+
     create_ml_database(parent_page_id, db_title, config, metrics, file_property_name):
         Creates a new Notion database optimized for ML experiment tracking.
 
@@ -30,6 +59,49 @@ class MLNotionHelper(NotionHelper):
         Converts a dictionary into Notion property values.
     """
 
+    def __init__(
+        self,
+        *args: Any,
+        leaderboard_ttl: Optional[float] = 300.0,
+        metric_flush_every: int = 1000,
+        metric_flush_interval: Optional[float] = 60.0,
+        metric_max_rows: int = 100,
+        metric_format: str = "table",
+        **kwargs: Any,
+    ):
+        """Accepts the `NotionHelper` arguments plus:
+
+        Parameters:
+            leaderboard_ttl (float, optional): Seconds a cached best score is trusted before it
+                is re-queried, to pick up runs logged elsewhere. None keeps it until
+                `invalidate_leaderboard()`.
+            metric_flush_every (int): `log_metric` flushes a run once it buffers this many points.
+            metric_flush_interval (float, optional): ...or once its oldest buffered point is this
+                many seconds old. None flushes on size only.
+            metric_max_rows (int): Windows per metric and flush; points are aggregated to fit.
+            metric_format (str): How flushes are written: "table", "csv" or "parquet".
+        """
+        super().__init__(*args, **kwargs)
+        self.leaderboard_ttl = leaderboard_ttl
+        self.metric_flush_every = metric_flush_every
+        self.metric_flush_interval = metric_flush_interval
+        self.metric_max_rows = metric_max_rows
+        self.metric_format = _check_metric_format(metric_format)
+        self._metric_lock = threading.Lock()
+        self._metric_flush_lock = threading.Lock()
+        self._metric_buffers: Dict[str, MetricBuffer] = {}
+        self._metric_flushes: Dict[str, int] = {}
+        self._leaderboard_lock = threading.Lock()
+        # (data_source_id, metric, higher_is_better) -> (best score or None, loaded at).
+        self._leaderboard: Dict[tuple, tuple] = {}
+        self._background_lock = threading.Lock()
+        self._background_executor: Optional[ThreadPoolExecutor] = None
+        self._background_uploads: Dict[str, Future] = {}
+        self._spool: Optional[ExperimentSpool] = None
+        self._spool_worker: Optional[threading.Thread] = None
+        self._spool_wake = threading.Event()
+        self._spool_stop = threading.Event()
+
     def dict_to_notion_schema(self, data: Dict[str, Any], title_key: str) -> Dict[str, Any]:
         """Converts a dictionary into a Notion property schema for database creation.
 
@@ -110,72 +182,500 @@ class MLNotionHelper(NotionHelper):
         target_metric: str = "sMAPE",
         higher_is_better: bool = False,
         file_paths: Optional[List[str]] = None,
-        file_property_name: str = "Artifacts"
+        file_property_name: str = "Artifacts",
+        max_workers: Optional[int] = None,
+        background_uploads: bool = False,
     ):
-        """Logs ML experiment and compares metrics with multiple file support."""
-        improvement_tag = "Standard Run"
+        """Logs ML experiment and compares metrics with multiple file support.
+
+        Plots and artifacts are uploaded concurrently (up to `max_workers`, default the
+        helper's `max_workers`). All plots are then embedded with one block append, and
+        all artifacts are attached with one property update. With
+        `background_uploads=True`, the page ID is returned as soon as the row exists and
+        the uploads finish on a background thread; call `wait_for_uploads()` before exiting
+        to collect their outcome.
+        """
         new_score = metrics.get(target_metric)
 
         # 1. Leaderboard Logic (Champions)
+        current_best = None
         if new_score is not None:
-            try:
-                df = self.get_data_source_pages_as_dataframe(data_source_id, limit=100)
-                if not df.empty and target_metric in df.columns:
-                    valid_scores = pd.to_numeric(df[target_metric], errors='coerce').dropna()
-                    if not valid_scores.empty:
-                        current_best = valid_scores.max() if higher_is_better else valid_scores.min()
-                        is_improvement = (new_score > current_best) if higher_is_better else (new_score < current_best)
-                        if is_improvement:
-                            improvement_tag = f"🏆 NEW BEST {target_metric} (Prev: {current_best:.2f})"
-                        else:
-                            diff = abs(new_score - current_best)
-                            improvement_tag = f"No Improvement (+{diff:.2f} {target_metric})"
-            except Exception as e:
-                print(f"Leaderboard check skipped: {e}")
+            current_best = self._leaderboard_best(data_source_id, target_metric, higher_is_better)
+        improvement_tag = self._run_status(new_score, current_best, target_metric, higher_is_better)
 
         # 2. Prepare Notion Properties
-        data_for_notion = metrics.copy()
-        data_for_notion["Run Status"] = improvement_tag
-        combined_payload = {**config, **data_for_notion}
-        title_key = list(config.keys())[0]
-        properties = self.dict_to_notion_props(combined_payload, title_key)
+        properties = self._experiment_properties(config, metrics, improvement_tag)
 
         try:
             # 3. Create the row
             new_page = self.new_page_to_data_source(data_source_id, properties)
             page_id = new_page["id"]
-
-            # 4. Handle Plots (Body)
-            if plots:
-                for plot_path in plots:
-                    if os.path.exists(plot_path):
-                        self.one_step_image_embed(page_id, plot_path)
-
-            # 5. Handle Multiple File Uploads (Property)
-            if file_paths:
-                file_assets = []
-                for path in file_paths:
-                    if os.path.exists(path):
-                        print(f"Uploading {path}...")
-                        upload_resp = self.upload_file(path)
-                        file_assets.append({
-                            "type": "file_upload",
-                            "file_upload": {"id": upload_resp["id"]},
-                            "name": os.path.basename(path),
-                        })
-
-                if file_assets:
-                    # Attach all files in one request
-                    update_url = f"https://api.notion.com/v1/pages/{page_id}"
-                    file_payload = {"properties": {file_property_name: {"files": file_assets}}}
-                    self._make_request("PATCH", update_url, file_payload)
-                    print(f"✅ {len(file_assets)} files attached to {file_property_name}")
+            self._record_leaderboard_score(data_source_id, target_metric, higher_is_better, new_score)
+
+            # 4-5. Upload plots (body) and files (property)
+            plot_paths = [path for path in plots or [] if os.path.exists(path)]
+            artifact_paths = [path for path in file_paths or [] if os.path.exists(path)]
+            if background_uploads and (plot_paths or artifact_paths):
+                self._submit_background_upload(
+                    page_id, plot_paths, artifact_paths, file_property_name, max_workers
+                )
+            else:
+                self._upload_experiment_files(page_id, plot_paths, artifact_paths, file_property_name, max_workers)
 
             return page_id
         except Exception as e:
             print(f"Log error: {e}")
             return None
 
+    def _leaderboard_best(self, data_source_id: str, target_metric: str, higher_is_better: bool) -> Optional[float]:
+        """Returns the best recorded score for the target metric, or None.
+
+        Served from the leaderboard cache when fresh; otherwise one sorted query.
+        """
+        board = (data_source_id, target_metric, higher_is_better)
+        with self._leaderboard_lock:
+            cached = self._leaderboard.get(board)
+        if cached is not None and (
+            self.leaderboard_ttl is None or time.monotonic() - cached[1] < self.leaderboard_ttl
+        ):
+            return cached[0]
+        try:
+            best = self._query_leaderboard_best(data_source_id, target_metric, higher_is_better)
+        except Exception as e:
+            print(f"Leaderboard check skipped: {e}")
+            return None
+        with self._leaderboard_lock:
+            self._leaderboard[board] = (best, time.monotonic())
+        return best
+
+    def _query_leaderboard_best(self, data_source_id: str, target_metric: str, higher_is_better: bool) -> Optional[float]:
+        """Asks Notion for the best score of one metric column."""
+        definition = self.get_data_source(data_source_id).get("properties", {}).get(target_metric)
+        if not isinstance(definition, dict):
+            return None
+        projection = [definition["id"]] if definition.get("id") else None
+        if definition.get("type") == "number":
+            # Sorted server-side: the first non-empty row is the best one.
+            pages = self.iter_data_source_pages(
+                data_source_id,
+                limit=1,
+                page_size=1,
+                filter=Property(target_metric).number.is_not_empty(),
+                sorts=[descending(target_metric) if higher_is_better else ascending(target_metric)],
+                filter_properties=projection,
+            )
+            for page in pages:
+                value = (page.get("properties", {}).get(target_metric) or {}).get("number")
+                return float(value) if isinstance(value, (int, float)) else None
+            return None
+        # Other types (e.g. formulas) cannot be filtered as numbers; scan only this column.
+        records = self.iter_data_source_page_records(
+            data_source_id, include_page_ids=False, columns=[target_metric], filter_properties=projection
+        )
+        scores = pd.to_numeric(
+            pd.Series([record.get(target_metric) for record in records], dtype=object), errors='coerce'
+        ).dropna()
+        if scores.empty:
+            return None
+        return float(scores.max() if higher_is_better else scores.min())
+
+    def _record_leaderboard_score(
+        self,
+        data_source_id: str,
+        target_metric: str,
+        higher_is_better: bool,
+        score: Any,
+    ) -> None:
+        """Updates a cached best score from a run this helper just wrote."""
+        if isinstance(score, bool) or not isinstance(score, (int, float)) or pd.isna(score):
+            return
+        board = (data_source_id, target_metric, higher_is_better)
+        with self._leaderboard_lock:
+            cached = self._leaderboard.get(board)
+            if cached is None:
+                return
+            best, loaded_at = cached
+            if best is None or (score > best if higher_is_better else score < best):
+                self._leaderboard[board] = (float(score), loaded_at)
+
+    def invalidate_leaderboard(self, data_source_id: Optional[str] = None) -> None:
+        """Drops cached best scores for one data source, or all of them."""
+        with self._leaderboard_lock:
+            if data_source_id is None:
+                self._leaderboard.clear()
+            else:
+                for board in [board for board in self._leaderboard if board[0] == data_source_id]:
+                    del self._leaderboard[board]
+
+    def log_metric(self, run: str, name: str, value: float, step: Optional[float] = None) -> float:
+        """Buffers one step of a metric curve for a run page and returns the step.
+
+        Parameters:
+            run (str): The run's page ID, e.g. as returned by `log_ml_experiment`.
+            name (str): Metric name, e.g. "loss".
+            value (float): The metric value at this step.
+            step (float, optional): Defaults to the metric's previous step + 1 (0 first).
+
+        No request is made per step. Once the run holds `metric_flush_every` points, or its
+        oldest point is `metric_flush_interval` seconds old, the buffer is flushed with
+        `flush_metrics(run)`. A failed automatic flush is reported and its points are kept
+        for the next one.
+        """
+        with self._metric_lock:
+            buffer = self._metric_buffers.get(run)
+            if buffer is None:
+                buffer = self._metric_buffers[run] = MetricBuffer()
+        step = buffer.append(name, value, step)
+        interval = self.metric_flush_interval
+        if len(buffer) >= self.metric_flush_every or (
+            interval is not None and buffer.started is not None and time.monotonic() - buffer.started >= interval
+        ):
+            try:
+                self.flush_metrics(run)
+            except Exception as e:
+                print(f"Metric flush error: {e}")
+        return step
+
+    def flush_metrics(
+        self,
+        run: Optional[str] = None,
+        format: Optional[str] = None,
+        max_rows: Optional[int] = None,
+    ) -> int:
+        """Writes buffered metric points to their run pages and returns how many were written.
+
+        Each metric's points since the last flush are aggregated into at most `max_rows`
+        windows (default `metric_max_rows`) of min/max/mean/last. With format "table" (the
+        default `metric_format`) every metric becomes a heading and a table block, sent in one
+        append per run. With "csv" or "parquet" the windows of all metrics are uploaded as
+        one file (`metric, step_start, step_end, count, min, max, mean, last`) and embedded
+        as a file block. Parquet needs pyarrow or fastparquet.
+
+        Parameters:
+            run (str, optional): Flush one run page; by default every run with buffered points.
+            format (str, optional): "table", "csv" or "parquet".
+            max_rows (int, optional): Windows per metric.
+
+        If writing a run fails, the error is raised and its points stay buffered.
+        """
+        format = _check_metric_format(format or self.metric_format)
+        max_rows = max_rows or self.metric_max_rows
+        with self._metric_lock:
+            runs = list(self._metric_buffers) if run is None else [run]
+            buffers = [(page_id, self._metric_buffers.get(page_id)) for page_id in runs]
+        written = 0
+        for page_id, buffer in buffers:
+            if buffer is None:
+                continue
+            # One flush at a time, so a point is never written twice.
+            with self._metric_flush_lock:
+                points = buffer.snapshot()
+                if not points:
+                    continue
+                windows = [
+                    aggregate_windows(name, steps, values, max_rows) for name, (steps, values) in points.items()
+                ]
+                self._write_metric_windows(page_id, windows, format)
+                counts = {name: len(values) for name, (_, values) in points.items()}
+                buffer.discard(counts)
+                written += sum(counts.values())
+        return written
+
+    def _write_metric_windows(self, page_id: str, windows: List[pd.DataFrame], format: str) -> None:
+        if format == "table":
+            blocks = [block for frame in windows for block in window_table_blocks(frame["metric"].iloc[0], frame)]
+            self.append_page_body(page_id, blocks=blocks, sanitize=False)
+            return
+        number = self._metric_flushes.get(page_id, 0) + 1
+        frame = pd.concat(windows, ignore_index=True)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, f"metrics-{number:03d}.{format}")
+            if format == "csv":
+                frame.to_csv(path, index=False)
+            else:
+                frame.to_parquet(path, index=False)
+            upload = self.upload_file(path)
+        file_block = {
+            "type": "file",
+            "file": {"type": "file_upload", "file_upload": {"id": upload["id"]}, "name": os.path.basename(path)},
+        }
+        self.append_page_body(page_id, blocks=[file_block], sanitize=False)
+        self._metric_flushes[page_id] = number
+
+    def _run_status(
+        self,
+        new_score: Any,
+        current_best: Optional[float],
+        target_metric: str,
+        higher_is_better: bool,
+    ) -> str:
+        """Builds the "Run Status" tag comparing a score with the current best."""
+        if new_score is None or current_best is None:
+            return "Standard Run"
+        try:
+            is_improvement = (new_score > current_best) if higher_is_better else (new_score < current_best)
+            if is_improvement:
+                return f"🏆 NEW BEST {target_metric} (Prev: {current_best:.2f})"
+            diff = abs(new_score - current_best)
+            return f"No Improvement (+{diff:.2f} {target_metric})"
+        except Exception as e:
+            print(f"Leaderboard check skipped: {e}")
+            return "Standard Run"
+
+    def _experiment_properties(self, config: Dict, metrics: Dict, improvement_tag: str) -> Dict[str, Any]:
+        data_for_notion = metrics.copy()
+        data_for_notion["Run Status"] = improvement_tag
+        combined_payload = {**config, **data_for_notion}
+        title_key = list(config.keys())[0]
+        return self.dict_to_notion_props(combined_payload, title_key)
+
+    def _upload_experiment_files(
+        self,
+        page_id: str,
+        plot_paths: List[str],
+        artifact_paths: List[str],
+        file_property_name: str,
+        max_workers: Optional[int] = None,
+        stage_done: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Uploads plots and artifacts concurrently, then embeds and attaches them with one request each.
+
+        `stage_done("plots")` / `stage_done("artifacts")` is called once each stage is on the page.
+        """
+        paths = plot_paths + artifact_paths
+        if not paths:
+            return
+        print(f"Uploading {len(paths)} files...")
+        uploads = self._map_concurrently(self.upload_file, paths, max_workers=max_workers)
+        plot_uploads, artifact_uploads = uploads[:len(plot_paths)], uploads[len(plot_paths):]
+
+        if plot_uploads:
+            image_blocks = [
+                {"type": "image", "image": {"type": "file_upload", "file_upload": {"id": upload["id"]}}}
+                for upload in plot_uploads
+            ]
+            self.append_page_body(page_id, blocks=image_blocks, sanitize=False)
+            if stage_done is not None:
+                stage_done("plots")
+
+        if artifact_uploads:
+            # Attach all files in one request
+            file_assets = [
+                {
+                    "type": "file_upload",
+                    "file_upload": {"id": upload["id"]},
+                    "name": os.path.basename(path),
+                }
+                for path, upload in zip(artifact_paths, artifact_uploads)
+            ]
+            update_url = f"https://api.notion.com/v1/pages/{page_id}"
+            file_payload = {"properties": {file_property_name: {"files": file_assets}}}
+            self._make_request("PATCH", update_url, file_payload)
+            if stage_done is not None:
+                stage_done("artifacts")
+            print(f"✅ {len(file_assets)} files attached to {file_property_name}")
+
+    def _submit_background_upload(
+        self,
+        page_id: str,
+        plot_paths: List[str],
+        artifact_paths: List[str],
+        file_property_name: str,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Queues a page's uploads on the background upload thread."""
+        with self._background_lock:
+            if self._background_executor is None:
+                self._background_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="notionhelper-uploads"
+                )
+            future = self._background_executor.submit(
+                self._upload_experiment_files, page_id, plot_paths, artifact_paths, file_property_name, max_workers
+            )
+            self._background_uploads[page_id] = future
+
+        def report(done: Future) -> None:
+            if done.exception() is not None:
+                print(f"Background upload error for {page_id}: {done.exception()}")
+
+        future.add_done_callback(report)
+
+    def wait_for_uploads(self, timeout: Optional[float] = None) -> Dict[str, Optional[BaseException]]:
+        """Waits for background uploads and returns {page_id: exception or None} for the finished ones.
+
+        Uploads still running when `timeout` expires are left out and keep running.
+        """
+        with self._background_lock:
+            pending = dict(self._background_uploads)
+        wait(list(pending.values()), timeout=timeout)
+        outcomes: Dict[str, Optional[BaseException]] = {}
+        with self._background_lock:
+            for page_id, future in pending.items():
+                if future.done():
+                    outcomes[page_id] = future.exception()
+                    if self._background_uploads.get(page_id) is future:
+                        del self._background_uploads[page_id]
+        return outcomes
+
+    def start_background_logging(
+        self,
+        spool_path: str = "notion_experiments.sqlite",
+        batch_size: int = 20,
+        poll_interval: float = 1.0,
+        max_attempts: int = 5,
+    ) -> None:
+        """Starts a background worker that writes queued runs from a durable SQLite spool.
+
+        Runs left in the spool by an earlier process (for example after a crash) are
+        replayed first. The worker takes up to `batch_size` runs at a time. Best
+        scores come from the leaderboard cache, so a batch costs at most one leaderboard
+        query per data source and metric. A failed run stays queued and is retried on the next pass, every
+        `poll_interval` seconds, until it has failed `max_attempts` times.
+        """
+        if self._spool_worker is not None and self._spool_worker.is_alive():
+            raise RuntimeError("Background logging is already running")
+        if self._spool is not None:
+            self._spool.close()
+        self._spool = ExperimentSpool(spool_path, max_attempts=max_attempts)
+        self._spool_stop.clear()
+        self._spool_wake.set()
+        self._spool_worker = threading.Thread(
+            target=self._spool_loop,
+            args=(batch_size, poll_interval),
+            name="notionhelper-experiment-log",
+            daemon=True,
+        )
+        self._spool_worker.start()
+
+    @property
+    def spool(self) -> Optional[ExperimentSpool]:
+        """The active experiment spool, or None when background logging is off."""
+        return self._spool
+
+    def queue_ml_experiment(
+        self,
+        data_source_id: str,
+        config: Dict,
+        metrics: Dict,
+        plots: List[str] = None,
+        target_metric: str = "sMAPE",
+        higher_is_better: bool = False,
+        file_paths: Optional[List[str]] = None,
+        file_property_name: str = "Artifacts",
+    ) -> int:
+        """Queues a run for the background worker; takes the same arguments as `log_ml_experiment`.
+
+        Returns the run's spool ID once it is safely on disk.
+        """
+        if self._spool is None:
+            raise RuntimeError("Call start_background_logging() before queue_ml_experiment()")
+        run_id = self._spool.put(
+            data_source_id,
+            {
+                "config": config,
+                "metrics": metrics,
+                "plots": list(plots or []),
+                "target_metric": target_metric,
+                "higher_is_better": higher_is_better,
+                "file_paths": list(file_paths or []),
+                "file_property_name": file_property_name,
+            },
+        )
+        self._spool_wake.set()
+        return run_id
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until no queued runs remain; returns False if `timeout` expired first.
+
+        Runs that exhausted their attempts do not block a flush; see `ExperimentSpool.dead()`.
+        """
+        if self._spool is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._spool_wake.set()
+        while self._spool.pending_count():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if (remaining is not None and remaining <= 0) or self._spool_worker is None or not self._spool_worker.is_alive():
+                return False
+            time.sleep(0.05 if remaining is None else min(0.05, remaining))
+        return True
+
+    def stop_background_logging(self, timeout: Optional[float] = None) -> bool:
+        """Flushes the queue, stops the worker and closes the spool; returns the flush result.
+
+        Runs that could not be written before `timeout` stay in the spool for the next start.
+        """
+        if self._spool is None:
+            return True
+        flushed = self.flush(timeout)
+        self._spool_stop.set()
+        self._spool_wake.set()
+        if self._spool_worker is not None:
+            self._spool_worker.join(timeout)
+        self._spool_worker = None
+        self._spool.close()
+        self._spool = None
+        return flushed
+
+    def _spool_loop(self, batch_size: int, poll_interval: float) -> None:
+        while not self._spool_stop.is_set():
+            self._spool_wake.wait(timeout=poll_interval)
+            self._spool_wake.clear()
+            if self._spool_stop.is_set():
+                break
+            try:
+                runs = self._spool.pending(limit=batch_size)
+                while runs and not self._spool_stop.is_set():
+                    self._write_spooled_runs(runs)
+                    # Runs that failed this pass wait for the next poll rather than spinning.
+                    runs = self._spool.pending(limit=batch_size, after_id=runs[-1].id)
+            except Exception as e:
+                print(f"Background logging error: {e}")
+
+    def _write_spooled_runs(self, runs: List[SpooledRun]) -> None:
+        """Writes a batch of spooled runs; best scores come from the leaderboard cache."""
+        for run in runs:
+            payload = run.payload
+            target_metric = payload["target_metric"]
+            higher_is_better = payload["higher_is_better"]
+            try:
+                page_id = run.page_id
+                if page_id is None:
+                    new_score = payload["metrics"].get(target_metric)
+                    current_best = None
+                    if new_score is not None:
+                        current_best = self._leaderboard_best(run.data_source_id, target_metric, higher_is_better)
+                    improvement_tag = self._run_status(new_score, current_best, target_metric, higher_is_better)
+                    properties = self._experiment_properties(payload["config"], payload["metrics"], improvement_tag)
+                    page_id = self.new_page_to_data_source(run.data_source_id, properties)["id"]
+                    self._spool.mark_created(run.id, page_id)
+                    self._record_leaderboard_score(run.data_source_id, target_metric, higher_is_better, new_score)
+                # Stages finished by an earlier attempt are not uploaded again.
+                self._upload_experiment_files(
+                    page_id,
+                    [] if run.plots_done else [path for path in payload["plots"] if os.path.exists(path)],
+                    [] if run.artifacts_done else [path for path in payload["file_paths"] if os.path.exists(path)],
+                    payload["file_property_name"],
+                    stage_done=lambda stage, run_id=run.id: self._spool.mark_stage_done(run_id, stage),
+                )
+                self._spool.ack(run.id)
+            except Exception as e:
+                if self._spool.record_failure(run.id, str(e)):
+                    print(f"Giving up on queued run {run.id}: {e}")
+
+    def close(self) -> None:
+        """Flushes buffered metrics, stops background logging, waits for uploads and closes the HTTP session."""
+        try:
+            self.flush_metrics()
+        except Exception as e:
+            print(f"Metric flush error: {e}")
+        self.stop_background_logging()
+        with self._background_lock:
+            executor, self._background_executor = self._background_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        super().close()
+
     def create_ml_database(self, parent_page_id: str, db_title: str, config: Dict, metrics: Dict, file_property_name: str = "Artifacts") -> str:
         """
         Analyzes dicts to create a new Notion Database with the correct schema.
@@ -204,3 +704,9 @@ class MLNotionHelper(NotionHelper):
 
         data_source_id = response.get("initial_data_source", {}).get("id")
         return data_source_id if data_source_id else response.get("id")
+
+
+def _check_metric_format(format: str) -> str:
+    if format not in ("table", "csv", "parquet"):
+        raise ValueError(f"Unknown metric format {format!r}; expected 'table', 'csv' or 'parquet'")
+    return format
@@ -0,0 +1,143 @@
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+import gzip
+import json
+import os
+import re
+import threading
+
+
+_SUFFIX = ".json.gz"
+
+
+class PageCache:
+    """Persistent cache of page content, validated against the page's `last_edited_time`.
+
+    Each entry is a gzip-compressed JSON file in `directory`, keyed by page ID and
+    content kind (block tree, native markdown). A lookup only hits when the stored
+    `last_edited_time` equals the one passed in, so callers revalidate with one page
+    GET. Total size is kept under `max_bytes` (and `max_entries`, when set) by evicting
+    the least recently used entries. Recency is the file modification time, refreshed
+    on every hit, so it carries over between processes.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        max_bytes: int = 256 * 1024 * 1024,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # File name -> size in bytes, least recently used first.
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        existing = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(_SUFFIX):
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            existing.append((stat.st_mtime, name, stat.st_size))
+        for _, name, size in sorted(existing):
+            self._entries[name] = size
+            self._total_bytes += size
+        with self._lock:
+            self._evict()
+
+    def _file_name(self, page_id: str, kind: str) -> str:
+        safe_id = re.sub(r"[^A-Za-z0-9_-]", "_", page_id)
+        safe_kind = re.sub(r"[^A-Za-z0-9_-]", "_", kind)
+        return f"{safe_id}.{safe_kind}{_SUFFIX}"
+
+    def get(self, page_id: str, kind: str, last_edited_time: str) -> Optional[Any]:
+        """Returns the cached value, or None when absent or stale."""
+        name = self._file_name(page_id, kind)
+        path = os.path.join(self.directory, name)
+        entry = None
+        with self._lock:
+            known = name in self._entries
+        if known:
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as handle:
+                    entry = json.load(handle)
+            except (OSError, ValueError):
+                entry = None
+        with self._lock:
+            if not isinstance(entry, dict) or entry.get("last_edited_time") != last_edited_time:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if name in self._entries:
+                self._entries.move_to_end(name)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("value")
+
+    def put(self, page_id: str, kind: str, last_edited_time: str, value: Any) -> None:
+        """Stores a value; entries larger than `max_bytes` are not cached."""
+        data = gzip.compress(
+            json.dumps({"last_edited_time": last_edited_time, "value": value}).encode("utf-8")
+        )
+        if len(data) > self.max_bytes:
+            return
+        name = self._file_name(page_id, kind)
+        path = os.path.join(self.directory, name)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as handle:
+            handle.write(data)
+        os.replace(temp_path, path)
+        with self._lock:
+            self._total_bytes += len(data) - self._entries.pop(name, 0)
+            self._entries[name] = len(data)
+            self._evict()
+
+    def invalidate(self, page_id: str) -> None:
+        """Drops every cached kind for a page."""
+        prefix = self._file_name(page_id, "").split(".", 1)[0] + "."
+        with self._lock:
+            for name in [name for name in self._entries if name.startswith(prefix)]:
+                self._remove(name)
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in list(self._entries):
+                self._remove(name)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss/eviction counters and the current entry count and size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def _evict(self) -> None:
+        while self._entries and (
+            self._total_bytes > self.max_bytes
+            or (self.max_entries is not None and len(self._entries) > self.max_entries)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, name: str) -> None:
+        self._total_bytes -= self._entries.pop(name, 0)
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
@@ -0,0 +1,151 @@
+from typing import Callable, Protocol
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl  # type: ignore
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt  # type: ignore
+except ImportError:
+    msvcrt = None
+
+
+# Notion documents an average of three requests per second per integration.
+DEFAULT_REQUESTS_PER_SECOND = 3.0
+DEFAULT_BURST = 3
+
+
+class RateLimiter(Protocol):
+    """Interface for proactive client-side request pacing."""
+
+    def reserve(self) -> float:
+        """Takes one token and returns the number of seconds to wait before sending."""
+        ...
+
+    def acquire(self) -> float:
+        """Takes one token, sleeping until it is available. Returns the time waited."""
+        ...
+
+
+def _validate(rate: float, burst: int) -> None:
+    if rate <= 0:
+        raise ValueError("rate must be > 0")
+    if burst < 1:
+        raise ValueError("burst must be >= 1")
+
+
+class TokenBucketRateLimiter:
+    """Thread-safe token bucket shared by every request made in one process.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Callers that find the
+    bucket empty reserve a future token (the balance goes negative), so concurrent
+    threads are spaced out in arrival order instead of all waking at once.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        _validate(rate, burst)
+        self.rate = float(rate)
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class FileLockRateLimiter:
+    """Token bucket persisted in a small state file guarded by an OS file lock.
+
+    Every process on the host that points at the same `path` draws from one bucket, so a
+    fleet of workers sharing an integration token stays under Notion's limit together.
+    Bucket time uses the wall clock because monotonic clocks are not comparable across
+    processes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rate: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        _validate(rate, burst)
+        if fcntl is None and msvcrt is None:
+            raise RuntimeError("FileLockRateLimiter requires fcntl or msvcrt file locking")
+        self.path = path
+        self.rate = float(rate)
+        self.burst = burst
+        self._clock = clock
+        # Threads of one process still need to serialize around the OS lock.
+        self._thread_lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def reserve(self) -> float:
+        with self._thread_lock:
+            with open(self.path, "a+b") as handle:
+                self._lock_file(handle)
+                try:
+                    handle.seek(0)
+                    state = self._read_state(handle.read())
+                    now = self._clock()
+                    tokens, updated = state if state is not None else (float(self.burst), now)
+                    tokens = min(float(self.burst), tokens + max(0.0, now - updated) * self.rate)
+                    tokens -= 1.0
+                    handle.seek(0)
+                    handle.truncate()
+                    handle.write(json.dumps({"tokens": tokens, "updated": now}).encode("utf-8"))
+                    handle.flush()
+                finally:
+                    self._unlock_file(handle)
+        return 0.0 if tokens >= 0 else -tokens / self.rate
+
+    def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def _read_state(self, raw: bytes) -> tuple[float, float] | None:
+        try:
+            state = json.loads(raw.decode("utf-8"))
+            return float(state["tokens"]), float(state["updated"])
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def _lock_file(self, handle) -> None:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(self, handle) -> None:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,134 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+Page = Dict[str, Any]
+# (property_value, utc) -> flattened value or a skip sentinel
+PropertyExtractor = Callable[[Dict[str, Any], bool], Any]
+# (raw datetime values, utc) -> one parsed value per input
+DatetimeBatchParser = Callable[[List[Any], bool], List[Any]]
+
+DATETIME_TYPES = frozenset({"date", "created_time", "last_edited_time"})
+BATCH_DATETIME_TYPES = DATETIME_TYPES | {"rollup"}
+
+
+class CompiledRecordExtractor:
+    """Flattens data source pages to row records using a per-column plan built once.
+
+    The plan pairs every projected property name with the extractor for its type, so
+    rows skip the per-property type dispatch and unprojected properties are never
+    touched. Properties first seen on a later page are added to the plan as they
+    appear. Datetime cells (date, created_time, last_edited_time and rollup dates) are
+    collected across each `extract` call and handed to `parse_datetimes` in one batch.
+    """
+
+    def __init__(
+        self,
+        schema_properties: Dict[str, Any],
+        extractors: Dict[str, PropertyExtractor],
+        parse_datetimes: DatetimeBatchParser,
+        skip: Any,
+        columns: Optional[Iterable[str]] = None,
+        include_page_ids: bool = True,
+        utc: bool = True,
+        native_datetimes: bool = False,
+    ) -> None:
+        self._extractors = extractors
+        self._parse_datetimes = parse_datetimes
+        self._skip = skip
+        self._columns: Optional[Set[str]] = set(columns) if columns is not None else None
+        self._include_page_ids = include_page_ids
+        self._utc = utc
+        self._native_datetimes = native_datetimes
+        self._plan: List[Tuple[str, str, Optional[PropertyExtractor]]] = []
+        self._seen: Set[str] = set()
+        self.extend(schema_properties)
+
+    @property
+    def column_names(self) -> List[str]:
+        """Property names in the plan, in output order."""
+        return [name for name, _, _ in self._plan]
+
+    def extend(self, schema_properties: Dict[str, Any]) -> None:
+        """Adds properties not yet in the plan.
+
+        Accepts either a data source schema (`get_data_source(...)["properties"]`) or a
+        page's `properties`; both carry a `type` per property.
+        """
+        for name, definition in schema_properties.items():
+            if name in self._seen or not isinstance(definition, dict):
+                continue
+            self._seen.add(name)
+            if self._columns is not None and name not in self._columns:
+                continue
+            property_type = definition.get("type", "")
+            extractor = self._lookup(property_type)
+            if extractor is None and property_type not in BATCH_DATETIME_TYPES:
+                continue
+            self._plan.append((name, property_type, extractor))
+
+    def _lookup(self, property_type: str) -> Optional[PropertyExtractor]:
+        if property_type in BATCH_DATETIME_TYPES:
+            return None
+        return self._extractors.get(property_type)
+
+    def extract(self, pages: List[Page]) -> List[Dict[str, Any]]:
+        """Converts one chunk of raw page payloads to row records."""
+        skip = self._skip
+        utc = self._utc
+        missing = None if self._native_datetimes else ""
+        records: List[Dict[str, Any]] = []
+        # (container, key, is_date_start): where each collected raw datetime is written back.
+        targets: List[Tuple[Any, Any, bool]] = []
+        raw_values: List[Any] = []
+
+        for page in pages:
+            properties = page.get("properties", {})
+            if not isinstance(properties, dict):
+                properties = {}
+            if not self._seen.issuperset(properties):
+                self.extend(properties)
+
+            row: Dict[str, Any] = {}
+            if self._include_page_ids:
+                row["notion_page_id"] = page.get("id", "")
+
+            for name, property_type, extractor in self._plan:
+                value = properties.get(name)
+                if not isinstance(value, dict):
+                    continue
+                if value.get("type", "") != property_type:
+                    property_type = value.get("type", "")
+                    extractor = self._lookup(property_type)
+                if extractor is not None:
+                    extracted = extractor(value, utc)
+                    if extracted is not skip:
+                        row[name] = extracted
+                elif property_type == "rollup":
+                    rollup_field = value.get("rollup") or {}
+                    items = (rollup_field.get("array") if isinstance(rollup_field, dict) else None) or []
+                    dates: List[Any] = []
+                    for item in items:
+                        date_value = item.get("date", {}) if isinstance(item, dict) else None
+                        if isinstance(date_value, dict):
+                            targets.append((dates, len(dates), True))
+                            raw_values.append(date_value.get("start"))
+                        dates.append(missing)
+                    row[name] = dates
+                elif property_type == "date":
+                    date_value = value.get("date", {})
+                    row[name] = missing
+                    if isinstance(date_value, dict):
+                        targets.append((row, name, True))
+                        raw_values.append(date_value.get("start"))
+                elif property_type in DATETIME_TYPES:
+                    row[name] = None
+                    targets.append((row, name, False))
+                    raw_values.append(value.get(property_type, ""))
+            records.append(row)
+
+        if raw_values:
+            parsed_values = self._parse_datetimes(raw_values, utc)
+            for (container, key, is_date_start), parsed in zip(targets, parsed_values):
+                # Date starts keep normalize_notion_date's empty-as-None convention.
+                container[key] = (parsed or None) if is_date_start and not self._native_datetimes else parsed
+        return records
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import copy
+import threading
+import time
+
+
+class SchemaCache:
+    """Thread-safe in-process TTL cache for database and data source objects.
+
+    Entries expire `ttl` seconds after they were stored; at most `max_entries` are
+    kept, dropping the least recently used. Values are deep-copied on the way in and
+    out so callers can mutate what they receive.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.ttl = float(ttl)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, value), least recently used first.
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the cached value, or None when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Dict[str, Any]) -> None:
+        stored = copy.deepcopy(value)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (self._clock() + self.ttl, stored)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Returns the cached value, calling `load` and caching its result on a miss."""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        value = load()
+        if isinstance(value, dict):
+            self.set(key, value)
+        return value
+
+    def peek(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the cached value without touching counters or recency."""
+        with self._lock:
+            entry = self._entries.get(key)
+            value = entry[1] if entry is not None and entry[0] > self._clock() else None
+        return copy.deepcopy(value) if value is not None else None
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drops one entry, or every entry when `key` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+_COLUMNS = "id, data_source_id, payload, page_id, attempts, last_error, plots_done, artifacts_done"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data_source_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    page_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    dead INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    plots_done INTEGER NOT NULL DEFAULT 0,
+    artifacts_done INTEGER NOT NULL DEFAULT 0
+);
+"""
+# Upload stages of a run whose completion is recorded, so a replay skips them.
+_STAGES = ("plots", "artifacts")
+
+
+@dataclass
+class SpooledRun:
+    """One queued experiment run."""
+
+    id: int
+    data_source_id: str
+    payload: Dict[str, Any]
+    page_id: Optional[str] = None
+    attempts: int = 0
+    last_error: Optional[str] = None
+    plots_done: bool = False
+    artifacts_done: bool = False
+
+
+class ExperimentSpool:
+    """Durable SQLite queue of experiment runs waiting to be written to Notion.
+
+    A run stays in the spool until it is acknowledged, so runs queued before a crash
+    are replayed the next time a worker opens the same file. The Notion page ID is
+    recorded as soon as the row exists, and each upload stage (plots, artifacts) is
+    recorded when it completes, so a replay only redoes the stages left unfinished. Runs that
+    fail `max_attempts` times are marked dead and kept for inspection. Safe to share
+    between threads.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], max_attempts: int = 5) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self.path = os.fspath(path)
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        # Spool files written before stage tracking lack the stage columns.
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(runs)")}
+        with self._conn:
+            for stage in _STAGES:
+                if f"{stage}_done" not in columns:
+                    self._conn.execute(f"ALTER TABLE runs ADD COLUMN {stage}_done INTEGER NOT NULL DEFAULT 0")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "ExperimentSpool":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+
+    def put(self, data_source_id: str, payload: Dict[str, Any]) -> int:
+        """Stores a run and returns its spool ID."""
+        body = json.dumps(payload, default=_json_default)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (data_source_id, payload, created_at) VALUES (?, ?, ?)",
+                (data_source_id, body, time.time()),
+            )
+        return int(cursor.lastrowid)
+
+    def pending(self, limit: Optional[int] = None, after_id: int = 0) -> List[SpooledRun]:
+        """Returns live runs with IDs above `after_id`, in the order they were queued."""
+        query = f"SELECT {_COLUMNS} FROM runs WHERE dead = 0 AND id > ? ORDER BY id"
+        params: tuple = (after_id,)
+        if limit is not None:
+            query += " LIMIT ?"
+            params += (limit,)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [_to_run(row) for row in rows]
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM runs WHERE dead = 0").fetchone()[0]
+
+    def dead(self) -> List[SpooledRun]:
+        """Returns runs that exhausted their attempts."""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {_COLUMNS} FROM runs WHERE dead = 1 ORDER BY id").fetchall()
+        return [_to_run(row) for row in rows]
+
+    def mark_created(self, run_id: int, page_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE runs SET page_id = ? WHERE id = ?", (page_id, run_id))
+
+    def mark_stage_done(self, run_id: int, stage: str) -> None:
+        """Records that the "plots" or "artifacts" stage of a run was written."""
+        if stage not in _STAGES:
+            raise ValueError(f"Unknown stage {stage!r}; expected 'plots' or 'artifacts'")
+        with self._lock, self._conn:
+            self._conn.execute(f"UPDATE runs SET {stage}_done = 1 WHERE id = ?", (run_id,))
+
+    def ack(self, run_id: int) -> None:
+        """Removes a run that was fully written."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM runs WHERE id = ?", (run_id,))
+
+    def record_failure(self, run_id: int, error: str) -> bool:
+        """Counts a failed attempt; returns True if the run is now dead."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE runs SET attempts = attempts + 1, last_error = ?, dead = (attempts + 1 >= ?) WHERE id = ?",
+                (error, self.max_attempts, run_id),
+            )
+            row = self._conn.execute("SELECT dead FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return bool(row and row[0])
+
+
+def _to_run(row: tuple) -> SpooledRun:
+    return SpooledRun(
+        row[0],
+        row[1],
+        json.loads(row[2]),
+        page_id=row[3],
+        attempts=row[4],
+        last_error=row[5],
+        plots_done=bool(row[6]),
+        artifacts_done=bool(row[7]),
+    )
+
+
+def _json_default(value: Any) -> Any:
+    # NumPy scalars (metrics are often np.float64) and other objects with .item().
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
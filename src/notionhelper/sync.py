@@ -0,0 +1,116 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
+import json
+import os
+import sqlite3
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    data_source_id TEXT NOT NULL,
+    page_id TEXT NOT NULL,
+    last_edited_time TEXT,
+    page_json TEXT NOT NULL,
+    PRIMARY KEY (data_source_id, page_id)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    data_source_id TEXT PRIMARY KEY,
+    last_edited_time TEXT
+);
+"""
+
+
+@dataclass
+class SyncResult:
+    """Delta produced by one `NotionHelper.sync_data_source` run."""
+
+    data_source_id: str
+    added: List[Dict[str, Any]] = field(default_factory=list)
+    updated: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    watermark: Optional[str] = None
+    full_refresh: bool = False
+
+    @property
+    def changed(self) -> List[Dict[str, Any]]:
+        """Added and updated pages, in that order."""
+        return self.added + self.updated
+
+
+class SQLiteSnapshot:
+    """Local snapshot of data source pages plus a per-data-source sync watermark.
+
+    Pages are stored as raw page JSON keyed by (data_source_id, page_id). The
+    watermark is the newest `last_edited_time` synced. Notion rounds
+    `last_edited_time` to the minute, so the next query repeats that timestamp with
+    `on_or_after` and pages returned again are compared with their stored JSON:
+    a page edited again within the same minute still shows up as updated.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SQLiteSnapshot":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+
+    def get_watermark(self, data_source_id: str) -> Optional[str]:
+        """Returns the newest synced `last_edited_time`; None before the first sync."""
+        row = self._conn.execute(
+            "SELECT last_edited_time FROM watermarks WHERE data_source_id = ?",
+            (data_source_id,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_page(self, data_source_id: str, page_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT page_json FROM pages WHERE data_source_id = ? AND page_id = ?",
+            (data_source_id, page_id),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def page_ids(self, data_source_id: str) -> Set[str]:
+        rows = self._conn.execute("SELECT page_id FROM pages WHERE data_source_id = ?", (data_source_id,))
+        return {row[0] for row in rows}
+
+    def pages(self, data_source_id: str) -> Iterator[Dict[str, Any]]:
+        """Yields every stored page for a data source."""
+        rows = self._conn.execute(
+            "SELECT page_json FROM pages WHERE data_source_id = ? ORDER BY page_id",
+            (data_source_id,),
+        )
+        for row in rows:
+            yield json.loads(row[0])
+
+    def apply(
+        self,
+        data_source_id: str,
+        upserts: Iterable[Dict[str, Any]],
+        removed: Iterable[str],
+        watermark: Optional[str],
+    ) -> None:
+        """Writes one sync delta and its new watermark in a single transaction."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages (data_source_id, page_id, last_edited_time, page_json) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (data_source_id, page["id"], page.get("last_edited_time"), json.dumps(page))
+                    for page in upserts
+                ],
+            )
+            self._conn.executemany(
+                "DELETE FROM pages WHERE data_source_id = ? AND page_id = ?",
+                [(data_source_id, page_id) for page_id in removed],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watermarks (data_source_id, last_edited_time) VALUES (?, ?)",
+                (data_source_id, watermark),
+            )
@@ -1,3 +1,4 @@
+import json
 import logging
 from unittest.mock import Mock, patch
 
@@ -38,6 +39,184 @@ def test_append_page_body_batches_requests_at_100_children():
     assert len(response["results"]) == 3
 
 
+def test_append_page_body_pipeline_anchors_each_batch():
+    helper = NotionHelper("token", max_workers=3)
+    blocks = [_paragraph_block(f"line {idx}") for idx in range(250)]
+
+    def fake_request(method, url, payload, *args, **kwargs):
+        return {
+            "object": "list",
+            "results": [{"id": child["paragraph"]["rich_text"][0]["text"]["content"]} for child in payload["children"]],
+        }
+
+    with patch.object(NotionHelper, "_make_request", side_effect=fake_request) as mock_request:
+        response = helper.append_page_body("page-id", blocks, pipeline=True)
+
+    payloads = [call.args[2] for call in mock_request.call_args_list]
+    assert [child["paragraph"]["rich_text"][0]["text"]["content"] for child in payloads[0]["children"]] == [
+        "line 0", "line 100", "line 200",
+    ]
+    assert sorted((payload["after"], len(payload["children"])) for payload in payloads[1:]) == [
+        ("line 0", 99), ("line 100", 99), ("line 200", 49),
+    ]
+    assert [result["id"] for result in response["results"]] == [f"line {idx}" for idx in range(250)]
+    assert response["batch_count"] == 4
+    assert [(timing["phase"], timing["batch"], timing["blocks"]) for timing in response["batch_timings"]] == [
+        ("anchors", 0, 3), ("body", 0, 99), ("body", 1, 99), ("body", 2, 49),
+    ]
+    assert all(409 in call.kwargs["retry_policy"].retry_statuses for call in mock_request.call_args_list[1:])
+
+
+def test_append_page_body_reports_batch_timings_when_sequential():
+    helper = NotionHelper("token")
+    blocks = [_paragraph_block(f"line {idx}") for idx in range(150)]
+
+    with patch.object(NotionHelper, "_make_request", return_value={"object": "list", "results": []}):
+        response = helper.append_page_body("page-id", blocks)
+
+    assert [(timing["phase"], timing["batch"], timing["blocks"]) for timing in response["batch_timings"]] == [
+        ("batch", 0, 100), ("batch", 1, 50),
+    ]
+
+
+def _list_item(text: str, children=None) -> dict:
+    block = {
+        "object": "block",
+        "type": "bulleted_list_item",
+        "bulleted_list_item": {"rich_text": [{"type": "text", "text": {"content": text}}]},
+    }
+    if children:
+        block["bulleted_list_item"]["children"] = children
+    return block
+
+
+def _block_text(block: dict) -> str:
+    return block[block["type"]]["rich_text"][0]["text"]["content"]
+
+
+def _block_tree(block: dict):
+    children = block[block["type"]].get("children", [])
+    return (_block_text(block), [_block_tree(child) for child in children]) if children else _block_text(block)
+
+
+def test_append_page_body_splits_deep_nesting_into_follow_up_appends():
+    helper = NotionHelper("token")
+    deep = _list_item("b", [_list_item("c", [_list_item("d", [_list_item("f")])])])
+    blocks = [_list_item("p0"), _list_item("top", [_list_item("a"), deep, _list_item("e")])]
+
+    def fake_request(method, url, payload, *args, **kwargs):
+        return {"object": "list", "results": [{"id": f"id-{_block_text(child)}"} for child in payload["children"]]}
+
+    with patch.object(NotionHelper, "_make_request", side_effect=fake_request) as mock_request:
+        response = helper.append_page_body("page-id", blocks)
+
+    sent = [
+        (call.args[1].split("/blocks/")[1].split("/")[0], [_block_tree(child) for child in call.args[2]["children"]])
+        for call in mock_request.call_args_list
+    ]
+    assert sent == [
+        ("page-id", ["p0", ("top", ["a"])]),
+        ("id-top", ["b", "e"]),
+        ("id-b", [("c", [("d", ["f"])])]),
+    ]
+    assert response["nested_request_count"] == 2
+    assert [result["id"] for result in response["results"]] == ["id-p0", "id-top"]
+
+
+def _toggle(text: str, children=None) -> dict:
+    block = {"object": "block", "type": "toggle", "toggle": {"rich_text": [{"type": "text", "text": {"content": text}}]}}
+    if children:
+        block["toggle"]["children"] = children
+    return block
+
+
+def _columns(*columns) -> dict:
+    return {
+        "object": "block",
+        "type": "column_list",
+        "column_list": {"children": [{"object": "block", "type": "column", "column": {"children": list(column)}} for column in columns]},
+    }
+
+
+def test_append_page_body_sends_three_level_trees_in_one_request():
+    helper = NotionHelper("token")
+    blocks = [
+        _toggle("t", [_toggle("u", [_paragraph_block("v")])]),
+        _columns([_paragraph_block("left")], [_paragraph_block("right")]),
+    ]
+
+    with patch.object(NotionHelper, "_make_request", return_value={"object": "list", "results": [{"id": "a"}, {"id": "b"}]}) as mock_request:
+        response = helper.append_page_body("page-id", blocks, sanitize=False)
+
+    mock_request.assert_called_once()
+    assert mock_request.call_args.args[2]["children"] == blocks
+    assert "nested_request_count" not in response
+
+
+def test_append_page_body_keeps_columns_inline_and_splits_below_them():
+    helper = NotionHelper("token")
+    deep = _toggle("deep", [_paragraph_block("inside")])
+    blocks = [_columns([_paragraph_block("left"), deep], [_paragraph_block("right")])]
+    calls = []
+
+    def fake_request(method, url, payload=None, *args, **kwargs):
+        calls.append((method, url.split("/v1/")[1], payload))
+        if method == "GET":
+            parent = url.split("/blocks/")[1].split("/")[0]
+            return {"results": [{"id": f"{parent}-{idx}"} for idx in range(2)], "has_more": False}
+        return {"object": "list", "results": [{"id": "columns-1"}]}
+
+    with patch.object(NotionHelper, "_make_request", side_effect=fake_request):
+        response = helper.append_page_body("page-id", blocks, sanitize=False)
+
+    first = calls[0][2]["children"][0]["column_list"]["children"]
+    assert [len(column["column"]["children"]) for column in first] == [2, 1]
+    assert "children" not in first[0]["column"]["children"][1]["toggle"]
+    assert [(method, path) for method, path, _ in calls[1:]] == [
+        ("GET", "blocks/columns-1/children"),
+        ("GET", "blocks/columns-1-0/children"),
+        ("PATCH", "blocks/columns-1-0-1/children"),
+    ]
+    assert calls[-1][2]["children"] == [_paragraph_block("inside")]
+    assert response["nested_request_count"] == 1
+
+
+def test_append_page_body_packs_batches_under_byte_and_element_budgets():
+    helper = NotionHelper("token")
+    dense = [_paragraph_block("x" * 1500) for _ in range(5)]
+    nested = [_list_item(f"n{idx}", [_list_item("a"), _list_item("b"), _list_item("c")]) for idx in range(5)]
+
+    with patch.object(NotionHelper, "_make_request", return_value={"object": "list", "results": []}) as mock_request:
+        helper.append_page_body("page-id", dense, max_payload_bytes=4000)
+    payloads = [call.args[2] for call in mock_request.call_args_list]
+    assert [len(payload["children"]) for payload in payloads] == [2, 2, 1]
+    assert all(len(json.dumps(payload)) <= 4000 for payload in payloads)
+
+    with patch.object(NotionHelper, "_make_request", return_value={"object": "list", "results": []}) as mock_request:
+        helper.append_page_body("page-id", nested, max_block_elements=10)
+    assert [len(call.args[2]["children"]) for call in mock_request.call_args_list] == [2, 2, 1]
+
+
+def test_append_page_body_streams_markdown_batches_before_parsing_finishes():
+    helper = NotionHelper("token")
+    markdown = "\n\n".join(f"Paragraph {idx}" for idx in range(250))
+    produced = []
+    sent_after = []
+
+    def iter_blocks(body):
+        for block in helper._iter_markdown_blocks(body):
+            produced.append(block)
+            yield block
+
+    adapter = Mock(iter_markdown_blocks=iter_blocks)
+    helper.set_converter_adapter(adapter)
+    with patch.object(NotionHelper, "_make_request", side_effect=lambda *a, **k: sent_after.append(len(produced)) or {}):
+        helper.append_page_body("page-id", markdown)
+
+    adapter.markdown_to_blocks.assert_not_called()
+    assert sent_after == [100, 200, 250]
+
+
 def test_append_page_body_supports_legacy_blocks_keyword():
     helper = NotionHelper("token")
     blocks = [_paragraph_block("legacy")]
@@ -291,7 +470,7 @@ def test_make_request_retries_on_429_with_retry_after():
     success_response.raise_for_status.return_value = None
     success_response.json.return_value = {"ok": True}
 
-    with patch("notionhelper.helper.requests.patch", side_effect=[retry_response, success_response]) as mock_patch:
+    with patch("notionhelper.helper.requests.Session.patch", side_effect=[retry_response, success_response]) as mock_patch:
         with patch("notionhelper.helper.time.sleep") as mock_sleep:
             result = helper._make_request("PATCH", "https://api.notion.com/v1/test", {"x": 1})
 
@@ -312,7 +491,7 @@ def test_make_request_retries_transient_request_exception():
     success_response.json.return_value = {"ok": True}
 
     with patch(
-        "notionhelper.helper.requests.get",
+        "notionhelper.helper.requests.Session.get",
         side_effect=[requests.exceptions.ConnectionError("boom"), success_response],
     ) as mock_get:
         with patch("notionhelper.helper.time.sleep") as mock_sleep:
@@ -331,7 +510,7 @@ def test_debug_logging_emits_request_metadata(caplog):
     success_response.raise_for_status.return_value = None
     success_response.json.return_value = {"ok": True}
 
-    with patch("notionhelper.helper.requests.get", return_value=success_response):
+    with patch("notionhelper.helper.requests.Session.get", return_value=success_response):
         with caplog.at_level(logging.DEBUG):
             helper._make_request("GET", "https://api.notion.com/v1/test", params={"page_size": 10})
 
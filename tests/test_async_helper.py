@@ -0,0 +1,211 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from notionhelper import AsyncNotionHelper, NotFoundError, RetryPolicy
+
+
+def _build_helper(handler, **kwargs) -> AsyncNotionHelper:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncNotionHelper("token", client=client, **kwargs)
+
+
+def test_get_page_hydrates_nested_children():
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v1/pages/page-id":
+            return httpx.Response(200, json={"properties": {"Name": {"title": []}}})
+        if path == "/v1/blocks/page-id/children":
+            return httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {"id": "toggle-1", "type": "toggle", "toggle": {"rich_text": []}, "has_children": True},
+                        {"id": "para-1", "type": "paragraph", "paragraph": {"rich_text": []}},
+                    ],
+                    "has_more": False,
+                },
+            )
+        if path == "/v1/blocks/toggle-1/children":
+            return httpx.Response(
+                200,
+                json={"results": [{"id": "nested", "type": "paragraph", "paragraph": {"rich_text": []}}], "has_more": False},
+            )
+        return httpx.Response(404, json={"code": "object_not_found", "message": path})
+
+    async def run():
+        async with _build_helper(handler) as helper:
+            return await helper.get_page("page-id")
+
+    result = asyncio.run(run())
+
+    assert [block["id"] for block in result["content"]] == ["toggle-1", "para-1"]
+    assert result["content"][0]["toggle"]["children"][0]["id"] == "nested"
+
+
+def test_iter_data_source_pages_is_async_generator():
+    cursors = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        cursors.append(body.get("start_cursor"))
+        if body.get("start_cursor") is None:
+            return httpx.Response(200, json={"results": [{"id": "p1"}, {"id": "p2"}], "has_more": True, "next_cursor": "c1"})
+        return httpx.Response(200, json={"results": [{"id": "p3"}], "has_more": False, "next_cursor": None})
+
+    async def run():
+        async with _build_helper(handler) as helper:
+            return [page["id"] async for page in helper.iter_data_source_pages("ds-id")]
+
+    assert asyncio.run(run()) == ["p1", "p2", "p3"]
+    assert cursors == [None, "c1"]
+
+
+def test_make_request_retries_with_asyncio_sleep():
+    statuses = iter([429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        if status == 429:
+            return httpx.Response(429, headers={"Retry-After": "2"}, json={"code": "rate_limited"})
+        return httpx.Response(200, json={"ok": True})
+
+    async def fake_sleep(_delay):
+        return None
+
+    with patch("notionhelper.async_helper.asyncio.sleep", side_effect=fake_sleep) as mock_sleep:
+        result = asyncio.run(
+            _build_helper(handler, retry_policy=RetryPolicy(max_retries=2, jitter_ratio=0.0))._make_request(
+                "GET", "https://api.notion.com/v1/test"
+            )
+        )
+
+    assert result == {"ok": True}
+    mock_sleep.assert_called_once_with(2.0)
+
+
+def test_errors_map_to_structured_exceptions():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"code": "object_not_found", "message": "missing"})
+
+    async def run():
+        async with _build_helper(handler, max_retries=0) as helper:
+            await helper.get_data_source("ds-id")
+
+    with pytest.raises(NotFoundError) as exc_info:
+        asyncio.run(run())
+    assert exc_info.value.request_path == "/v1/data_sources/ds-id"
+
+
+def test_append_page_body_converts_markdown_and_batches():
+    payloads = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        return httpx.Response(200, json={"object": "list", "results": [{"id": f"b{len(payloads)}"}]})
+
+    async def run():
+        async with _build_helper(handler) as helper:
+            return await helper.append_page_body("page-id", "# Title\n\nBody\n\n- item", batch_size=2)
+
+    result = asyncio.run(run())
+
+    assert [len(payload["children"]) for payload in payloads] == [2, 1]
+    assert payloads[0]["children"][0]["type"] == "heading_1"
+    assert result["batch_count"] == 2
+
+
+def test_get_page_bounds_concurrent_children_requests():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        path = request.url.path
+        if path == "/v1/pages/page-id":
+            return httpx.Response(200, json={"properties": {}})
+        if path == "/v1/blocks/page-id/children":
+            results = [
+                {"id": f"toggle-{idx}", "type": "toggle", "toggle": {"rich_text": []}, "has_children": True}
+                for idx in range(10)
+            ]
+            return httpx.Response(200, json={"results": results, "has_more": False})
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"results": [], "has_more": False})
+
+    async def run():
+        async with _build_helper(handler, max_concurrency=3) as helper:
+            return await helper.get_page("page-id")
+
+    result = asyncio.run(run())
+
+    assert len(result["content"]) == 10
+    assert peak == 3
+
+
+def test_blocking_rate_limiter_reserves_off_the_event_loop():
+    import threading
+
+    class RecordingLimiter:
+        threads = []
+
+        def reserve(self) -> float:
+            self.threads.append(threading.current_thread())
+            return 0.0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"object": "database"})
+
+    async def run():
+        async with _build_helper(handler, rate_limiter=RecordingLimiter()) as helper:
+            await helper.get_database("db-id")
+
+    asyncio.run(run())
+
+    assert RecordingLimiter.threads and RecordingLimiter.threads[0] is not threading.main_thread()
+
+
+def test_upload_file_sends_large_files_in_parts(tmp_path, monkeypatch):
+    import notionhelper.async_helper as async_module
+    import notionhelper.helper as helper_module
+
+    monkeypatch.setattr(async_module, "MULTI_PART_UPLOAD_THRESHOLD", 5)
+    monkeypatch.setattr(helper_module, "MIN_UPLOAD_PART_SIZE", 4)
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"0123456789")
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/v1/file_uploads":
+            assert json.loads(request.content)["number_of_parts"] == 3
+            return httpx.Response(200, json={"id": "up-1"})
+        return httpx.Response(200, json={"id": "up-1", "status": "uploaded"})
+
+    progress = []
+
+    async def run():
+        async with _build_helper(handler) as helper:
+            with pytest.raises(ValueError):
+                await helper.upload_file(str(path), part_size=3)
+            return await helper.upload_file(
+                str(path), part_size=4, progress_callback=lambda done, total: progress.append(done)
+            )
+
+    result = asyncio.run(run())
+
+    assert result["status"] == "uploaded"
+    assert requests == [
+        "/v1/file_uploads",
+        "/v1/file_uploads/up-1/send",
+        "/v1/file_uploads/up-1/send",
+        "/v1/file_uploads/up-1/send",
+        "/v1/file_uploads/up-1/complete",
+    ]
+    assert progress == [4, 8, 10]
@@ -0,0 +1,74 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from notionhelper import NotionHelper
+
+
+def _toggle(block_id: str, has_children: bool) -> dict:
+    return {"id": block_id, "type": "toggle", "toggle": {"rich_text": []}, "has_children": has_children}
+
+
+TREE = {
+    "page-id": [_toggle("a", True), _toggle("b", True), _toggle("c", False)],
+    "a": [_toggle("a1", True), _toggle("a2", False)],
+    "b": [_toggle("b1", False)],
+    "a1": [_toggle("a1x", False)],
+}
+
+
+def _fake_request_factory(tree: dict, delay: float = 0.0):
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0, "paths": []}
+
+    def fake_request(self, method, url, payload=None, **kwargs):
+        if url.endswith("/v1/pages/page-id"):
+            return {"properties": {}}
+        block_id = url.rsplit("/blocks/", 1)[1].split("/")[0]
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            state["paths"].append(block_id)
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+        return {"results": [dict(block) for block in tree.get(block_id, [])], "has_more": False}
+
+    return fake_request, state
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_get_page_hydration_preserves_order_and_shape(max_workers):
+    helper = NotionHelper("token", max_workers=max_workers)
+    fake_request, _ = _fake_request_factory(TREE)
+
+    with patch.object(NotionHelper, "_make_request", fake_request):
+        content = helper.get_page("page-id", expand_child_pages=False)["content"]
+
+    assert [block["id"] for block in content] == ["a", "b", "c"]
+    a_children = content[0]["toggle"]["children"]
+    assert [block["id"] for block in a_children] == ["a1", "a2"]
+    assert a_children[0]["toggle"]["children"][0]["id"] == "a1x"
+    assert [block["id"] for block in content[1]["toggle"]["children"]] == ["b1"]
+    assert "children" not in content[2]["toggle"]
+
+
+def test_hydration_fetches_each_level_in_parallel():
+    helper = NotionHelper("token", max_workers=4)
+    fake_request, state = _fake_request_factory(TREE, delay=0.05)
+
+    with patch.object(NotionHelper, "_make_request", fake_request):
+        helper._get_page_blocks("page-id")
+
+    # Breadth-first: both depth-1 parents are fetched before the depth-2 parent.
+    assert state["paths"][0] == "page-id"
+    assert set(state["paths"][1:3]) == {"a", "b"}
+    assert state["paths"][3] == "a1"
+    assert state["peak"] == 2
+
+
+def test_invalid_max_workers_raises():
+    with pytest.raises(ValueError, match="max_workers"):
+        NotionHelper("token", max_workers=0)
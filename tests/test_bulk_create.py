@@ -0,0 +1,122 @@
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from notionhelper import AuthError, BulkResult, NotionHelper, ValidationError
+
+
+def _title(value):
+    return {"Name": {"title": [{"text": {"content": value}}]}}
+
+
+def _fake_create_factory(fail_names=(), auth_fail_names=()):
+    lock = threading.Lock()
+    created = []
+
+    def fake_create(self, data_source_id, page_properties=None, markdown=None):
+        name = page_properties["Name"]["title"][0]["text"]["content"]
+        if name in auth_fail_names:
+            raise AuthError("Unauthorized", status_code=401)
+        if name in fail_names:
+            raise ValidationError("bad value", status_code=400)
+        with lock:
+            created.append(name)
+        return {"id": f"page-{name}"}
+
+    return fake_create, created
+
+
+def test_bulk_create_reports_failures_per_row_and_resumes():
+    helper = NotionHelper("token", max_workers=3)
+    rows = [_title(f"r{idx}") for idx in range(6)]
+    limiter = MagicMock()
+    fake_create, created = _fake_create_factory(fail_names={"r2", "r4"})
+    progress = []
+
+    with patch.object(NotionHelper, "new_page_to_data_source", fake_create):
+        report = helper.bulk_create_pages(
+            "ds-id",
+            rows,
+            rate_limiter=limiter,
+            progress_callback=lambda done, failed: progress.append((done, failed)),
+        )
+
+    assert [row.index for row in report.rows] == list(range(6))
+    assert [row.index for row in report.failed] == [2, 4]
+    assert report.failed[0].error_type == "ValidationError"
+    assert report.rows[0].page_id == "page-r0"
+    assert limiter.acquire.call_count == 6
+    assert progress[-1] == (6, 2)
+
+    restored = BulkResult.from_dict(json.loads(json.dumps(report.to_dict())))
+    fake_create, created = _fake_create_factory()
+    with patch.object(NotionHelper, "new_page_to_data_source", fake_create):
+        resumed = helper.bulk_create_pages("ds-id", rows, rate_limiter=limiter, resume_from=restored)
+
+    assert sorted(created) == ["r2", "r4"]
+    assert resumed.failed == []
+    assert [row.page_id for row in resumed.rows] == [f"page-r{idx}" for idx in range(6)]
+
+
+def test_bulk_create_stops_dispatching_after_auth_error():
+    helper = NotionHelper("token", max_workers=1)
+    rows = [_title(f"r{idx}") for idx in range(5)]
+    fake_create, created = _fake_create_factory(auth_fail_names={"r1"})
+
+    with patch.object(NotionHelper, "new_page_to_data_source", fake_create):
+        report = helper.bulk_create_pages("ds-id", rows, rate_limiter=MagicMock())
+
+    assert created == ["r0"]
+    assert [row.index for row in report.rows] == [0, 1]
+    assert report.aborted is not None
+
+
+def test_bulk_create_encodes_dataframe_rows_with_schema():
+    helper = NotionHelper("token", max_workers=1)
+    schema = {
+        "properties": {
+            "Name": {"type": "title"},
+            "Score": {"type": "number"},
+            "Tags": {"type": "multi_select"},
+            "Due": {"type": "date"},
+            "Done": {"type": "checkbox"},
+            "Formula": {"type": "formula"},
+        }
+    }
+    df = pd.DataFrame(
+        {
+            "Name": ["a", "b"],
+            "Score": [np.float64(1.5), np.nan],
+            "Tags": [["x", "y"], []],
+            "Due": [pd.Timestamp("2026-03-01T08:00:00-05:00"), pd.NaT],
+            "Done": [np.bool_(True), False],
+            "Formula": [1, 2],
+            "notion_page_id": ["p1", "p2"],
+        }
+    )
+    sent = []
+
+    def fake_create(self, data_source_id, page_properties=None, markdown=None):
+        sent.append(page_properties)
+        return {"id": "new"}
+
+    with patch.object(NotionHelper, "get_data_source", return_value=schema), \
+         patch.object(NotionHelper, "new_page_to_data_source", fake_create):
+        report = helper.bulk_create_pages("ds-id", df, rate_limiter=MagicMock())
+
+    assert len(report.succeeded) == 2
+    assert sent[0] == {
+        "Name": {"title": [{"type": "text", "text": {"content": "a"}}]},
+        "Score": {"number": 1.5},
+        "Tags": {"multi_select": [{"name": "x"}, {"name": "y"}]},
+        "Due": {"date": {"start": "2026-03-01T13:00:00Z"}},
+        "Done": {"checkbox": True},
+    }
+    assert sent[1] == {
+        "Name": {"title": [{"type": "text", "text": {"content": "b"}}]},
+        "Tags": {"multi_select": []},
+        "Done": {"checkbox": False},
+    }
@@ -0,0 +1,78 @@
+import threading
+from collections import Counter
+from unittest.mock import patch
+
+from notionhelper import NotionHelper
+
+
+def _child_page(page_id: str, title: str) -> dict:
+    return {"id": page_id, "type": "child_page", "child_page": {"title": title}}
+
+
+# root -> a, b; a -> shared; b -> shared (linked from two branches); shared -> root (cycle)
+PAGES = {
+    "root": [_child_page("a", "A"), _child_page("b", "B")],
+    "a": [_child_page("shared", "Shared")],
+    "b": [_child_page("shared", "Shared")],
+    "shared": [_child_page("root", "Root")],
+}
+
+
+def _fake_request_factory():
+    lock = threading.Lock()
+    page_gets = Counter()
+
+    def fake_request(self, method, url, payload=None, **kwargs):
+        if "/v1/pages/" in url:
+            page_id = url.rsplit("/", 1)[1]
+            with lock:
+                page_gets[page_id] += 1
+            return {"properties": {"Name": {"title": [{"plain_text": page_id}]}}}
+        block_id = url.rsplit("/blocks/", 1)[1].split("/")[0]
+        return {"results": [dict(block, child_page=dict(block["child_page"])) for block in PAGES.get(block_id, [])], "has_more": False}
+
+    return fake_request, page_gets
+
+
+def test_crawl_fetches_each_child_page_once():
+    helper = NotionHelper("token", max_workers=4)
+    fake_request, page_gets = _fake_request_factory()
+
+    with patch.object(NotionHelper, "_make_request", fake_request):
+        result = helper.get_page("root", crawl_child_pages=True)
+
+    assert page_gets == Counter({"root": 1, "a": 1, "b": 1, "shared": 1})
+    assert [child["id"] for child in result["child_pages"]] == ["a", "b"]
+    a_page = result["child_pages"][0]["page"]
+    b_page = result["child_pages"][1]["page"]
+    assert a_page["child_pages"][0]["page"]["properties"]["Name"]["title"][0]["plain_text"] == "shared"
+    assert "page" not in b_page["content"][0]["child_page"]
+    shared_page = a_page["child_pages"][0]["page"]
+    assert "page" not in shared_page["content"][0]["child_page"]
+
+
+def test_crawl_respects_max_depth_and_reports_progress():
+    helper = NotionHelper("token", max_workers=2)
+    fake_request, page_gets = _fake_request_factory()
+    progress = []
+
+    with patch.object(NotionHelper, "_make_request", fake_request):
+        helper.get_page(
+            "root",
+            crawl_child_pages=True,
+            max_child_page_depth=1,
+            progress_callback=lambda fetched, discovered: progress.append((fetched, discovered)),
+        )
+
+    assert "shared" not in page_gets
+    assert sorted(progress) == [(1, 2), (2, 2)]
+
+
+def test_default_mode_still_fetches_shared_page_per_branch():
+    helper = NotionHelper("token")
+    fake_request, page_gets = _fake_request_factory()
+
+    with patch.object(NotionHelper, "_make_request", fake_request):
+        helper.get_page("root")
+
+    assert page_gets["shared"] == 2
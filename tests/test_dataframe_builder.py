@@ -0,0 +1,105 @@
+from unittest.mock import patch
+
+import pandas as pd
+
+from notionhelper import NotionHelper
+
+
+SCHEMA = {
+    "properties": {
+        "Name": {"type": "title", "title": {}},
+        "Score": {"type": "number", "number": {"format": "number"}},
+        "Done": {"type": "checkbox", "checkbox": {}},
+        "Due": {"type": "date", "date": {}},
+        "Created": {"type": "created_time", "created_time": {}},
+        "Stage": {
+            "type": "status",
+            "status": {"options": [{"name": "Todo"}, {"name": "Doing"}, {"name": "Done"}]},
+        },
+        "Tags": {"type": "multi_select", "multi_select": {}},
+        "Ignored": {"type": "button", "button": {}},
+    }
+}
+
+
+def _page(page_id, score, done, due, stage, tags):
+    return {
+        "id": page_id,
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": page_id.upper()}]},
+            "Score": {"type": "number", "number": score},
+            "Done": {"type": "checkbox", "checkbox": done},
+            "Due": {"type": "date", "date": {"start": due} if due else None},
+            "Created": {"type": "created_time", "created_time": "2026-01-01T00:00:00.000Z"},
+            "Stage": {"type": "status", "status": {"name": stage} if stage else None},
+            "Tags": {"type": "multi_select", "multi_select": [{"name": tag} for tag in tags]},
+        },
+    }
+
+
+def _query_responses(second_stage=None):
+    return [
+        {
+            "results": [
+                _page("p1", 1.5, True, "2026-03-01T08:00:00-05:00", "Doing", ["a"]),
+                _page("p2", None, False, None, second_stage, []),
+            ],
+            "has_more": True,
+            "next_cursor": "c1",
+        },
+        {
+            "results": [_page("p3", 7, True, "2026-03-02", "Archived", ["b", "c"])],
+            "has_more": False,
+            "next_cursor": None,
+        },
+    ]
+
+
+def test_columnar_dataframe_uses_typed_columns():
+    helper = NotionHelper("token")
+
+    with patch.object(NotionHelper, "_make_request", side_effect=[SCHEMA] + _query_responses()):
+        df = helper.get_data_source_pages_as_dataframe("ds-id", columnar=True)
+
+    assert list(df.columns) == ["notion_page_id", "Name", "Score", "Done", "Due", "Created", "Stage", "Tags"]
+    assert df["Score"].dtype == "float64"
+    assert pd.isna(df.loc[1, "Score"])
+    assert df["Done"].dtype == bool
+    assert str(df["Due"].dtype) == "datetime64[ns, UTC]"
+    assert df.loc[0, "Due"] == pd.Timestamp("2026-03-01T13:00:00Z")
+    assert pd.isna(df.loc[1, "Due"])
+    assert isinstance(df["Stage"].dtype, pd.CategoricalDtype)
+    assert list(df["Stage"].cat.categories) == ["Todo", "Doing", "Done", "Archived"]
+    assert df.loc[0, "Stage"] == "Doing"
+    assert pd.isna(df.loc[1, "Stage"])
+    assert df.loc[2, "Tags"] == ["b", "c"]
+
+
+def test_columnar_dataframe_matches_record_path_values():
+    helper = NotionHelper("token")
+
+    with patch.object(NotionHelper, "_make_request", side_effect=[SCHEMA] + _query_responses("Todo")):
+        columnar = helper.get_data_source_pages_as_dataframe("ds-id", columnar=True, include_page_ids=False)
+    with patch.object(NotionHelper, "_make_request", side_effect=_query_responses("Todo")):
+        legacy = helper.get_data_source_pages_as_dataframe("ds-id", include_page_ids=False)
+
+    assert list(columnar["Name"]) == list(legacy["Name"])
+    assert columnar["Score"].equals(legacy["Score"].astype("float64"))
+    assert list(columnar["Done"]) == list(legacy["Done"])
+    assert list(columnar["Stage"].astype(str)) == list(legacy["Stage"])
+    legacy_due = pd.to_datetime(legacy["Due"].replace("", None), utc=True, format="ISO8601")
+    assert list(columnar["Due"].dropna()) == list(legacy_due.dropna())
+
+
+def test_columnar_dataframe_handles_empty_data_source():
+    helper = NotionHelper("token")
+
+    with patch.object(
+        NotionHelper,
+        "_make_request",
+        side_effect=[SCHEMA, {"results": [], "has_more": False, "next_cursor": None}],
+    ):
+        df = helper.get_data_source_pages_as_dataframe("ds-id", columnar=True)
+
+    assert len(df) == 0
+    assert "Score" in df.columns
@@ -0,0 +1,138 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from notionhelper import NotionHelper
+
+
+SCHEMA = {
+    "properties": {
+        "Run": {"id": "title", "type": "title"},
+        "Loss": {"id": "a%3Db", "type": "number"},
+        "Tags": {"id": "tg", "type": "multi_select"},
+        "When": {"id": "wh", "type": "date"},
+        "Best": {"id": "bs", "type": "checkbox"},
+        "Stage": {"id": "st", "type": "select"},
+    }
+}
+
+
+def _frame():
+    return pd.DataFrame(
+        {
+            "Run": ["r1", "r2", "r3"],
+            "Loss": [0.5, np.inf, "oops"],
+            "Tags": [["a", "b"], [], None],
+            "When": pd.to_datetime(["2026-03-01 08:00:00", None, "2026-03-02 09:30:15.5"], format="ISO8601"),
+            "Best": [True, False, np.nan],
+            "Stage": ["train", None, "eval"],
+        }
+    )
+
+
+def test_encode_dataframe_properties_vectorized():
+    helper = NotionHelper("token")
+
+    rows = helper._encode_dataframe_properties(_frame(), SCHEMA["properties"])
+
+    assert rows[0] == {
+        "Run": {"title": [{"type": "text", "text": {"content": "r1"}}]},
+        "Loss": {"number": 0.5},
+        "Tags": {"multi_select": [{"name": "a"}, {"name": "b"}]},
+        "When": {"date": {"start": "2026-03-01T08:00:00.000000Z"}},
+        "Best": {"checkbox": True},
+        "Stage": {"select": {"name": "train"}},
+    }
+    assert rows[1] == {
+        "Run": {"title": [{"type": "text", "text": {"content": "r2"}}]},
+        "Tags": {"multi_select": []},
+        "Best": {"checkbox": False},
+    }
+    assert isinstance(rows[2], ValueError)
+    assert "Loss" in str(rows[2])
+
+
+def test_encoded_cells_match_scalar_encoder():
+    helper = NotionHelper("token")
+    df = pd.DataFrame({"Run": ["x" * 1500], "Loss": [np.float32(2.0)], "When": ["2026-03-01T08:00:00-05:00"]})
+
+    row = helper._encode_dataframe_properties(df, SCHEMA["properties"])[0]
+
+    assert row["Run"] == helper.encode_property_value("title", "x" * 1500)
+    assert row["Loss"] == helper.encode_property_value("number", np.float32(2.0))
+    assert row["When"] == helper.encode_property_value("date", "2026-03-01T08:00:00-05:00")
+
+
+def test_checkbox_and_number_strings_encode_the_same_in_both_paths():
+    helper = NotionHelper("token")
+    best = ["Yes", "no", "1", " FALSE ", 0, "maybe", 2]
+    loss = ["0.5", "1e3", "inf", "7", "x", "3", ""]
+
+    rows = helper._encode_dataframe_properties(pd.DataFrame({"Best": best, "Loss": loss}), SCHEMA["properties"])
+
+    assert [row["Best"]["checkbox"] for row in rows[:4]] == [True, False, True, False]
+    assert [row.get("Loss") for row in rows[:4]] == [{"number": 0.5}, {"number": 1000.0}, None, {"number": 7.0}]
+    assert ["Loss" in str(rows[4]), "Best" in str(rows[5]), "Best" in str(rows[6])] == [True, True, True]
+    for value in best[:5]:
+        assert helper.encode_property_value("checkbox", value) == helper._encode_series("checkbox", pd.Series([value]))[0]
+    for value in loss[:4]:
+        assert helper.encode_property_value("number", value) == helper._encode_series("number", pd.Series([value]))[0]
+    for property_type, value in (("checkbox", "maybe"), ("checkbox", 2), ("number", "x"), ("number", "")):
+        with pytest.raises(ValueError):
+            helper.encode_property_value(property_type, value)
+
+
+def test_write_dataframe_append_reports_bad_rows_without_sending():
+    helper = NotionHelper("token", max_workers=2)
+    lock = threading.Lock()
+    created = []
+
+    def fake_create(self, data_source_id, page_properties=None, markdown=None):
+        with lock:
+            created.append(page_properties["Run"]["title"][0]["text"]["content"])
+        return {"id": "new"}
+
+    with patch.object(NotionHelper, "get_data_source", return_value=SCHEMA), \
+         patch.object(NotionHelper, "new_page_to_data_source", fake_create):
+        report = helper.write_dataframe_to_data_source(_frame(), "ds-id", rate_limiter=MagicMock())
+
+    assert sorted(created) == ["r1", "r2"]
+    assert [row.index for row in report.failed] == [2]
+
+
+def test_write_dataframe_upsert_patches_existing_keys():
+    helper = NotionHelper("token", max_workers=1)
+    existing = [
+        {"id": "page-r1", "properties": {"Run": {"type": "title", "title": [{"plain_text": "r1"}]}}},
+    ]
+    df = pd.DataFrame({"Run": ["r1", "r9"], "Loss": [0.1, 0.2]})
+
+    with patch.object(NotionHelper, "get_data_source", return_value=SCHEMA), \
+         patch.object(NotionHelper, "iter_data_source_pages", return_value=iter(existing)) as mock_iter, \
+         patch.object(NotionHelper, "update_page_properties", return_value={}) as mock_update, \
+         patch.object(NotionHelper, "new_page_to_data_source", return_value={"id": "page-r9"}) as mock_create:
+        report = helper.write_dataframe_to_data_source(
+            df, "ds-id", mode="upsert", key_property="Run", rate_limiter=MagicMock()
+        )
+
+    assert mock_iter.call_args.kwargs["filter_properties"] == ["title"]
+    mock_update.assert_called_once()
+    assert mock_update.call_args.args[0] == "page-r1"
+    assert mock_create.call_count == 1
+    assert [(row.status, row.page_id) for row in report.rows] == [("updated", "page-r1"), ("created", "page-r9")]
+
+
+def test_write_dataframe_upsert_validation():
+    helper = NotionHelper("token")
+    df = pd.DataFrame({"Run": ["r1", "r1"]})
+
+    with patch.object(NotionHelper, "get_data_source", return_value=SCHEMA):
+        with pytest.raises(ValueError, match="Duplicate"):
+            helper.write_dataframe_to_data_source(df, "ds-id", mode="upsert", key_property="Run")
+        with pytest.raises(ValueError, match="key_property"):
+            helper.write_dataframe_to_data_source(df, "ds-id", mode="upsert")
+        with pytest.raises(ValueError, match="mode"):
+            helper.write_dataframe_to_data_source(df, "ds-id", mode="replace")
@@ -1,5 +1,7 @@
 from unittest.mock import patch
 
+import pandas as pd
+
 from notionhelper import NotionHelper
 
 
@@ -56,3 +58,88 @@ def test_dataframe_datetime_fields_are_normalized_with_utc_defaults():
     assert df.loc[0, "Due"] == "2026-03-01T13:00:00Z"
     assert df.loc[0, "Created"] == "2026-03-01T13:00:00Z"
     assert df.loc[0, "Edited"] == "2026-03-01T14:00:00Z"
+
+
+def test_normalize_datetime_iso_batch_matches_scalar_path():
+    helper = NotionHelper("token")
+    values = [
+        "2026-03-01",
+        "2026-01-01T00:00:00.000Z",
+        "2026-01-01T00:00:00.120Z",
+        "2026-01-01T00:00:00.123456789Z",
+        "2026-01-01T00:00:00.000000123+00:00",
+        "2026-03-01T08:00:00-05:00",
+        "2026-03-01T08:00:00.5+02:00",
+        "2026-01-01 10:00:00",
+        "March 1, 2026",
+        "2024-13-45T00:00:00Z",
+        "2024-02-30T10:00:00.000Z",
+        "2026-03-01T24:00:00+00:00",
+        "not a date",
+        "",
+        None,
+    ]
+
+    for utc in (True, False):
+        expected = [helper.normalize_datetime_iso(value, utc=utc) for value in values]
+        assert helper.normalize_datetime_iso_batch(values, utc=utc) == expected
+    expected_timestamps = [helper.parse_datetime_utc(value) for value in values]
+    assert helper.parse_datetime_utc_batch(values) == expected_timestamps
+
+
+def test_records_parse_datetimes_once_per_chunk():
+    helper = NotionHelper("token")
+    pages = [
+        {
+            "id": f"page-{idx}",
+            "properties": {
+                "Due": {"type": "date", "date": {"start": "2026-03-01T08:00:00-05:00"} if idx else None},
+                "Edited": {"type": "last_edited_time", "last_edited_time": f"2026-03-0{idx + 1}T09:00:00-05:00"},
+                "Dates": {"type": "rollup", "rollup": {"array": [{"date": {"start": "2026-03-02"}}, {"date": None}]}},
+            },
+        }
+        for idx in range(3)
+    ]
+
+    with patch.object(NotionHelper, "iter_data_source_pages", return_value=iter(pages)), \
+         patch("notionhelper.helper.pd.to_datetime", wraps=pd.to_datetime) as to_datetime:
+        records = list(helper.iter_data_source_page_records("data-source-id"))
+
+    assert to_datetime.call_count == 1
+    assert records[0]["Due"] == ""
+    assert records[1]["Due"] == "2026-03-01T13:00:00Z"
+    assert records[2]["Edited"] == "2026-03-03T14:00:00Z"
+    assert records[1]["Dates"] == ["2026-03-02", ""]
+    assert records == [helper._page_properties_to_record(page) for page in pages]
+
+
+def test_dataframe_native_datetimes_returns_datetime64_columns():
+    helper = NotionHelper("token")
+    query_response = {
+        "results": [
+            {
+                "id": "page-1",
+                "properties": {
+                    "Due": {"type": "date", "date": {"start": "2026-03-01T08:00:00-05:00"}},
+                    "Created": {"type": "created_time", "created_time": "2026-03-01T08:00:00.000Z"},
+                },
+            },
+            {
+                "id": "page-2",
+                "properties": {
+                    "Due": {"type": "date", "date": None},
+                    "Created": {"type": "created_time", "created_time": "2026-03-02T08:00:00.000Z"},
+                },
+            },
+        ],
+        "has_more": False,
+        "next_cursor": None,
+    }
+
+    with patch.object(NotionHelper, "_make_request", return_value=query_response):
+        df = helper.get_data_source_pages_as_dataframe("data-source-id", native_datetimes=True)
+
+    assert pd.api.types.is_datetime64_any_dtype(df["Due"])
+    assert pd.api.types.is_datetime64_any_dtype(df["Created"])
+    assert df.loc[0, "Due"] == pd.Timestamp("2026-03-01T13:00:00Z")
+    assert pd.isna(df.loc[1, "Due"])
@@ -26,7 +26,7 @@ def test_make_request_raises_auth_error_with_metadata():
     helper = NotionHelper("token", max_retries=0)
     response = _mock_response(401, {"code": "unauthorized", "message": "bad token"})
 
-    with patch("notionhelper.helper.requests.get", return_value=response):
+    with patch("notionhelper.helper.requests.Session.get", return_value=response):
         try:
             helper._make_request("GET", "https://api.notion.com/v1/pages/x")
             assert False, "Expected AuthError"
@@ -46,7 +46,7 @@ def test_make_request_raises_validation_notfound_and_ratelimit_errors():
 
     for status, payload, expected_exc in scenarios:
         response = _mock_response(status, payload)
-        with patch("notionhelper.helper.requests.get", return_value=response):
+        with patch("notionhelper.helper.requests.Session.get", return_value=response):
             try:
                 helper._make_request("GET", "https://api.notion.com/v1/test")
                 assert False, f"Expected {expected_exc.__name__}"
@@ -57,7 +57,7 @@ def test_make_request_raises_validation_notfound_and_ratelimit_errors():
 
 def test_make_request_timeout_maps_to_structured_timeout_error():
     helper = NotionHelper("token", max_retries=0)
-    with patch("notionhelper.helper.requests.get", side_effect=requests.exceptions.Timeout("boom")):
+    with patch("notionhelper.helper.requests.Session.get", side_effect=requests.exceptions.Timeout("boom")):
         try:
             helper._make_request("GET", "https://api.notion.com/v1/test")
             assert False, "Expected TimeoutError"
@@ -71,7 +71,7 @@ def test_make_request_per_call_retry_policy_override():
     success_response = _mock_response(200, {"ok": True})
     policy = RetryPolicy(max_retries=1, base_delay=0.1, jitter_ratio=0.0, timeout=5.0, retry_statuses={500})
 
-    with patch("notionhelper.helper.requests.get", side_effect=[retry_response, success_response]) as mock_get:
+    with patch("notionhelper.helper.requests.Session.get", side_effect=[retry_response, success_response]) as mock_get:
         with patch("notionhelper.helper.time.sleep") as mock_sleep:
             result = helper._make_request("GET", "https://api.notion.com/v1/test", retry_policy=policy)
 
@@ -115,3 +115,52 @@ def test_iter_data_source_page_records_yields_normalized_rows():
     assert rows[0]["notion_page_id"] == "page-1"
     assert rows[0]["Name"] == "Task"
     assert rows[0]["Due"] == "2026-03-01T13:00:00Z"
+
+
+def test_iter_data_source_pages_prefetch_overlaps_next_query():
+    import threading
+
+    helper = NotionHelper("token")
+    second_query_started = threading.Event()
+    responses = iter(
+        [
+            {"results": [{"id": "p1"}], "has_more": True, "next_cursor": "c1"},
+            {"results": [{"id": "p2"}], "has_more": False, "next_cursor": None},
+        ]
+    )
+
+    def fake_request(*args, **kwargs):
+        response = next(responses)
+        if response["results"][0]["id"] == "p2":
+            second_query_started.set()
+        return response
+
+    with patch.object(NotionHelper, "_make_request", side_effect=fake_request):
+        pages = helper.iter_data_source_pages("data-source-id", prefetch=1)
+        first = next(pages)
+        # The second query runs in the background while the first row is still held.
+        assert second_query_started.wait(timeout=2)
+        rest = list(pages)
+
+    assert [first["id"]] + [page["id"] for page in rest] == ["p1", "p2"]
+
+
+def test_iter_data_source_pages_prefetch_respects_limit_and_reraises():
+    helper = NotionHelper("token")
+    responses = [
+        {"results": [{"id": "p1"}, {"id": "p2"}], "has_more": True, "next_cursor": "c1"},
+        {"results": [{"id": "p3"}, {"id": "p4"}], "has_more": True, "next_cursor": "c2"},
+    ]
+
+    with patch.object(NotionHelper, "_make_request", side_effect=responses) as mock_request:
+        items = list(helper.iter_data_source_pages("data-source-id", limit=3, page_size=2, prefetch=2))
+
+    assert [item["id"] for item in items] == ["p1", "p2", "p3"]
+    assert mock_request.call_args_list[1].args[2]["page_size"] == 1
+
+    with patch.object(NotionHelper, "_make_request", side_effect=NotFoundError("missing", status_code=404)):
+        try:
+            list(helper.iter_data_source_pages("data-source-id", prefetch=1))
+            assert False, "Expected NotFoundError"
+        except NotFoundError as err:
+            assert err.status_code == 404
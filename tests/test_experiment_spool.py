@@ -0,0 +1,144 @@
+from unittest.mock import patch
+
+from notionhelper import ExperimentSpool, MLNotionHelper
+
+
+def _queue(helper, name, score):
+    return helper.queue_ml_experiment("ds-id", config={"Experiment": name}, metrics={"sMAPE": score})
+
+
+def _status(properties):
+    return properties["Run Status"]["rich_text"][0]["text"]["content"]
+
+
+def _payload(name, score):
+    return {
+        "config": {"Experiment": name}, "metrics": {"sMAPE": score}, "plots": [], "file_paths": [],
+        "target_metric": "sMAPE", "higher_is_better": False, "file_property_name": "Artifacts",
+    }
+
+
+def test_background_logging_replays_spool_and_reads_leaderboard_once(tmp_path):
+    path = tmp_path / "spool.sqlite"
+    with ExperimentSpool(path) as spool:
+        # Left behind by a process that exited before its worker wrote them.
+        for name, score in [("crashed", 9.0), ("a", 8.0), ("b", 8.5)]:
+            spool.put("ds-id", _payload(name, score))
+    helper = MLNotionHelper("token")
+    created = []
+
+    def fake_create(self, data_source_id, properties):
+        created.append(properties)
+        return {"id": f"page-{len(created)}"}
+
+    with patch.object(MLNotionHelper, "_query_leaderboard_best", return_value=10.0) as board, \
+         patch.object(MLNotionHelper, "new_page_to_data_source", fake_create):
+        helper.start_background_logging(str(path), poll_interval=0.01)
+        assert helper.flush(timeout=5)
+        helper.stop_background_logging()
+
+    assert board.call_count == 1
+    assert [_status(properties) for properties in created] == [
+        "🏆 NEW BEST sMAPE (Prev: 10.00)",
+        "🏆 NEW BEST sMAPE (Prev: 9.00)",
+        "No Improvement (+0.50 sMAPE)",
+    ]
+    with ExperimentSpool(path) as spool:
+        assert spool.pending_count() == 0
+
+
+def test_background_logging_retries_then_gives_up(tmp_path):
+    helper = MLNotionHelper("token")
+    attempts = []
+
+    def flaky_create(self, data_source_id, properties):
+        attempts.append(properties)
+        if len(attempts) == 1 or "doomed" in str(properties):
+            raise RuntimeError("Notion unavailable")
+        return {"id": "page-1"}
+
+    with patch.object(MLNotionHelper, "_query_leaderboard_best", return_value=None), \
+         patch.object(MLNotionHelper, "new_page_to_data_source", flaky_create):
+        helper.start_background_logging(str(tmp_path / "spool.sqlite"), poll_interval=0.01, max_attempts=2)
+        _queue(helper, "ok", 1.0)
+        assert helper.flush(timeout=5)
+        _queue(helper, "doomed", 1.0)
+        assert helper.flush(timeout=5)
+        dead = helper.spool.dead()
+        helper.stop_background_logging()
+
+    assert len(attempts) == 4
+    assert [(run.payload["config"]["Experiment"], run.attempts, run.last_error) for run in dead] == [
+        ("doomed", 2, "Notion unavailable"),
+    ]
+
+
+def test_replayed_run_with_page_id_only_redoes_uploads(tmp_path):
+    path = tmp_path / "spool.sqlite"
+    plot = tmp_path / "loss.png"
+    plot.write_bytes(b"png")
+    with ExperimentSpool(path) as spool:
+        run_id = spool.put("ds-id", {**_payload("x", None), "metrics": {}, "plots": [str(plot)]})
+        spool.mark_created(run_id, "page-1")
+    helper = MLNotionHelper("token")
+
+    with patch.object(MLNotionHelper, "new_page_to_data_source") as mock_create, \
+         patch.object(MLNotionHelper, "upload_file", return_value={"id": "up-1"}), \
+         patch.object(MLNotionHelper, "append_page_body", return_value={}) as mock_append:
+        helper.start_background_logging(str(path), poll_interval=0.01)
+        assert helper.flush(timeout=5)
+        helper.stop_background_logging()
+
+    mock_create.assert_not_called()
+    assert mock_append.call_args.args[0] == "page-1"
+
+
+def test_replay_after_partial_failure_skips_uploaded_plots(tmp_path):
+    path = tmp_path / "spool.sqlite"
+    plot = tmp_path / "loss.png"
+    model = tmp_path / "model.pkl"
+    plot.write_bytes(b"png")
+    model.write_bytes(b"pkl")
+    with ExperimentSpool(path) as spool:
+        run_id = spool.put("ds-id", {**_payload("x", None), "metrics": {}, "plots": [str(plot)], "file_paths": [str(model)]})
+        spool.mark_created(run_id, "page-1")
+    helper = MLNotionHelper("token")
+    attach_attempts = []
+
+    def flaky_attach(self, method, url, payload=None, *args, **kwargs):
+        attach_attempts.append(payload)
+        if len(attach_attempts) == 1:
+            raise RuntimeError("Notion unavailable")
+        return {}
+
+    with patch.object(MLNotionHelper, "upload_file", side_effect=lambda path: {"id": f"up-{path}"}) as mock_upload, \
+         patch.object(MLNotionHelper, "append_page_body", return_value={}) as mock_append, \
+         patch.object(MLNotionHelper, "_make_request", flaky_attach):
+        helper.start_background_logging(str(path), poll_interval=0.01)
+        assert helper.flush(timeout=5)
+        helper.stop_background_logging()
+
+    assert mock_append.call_count == 1
+    assert sorted(call.args[0] for call in mock_upload.call_args_list) == sorted([str(plot), str(model), str(model)])
+    assert len(attach_attempts) == 2
+
+
+def test_spool_adds_stage_columns_to_older_files(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "spool.sqlite"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE runs (id INTEGER PRIMARY KEY AUTOINCREMENT, data_source_id TEXT NOT NULL, "
+            "payload TEXT NOT NULL, page_id TEXT, attempts INTEGER NOT NULL DEFAULT 0, last_error TEXT, "
+            "dead INTEGER NOT NULL DEFAULT 0, created_at REAL NOT NULL)"
+        )
+        conn.execute("INSERT INTO runs (data_source_id, payload, created_at) VALUES ('ds-id', '{}', 0)")
+    conn.close()
+
+    with ExperimentSpool(path) as spool:
+        [run] = spool.pending()
+        spool.mark_stage_done(run.id, "plots")
+        [run] = spool.pending()
+
+    assert (run.plots_done, run.artifacts_done) == (True, False)
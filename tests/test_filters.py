@@ -0,0 +1,89 @@
+import json
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from notionhelper import Filter, NotionHelper, Property, Sort
+from notionhelper.filters import and_, compile_sorts, descending, last_edited_time, or_
+
+
+def test_property_conditions_compile_to_notion_json():
+    assert (Property("Score").number >= 3).to_dict() == {
+        "property": "Score",
+        "number": {"greater_than_or_equal_to": 3},
+    }
+    assert (Property("Stage").status == "Done").to_dict() == {"property": "Stage", "status": {"equals": "Done"}}
+    assert (Property("Due").date < date(2026, 3, 1)).to_dict() == {
+        "property": "Due",
+        "date": {"before": "2026-03-01"},
+    }
+    assert Property("Tags").multi_select.contains("ml").to_dict() == {
+        "property": "Tags",
+        "multi_select": {"contains": "ml"},
+    }
+    assert Property("Notes").rich_text.is_empty().to_dict() == {"property": "Notes", "rich_text": {"is_empty": True}}
+    assert last_edited_time().on_or_after("2026-03-01T00:00:00Z").to_dict() == {
+        "timestamp": "last_edited_time",
+        "last_edited_time": {"on_or_after": "2026-03-01T00:00:00Z"},
+    }
+
+
+def test_compound_filters_flatten_same_operator():
+    done = Property("Stage").status == "Done"
+    high = Property("Score").number > 5
+    raw = {"property": "Flag", "checkbox": {"equals": True}}
+
+    assert (done & high & raw).to_dict() == {"and": [done.to_dict(), high.to_dict(), raw]}
+    assert ((done | high) & raw).to_dict() == {"and": [{"or": [done.to_dict(), high.to_dict()]}, raw]}
+    assert and_(done, or_(high, raw)) == Filter({"and": [done.to_dict(), {"or": [high.to_dict(), raw]}]})
+
+
+def test_sorts_compile_and_validate():
+    assert compile_sorts([descending("Due"), Sort(timestamp="created_time"), {"property": "Name", "direction": "ascending"}]) == [
+        {"property": "Due", "direction": "descending"},
+        {"timestamp": "created_time", "direction": "ascending"},
+        {"property": "Name", "direction": "ascending"},
+    ]
+    with pytest.raises(ValueError):
+        Sort()
+    with pytest.raises(ValueError):
+        Sort(property="Due", direction="up")
+
+
+def test_query_pushes_filter_sorts_and_filter_properties():
+    helper = NotionHelper("token")
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"results": [{"id": "p1", "properties": {}}], "has_more": False, "next_cursor": None}
+
+    with patch("notionhelper.helper.requests.Session.post", return_value=response) as mock_post:
+        pages = list(
+            helper.iter_data_source_pages(
+                "ds-id",
+                filter=Property("Stage").status == "Done",
+                sorts=[descending("Due")],
+                filter_properties=["title", "abc1"],
+            )
+        )
+
+    assert [page["id"] for page in pages] == ["p1"]
+    kwargs = mock_post.call_args.kwargs
+    assert kwargs["params"] == {"filter_properties": ["title", "abc1"]}
+    body = json.loads(kwargs["data"])
+    assert body == {
+        "filter": {"property": "Stage", "status": {"equals": "Done"}},
+        "sorts": [{"property": "Due", "direction": "descending"}],
+        "page_size": 100,
+    }
+
+
+def test_dataframe_passes_query_options_through():
+    helper = NotionHelper("token")
+    query_response = {"results": [], "has_more": False, "next_cursor": None}
+
+    with patch.object(NotionHelper, "_make_request", return_value=query_response) as mock_request:
+        helper.get_data_source_pages_as_dataframe("ds-id", filter={"property": "Done", "checkbox": {"equals": True}})
+
+    payload = mock_request.call_args.args[2]
+    assert payload["filter"] == {"property": "Done", "checkbox": {"equals": True}}
+    assert mock_request.call_args.kwargs["params"] is None
@@ -111,7 +111,7 @@ def test_upload_file_not_found():
 
 @patch("notionhelper.helper.mimetypes.guess_type")
 @patch("notionhelper.helper.os.path.exists")
-@patch("notionhelper.helper.requests.post")
+@patch("notionhelper.helper.requests.Session.post")
 @patch("builtins.open", new_callable=mock_open, read_data=b"test content")
 def test_upload_file_success(mock_file, mock_post, mock_exists, mock_guess_type):
     helper = NotionHelper("token")
@@ -187,7 +187,7 @@ def test_one_step_file_to_page_property(mock_attach_property, mock_upload):
     assert result == {"object": "page"}
 
 
-@patch("notionhelper.helper.requests.post")
+@patch("notionhelper.helper.requests.Session.post")
 @patch("notionhelper.helper.os.path.exists")
 def test_upload_file_network_error(mock_exists, mock_post):
     helper = NotionHelper("token")
@@ -198,7 +198,7 @@ def test_upload_file_network_error(mock_exists, mock_post):
         helper.upload_file("/path/to/test.pdf")
 
 
-@patch("notionhelper.helper.requests.post")
+@patch("notionhelper.helper.requests.Session.post")
 @patch("notionhelper.helper.os.path.exists")
 def test_upload_file_http_error(mock_exists, mock_post):
     helper = NotionHelper("token")
@@ -0,0 +1,149 @@
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from notionhelper import KeyIndex, NotionHelper, NotFoundError, ValidationError
+
+
+SCHEMA = {"properties": {"Ref": {"id": "r%3Dx", "type": "rich_text"}, "Name": {"id": "title", "type": "title"}}}
+PAGE_A = "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"
+PAGE_B = "bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb"
+
+
+def _ref(value):
+    return {"rich_text": [{"type": "text", "text": {"content": value}}]}
+
+
+def _page(page_id, ref):
+    return {"id": page_id, "properties": {"Ref": {"type": "rich_text", "rich_text": [{"plain_text": ref}]}}}
+
+
+def test_key_index_persists_and_repoints_keys(tmp_path):
+    path = tmp_path / "keys.sqlite"
+    with KeyIndex(path) as index:
+        index.replace("ds", "Ref", [("a", PAGE_A), ("a", PAGE_B)])
+        index.set("ds", "Ref", "b", PAGE_A)
+
+    with KeyIndex(path) as index:
+        assert index.is_built("ds", "Ref")
+        assert index.items("ds", "Ref") == {"b": PAGE_A}
+        index.remove_page(PAGE_A)
+        assert index.get("ds", "Ref", "b") is None
+        index.invalidate("ds")
+        assert not index.is_built("ds", "Ref")
+
+
+def test_upsert_page_scans_once_then_writes_directly():
+    helper = NotionHelper("token")
+
+    with patch.object(NotionHelper, "get_data_source", return_value=SCHEMA), \
+         patch.object(NotionHelper, "iter_data_source_pages", return_value=iter([_page(PAGE_A, "x-1")])) as mock_iter, \
+         patch.object(NotionHelper, "update_page_properties", side_effect=lambda page_id, props: _page(page_id, {PAGE_A: "x-1", PAGE_B: "x-2"}[page_id])) as mock_update, \
+         patch.object(NotionHelper, "new_page_to_data_source", return_value=_page(PAGE_B, "x-2")) as mock_create:
+        helper.upsert_page("ds-id", {"Ref": _ref("x-1")}, "Ref")
+        created = helper.upsert_page("ds-id", {"Ref": _ref("x-2")}, "Ref")
+        helper.upsert_page("ds-id", {"Name": {"title": []}}, "Ref", key="x-2")
+
+    assert mock_iter.call_count == 1
+    assert mock_iter.call_args.kwargs["filter_properties"] == ["r%3Dx"]
+    assert created["id"] == PAGE_B
+    assert [call.args[0] for call in mock_update.call_args_list] == [PAGE_A, PAGE_B]
+    assert mock_create.call_count == 1
+    assert helper.key_index.items("ds-id", "Ref") == {"x-1": PAGE_A, "x-2": PAGE_B}
+
+
+def test_upsert_recreates_page_missing_from_notion():
+    index = KeyIndex()
+    index.replace("ds-id", "Ref", [("x-1", PAGE_A)])
+    helper = NotionHelper("token", key_index=index)
+
+    with patch.object(NotionHelper, "update_page_properties", side_effect=NotFoundError("gone", status_code=404)), \
+         patch.object(NotionHelper, "new_page_to_data_source", return_value=_page(PAGE_B, "x-1")):
+        report = helper.upsert_pages("ds-id", [{"Ref": _ref("x-1")}, {"Name": {"title": []}}], "Ref", rate_limiter=MagicMock())
+
+    assert [(row.status, row.page_id) for row in report.rows] == [("created", PAGE_B), ("failed", None)]
+    assert index.items("ds-id", "Ref") == {"x-1": PAGE_B}
+
+
+def test_upsert_pages_rejects_duplicate_keys_and_trash_drops_entry():
+    index = KeyIndex()
+    index.replace("ds-id", "Ref", [("x-1", PAGE_A)])
+    helper = NotionHelper("token", key_index=index)
+
+    with pytest.raises(ValueError, match="Duplicate"):
+        helper.upsert_pages("ds-id", [{"Ref": _ref("x-1")}, {"Ref": _ref("x-1")}], "Ref")
+
+    with patch.object(NotionHelper, "_make_request", return_value={"id": PAGE_A, "in_trash": True}):
+        helper.trash_page(PAGE_A.replace("-", ""))
+    assert index.items("ds-id", "Ref") == {}
+
+
+def test_upsert_recreates_only_pages_confirmed_in_trash():
+    index = KeyIndex()
+    index.replace("ds-id", "Ref", [("x-1", PAGE_A)])
+    helper = NotionHelper("token", key_index=index)
+    rejected = ValidationError("Can't edit block that is archived.", status_code=400, notion_code="validation_error")
+
+    with patch.object(NotionHelper, "update_page_properties", side_effect=rejected), \
+         patch.object(NotionHelper, "_make_request", return_value={"id": PAGE_A, "in_trash": False}), \
+         patch.object(NotionHelper, "new_page_to_data_source") as mock_create:
+        with pytest.raises(ValidationError):
+            helper.upsert_page("ds-id", {"Ref": _ref("x-1")}, "Ref")
+    mock_create.assert_not_called()
+
+    with patch.object(NotionHelper, "update_page_properties", side_effect=rejected), \
+         patch.object(NotionHelper, "_make_request", return_value={"id": PAGE_A, "in_trash": True}) as mock_request, \
+         patch.object(NotionHelper, "new_page_to_data_source", return_value=_page(PAGE_B, "x-1")):
+        assert helper.upsert_page("ds-id", {"Ref": _ref("x-1")}, "Ref")["id"] == PAGE_B
+    assert mock_request.call_args.args[:2] == ("GET", f"https://api.notion.com/v1/pages/{PAGE_A}")
+    assert index.items("ds-id", "Ref") == {"x-1": PAGE_B}
+
+
+def test_date_keys_match_across_timestamps_and_iso_strings():
+    schema = {"properties": {"When": {"id": "wh", "type": "date"}, "Loss": {"id": "ls", "type": "number"}}}
+    existing = [{"id": PAGE_A, "properties": {"When": {"type": "date", "date": {"start": "2026-03-01T08:00:00.000+00:00"}}}}]
+    helper = NotionHelper("token", max_workers=1)
+    df = pd.DataFrame({"When": pd.to_datetime(["2026-03-01 08:00:00"]).tz_localize("UTC"), "Loss": [0.1]})
+
+    with patch.object(NotionHelper, "get_data_source", return_value=schema), \
+         patch.object(NotionHelper, "iter_data_source_pages", return_value=iter(existing)), \
+         patch.object(NotionHelper, "update_page_properties", return_value={"id": PAGE_A}) as mock_update, \
+         patch.object(NotionHelper, "new_page_to_data_source") as mock_create:
+        report = helper.write_dataframe_to_data_source(df, "ds-id", mode="upsert", key_property="When", rate_limiter=MagicMock())
+        helper.upsert_page("ds-id", {"When": {"date": {"start": "2026-03-01T03:00:00-05:00"}}}, "When")
+        helper.upsert_page("ds-id", {"Loss": {"number": 0.2}}, "When", key=pd.Timestamp("2026-03-01T08:00:00Z"))
+
+    assert [(row.status, row.page_id) for row in report.rows] == [("updated", PAGE_A)]
+    assert [call.args[0] for call in mock_update.call_args_list] == [PAGE_A, PAGE_A, PAGE_A]
+    mock_create.assert_not_called()
+    assert helper.key_index.items("ds-id", "When") == {"2026-03-01T08:00:00Z": PAGE_A}
+
+
+def test_bulk_upsert_over_stale_index_paces_every_request():
+    page_c = "cccccccc-cccc-cccc-cccc-cccccccccccc"
+    index = KeyIndex()
+    index.replace("ds-id", "Ref", [("x-1", PAGE_A), ("x-2", PAGE_B)])
+    helper = NotionHelper("token", key_index=index, max_workers=1)
+    limiter = MagicMock()
+    requests = []
+
+    def fake_request(self, method, url, payload=None, *args, **kwargs):
+        requests.append((method, url.rsplit("/v1/", 1)[1]))
+        if method == "PATCH" and PAGE_A in url:
+            raise ValidationError("Can't edit block that is archived.", status_code=400, notion_code="validation_error")
+        if method == "PATCH":
+            raise NotFoundError("gone", status_code=404)
+        if method == "GET":
+            return {"id": PAGE_A, "in_trash": True}
+        ref = payload["properties"]["Ref"]["rich_text"][0]["text"]["content"]
+        return _page(page_c, ref)
+
+    with patch.object(NotionHelper, "_make_request", fake_request):
+        report = helper.upsert_pages(
+            "ds-id", [{"Ref": _ref("x-1")}, {"Ref": _ref("x-2")}, {"Ref": _ref("x-3")}], "Ref", rate_limiter=limiter
+        )
+
+    assert [row.status for row in report.rows] == ["created", "created", "created"]
+    assert [method for method, _ in requests] == ["PATCH", "GET", "POST", "PATCH", "POST", "POST"]
+    assert limiter.acquire.call_count == len(requests)
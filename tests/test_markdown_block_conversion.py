@@ -26,6 +26,32 @@ def test_markdown_to_blocks_parses_simple_tables():
     assert len(table_block["table"]["children"]) == 3
 
 
+def test_markdown_to_blocks_keeps_formatting_after_many_inline_tokens():
+    helper = NotionHelper("test-token")
+    line = " ".join(f"**b{idx}**" for idx in range(12)) + " and [docs](https://example.com)"
+    rich_text = helper._markdown_to_blocks(line)[0]["paragraph"]["rich_text"]
+
+    bold = [item["text"]["content"] for item in rich_text if item["annotations"]["bold"]]
+    assert bold == [f"b{idx}" for idx in range(12)]
+    assert rich_text[-1]["text"] == {"content": "docs", "link": {"url": "https://example.com"}}
+
+
+def test_iter_markdown_blocks_yields_lazily_and_matches_full_conversion():
+    helper = NotionHelper("test-token")
+    markdown = (
+        "# Title\nintro with a | pipe\nstill intro\n\n| A | B |\n| --- | :---: |\n| 1 | 2 |\n"
+        "* * *\n- item\n2. step\n> quoted\n```py\nx = 1\n\n```\ntail"
+    )
+
+    blocks = helper._iter_markdown_blocks(markdown)
+    assert next(blocks)["type"] == "heading_1"
+    assert [block["type"] for block in helper._markdown_to_blocks(markdown)] == [
+        "heading_1", "paragraph", "table", "divider", "bulleted_list_item",
+        "numbered_list_item", "quote", "code", "paragraph",
+    ]
+    assert list(helper._iter_markdown_blocks(markdown)) == helper._internal_markdown_to_blocks(markdown)
+
+
 def test_blocks_to_markdown_renders_table_blocks():
     helper = NotionHelper("test-token")
     blocks = [
@@ -0,0 +1,90 @@
+import csv
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from notionhelper import MLNotionHelper
+from notionhelper.metric_buffer import MetricBuffer, aggregate_windows
+
+
+def _cells(table):
+    return [
+        [cell[0]["text"]["content"] for cell in row["table_row"]["cells"]]
+        for row in table["table"]["children"]
+    ]
+
+
+def test_aggregate_windows_reduces_each_window():
+    steps = np.arange(10, dtype=float)
+    values = np.array([5, 1, 3, 2, 8, 4, 6, 0, 9, 7], dtype=float)
+
+    windows = aggregate_windows("loss", steps, values, max_rows=3)
+
+    assert windows[["step_start", "step_end", "count"]].values.tolist() == [[0, 3, 4], [4, 7, 4], [8, 9, 2]]
+    assert windows["min"].tolist() == [1, 0, 7]
+    assert windows["max"].tolist() == [5, 8, 9]
+    assert windows["mean"].tolist() == [2.75, 4.5, 8.0]
+    assert windows["last"].tolist() == [2, 0, 7]
+
+
+def test_metric_buffer_keeps_points_logged_after_snapshot():
+    buffer = MetricBuffer()
+    assert [buffer.append("loss", value) for value in (3, 2)] == [0, 1]
+    points = buffer.snapshot()
+    buffer.append("loss", 1)
+    buffer.discard({name: len(values) for name, (_, values) in points.items()})
+
+    steps, values = buffer.snapshot()["loss"]
+    assert len(buffer) == 1
+    assert steps.tolist() == [2] and values.tolist() == [1]
+
+
+def test_log_metric_flushes_aggregated_tables_in_one_append():
+    helper = MLNotionHelper("token", metric_flush_every=6, metric_flush_interval=None, metric_max_rows=2)
+
+    with patch.object(MLNotionHelper, "append_page_body", return_value={}) as mock_append:
+        for step in range(3):
+            helper.log_metric("page-1", "loss", 1.0 / (step + 1), step=step * 10)
+            helper.log_metric("page-1", "acc", step / 2)
+        mock_append.assert_called_once()
+        assert helper.flush_metrics() == 0
+
+    assert mock_append.call_args.args[0] == "page-1"
+    heading, table, acc_heading, acc_table = mock_append.call_args.kwargs["blocks"]
+    assert heading["heading_3"]["rich_text"][0]["text"]["content"] == "loss (steps 0–20)"
+    assert _cells(table) == [
+        ["Step", "Min", "Max", "Mean", "Last"],
+        ["0–10", "0.5", "1", "0.75", "0.5"],
+        ["20", "0.333333", "0.333333", "0.333333", "0.333333"],
+    ]
+    assert _cells(acc_table)[1:] == [["0–1", "0", "0.5", "0.25", "0.5"], ["2", "1", "1", "1", "1"]]
+
+
+def test_flush_metrics_as_csv_keeps_points_when_upload_fails(tmp_path):
+    helper = MLNotionHelper("token", metric_flush_interval=None)
+    uploaded = []
+
+    def fake_upload(self, path):
+        if not uploaded:
+            uploaded.append(None)
+            raise RuntimeError("upload failed")
+        with open(path, newline="") as handle:
+            uploaded.append((path.rsplit("/", 1)[-1], list(csv.DictReader(handle))))
+        return {"id": "up-1"}
+
+    for value in (4.0, 2.0):
+        helper.log_metric("page-1", "loss", value)
+
+    with patch.object(MLNotionHelper, "upload_file", fake_upload), \
+         patch.object(MLNotionHelper, "append_page_body", return_value={}) as mock_append:
+        with pytest.raises(RuntimeError):
+            helper.flush_metrics(format="csv")
+        assert helper.flush_metrics(format="csv") == 2
+
+    name, rows = uploaded[1]
+    assert name == "metrics-001.csv"
+    assert [(row["metric"], row["count"], row["mean"]) for row in rows] == [("loss", "1", "4.0"), ("loss", "1", "2.0")]
+    file_block = mock_append.call_args.kwargs["blocks"][0]
+    assert file_block["file"]["file_upload"]["id"] == "up-1"
+    assert file_block["file"]["name"] == "metrics-001.csv"
@@ -0,0 +1,115 @@
+import threading
+from unittest.mock import patch
+
+from notionhelper import MLNotionHelper
+
+
+def _files(tmp_path, names):
+    paths = []
+    for name in names:
+        path = tmp_path / name
+        path.write_bytes(b"data")
+        paths.append(str(path))
+    return paths
+
+
+def _log(helper, tmp_path, **kwargs):
+    return helper.log_ml_experiment(
+        "ds-id",
+        config={"Experiment": "run"},
+        metrics={"sMAPE": 1.0},
+        plots=_files(tmp_path, ["loss.png", "pred.png"]),
+        file_paths=_files(tmp_path, ["model.pt", "scaler.pkl"]),
+        **kwargs,
+    )
+
+
+def test_log_ml_experiment_uploads_concurrently_and_batches_embeds(tmp_path):
+    helper = MLNotionHelper("token")
+    barrier = threading.Barrier(4, timeout=5)
+    requests = []
+
+    def fake_upload(self, path):
+        barrier.wait()
+        return {"id": f"up-{path.rsplit('/', 1)[-1]}"}
+
+    with patch.object(MLNotionHelper, "_query_leaderboard_best", return_value=None), \
+         patch.object(MLNotionHelper, "new_page_to_data_source", return_value={"id": "page-1"}), \
+         patch.object(MLNotionHelper, "upload_file", fake_upload), \
+         patch.object(MLNotionHelper, "_make_request", side_effect=lambda method, url, payload=None, *a, **k: requests.append((method, url, payload)) or {}):
+        page_id = _log(helper, tmp_path, max_workers=4)
+
+    assert page_id == "page-1"
+    assert [(method, url.rsplit("/v1/", 1)[1]) for method, url, _ in requests] == [
+        ("PATCH", "blocks/page-1/children"),
+        ("PATCH", "pages/page-1"),
+    ]
+    assert [block["image"]["file_upload"]["id"] for block in requests[0][2]["children"]] == ["up-loss.png", "up-pred.png"]
+    assert [asset["name"] for asset in requests[1][2]["properties"]["Artifacts"]["files"]] == ["model.pt", "scaler.pkl"]
+
+
+def test_log_ml_experiment_background_uploads_return_immediately(tmp_path):
+    helper = MLNotionHelper("token")
+    release = threading.Event()
+
+    def fake_upload(self, path):
+        assert release.wait(5)
+        return {"id": "up"}
+
+    with patch.object(MLNotionHelper, "_query_leaderboard_best", return_value=None), \
+         patch.object(MLNotionHelper, "new_page_to_data_source", return_value={"id": "page-1"}), \
+         patch.object(MLNotionHelper, "upload_file", fake_upload), \
+         patch.object(MLNotionHelper, "_make_request", return_value={}) as mock_request:
+        page_id = _log(helper, tmp_path, background_uploads=True)
+        assert page_id == "page-1"
+        assert helper.wait_for_uploads(timeout=0.01) == {}
+        release.set()
+        assert helper.wait_for_uploads(timeout=5) == {"page-1": None}
+        helper.close()
+
+    assert mock_request.call_count == 2
+
+
+def _leaderboard_requests(score):
+    requests = []
+
+    def fake_request(method, url, payload=None, api_version="2025-09-03", params=None, *a, **k):
+        requests.append((method, url.rsplit("/v1/", 1)[1], payload, params))
+        if method == "GET":
+            return {"properties": {"sMAPE": {"id": "abc", "type": "number"}}}
+        return {"results": [{"id": "p", "properties": {"sMAPE": {"type": "number", "number": score}}}], "has_more": False}
+
+    return requests, fake_request
+
+
+def test_leaderboard_uses_sorted_projected_query_and_cache():
+    helper = MLNotionHelper("token")
+    requests, fake_request = _leaderboard_requests(10.0)
+    with patch.object(MLNotionHelper, "_make_request", side_effect=fake_request):
+        assert helper._leaderboard_best("ds-id", "sMAPE", False) == 10.0
+        helper._record_leaderboard_score("ds-id", "sMAPE", False, 9.0)
+        helper._record_leaderboard_score("ds-id", "sMAPE", False, 12.0)
+        assert helper._leaderboard_best("ds-id", "sMAPE", False) == 9.0
+
+    query = [request for request in requests if request[0] == "POST"]
+    assert len(query) == 1
+    _, url, payload, params = query[0]
+    assert url == "data_sources/ds-id/query"
+    assert payload["page_size"] == 1
+    assert payload["filter"] == {"property": "sMAPE", "number": {"is_not_empty": True}}
+    assert payload["sorts"] == [{"property": "sMAPE", "direction": "ascending"}]
+    assert params == {"filter_properties": ["abc"]}
+
+
+def test_leaderboard_cache_expires_and_invalidates():
+    helper = MLNotionHelper("token", leaderboard_ttl=None)
+    with patch.object(MLNotionHelper, "_query_leaderboard_best", return_value=5.0) as query:
+        helper._leaderboard_best("ds-id", "acc", True)
+        helper._leaderboard_best("ds-id", "acc", True)
+        assert query.call_count == 1
+        helper.invalidate_leaderboard("ds-id")
+        helper._leaderboard_best("ds-id", "acc", True)
+        assert query.call_count == 2
+        helper.leaderboard_ttl = 0
+        helper._leaderboard_best("ds-id", "acc", True)
+        assert query.call_count == 3
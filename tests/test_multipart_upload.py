@@ -0,0 +1,107 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+import notionhelper.helper as helper_module
+from notionhelper import NotionHelper, RateLimitError
+
+
+def _fake_notion(sent, fail_on_part=None, status="pending"):
+    def fake_request(self, method, url, payload=None, *args, files=None, **kwargs):
+        if url.endswith("/file_uploads"):
+            return {"id": "up-1", "status": "pending"}
+        if url.endswith("/send"):
+            if payload["part_number"] == fail_on_part:
+                raise RateLimitError("slow down", status_code=429)
+            sent.append((payload["part_number"], files["file"][1]))
+            return {"id": "up-1", "status": "pending"}
+        if url.endswith("/complete"):
+            return {"id": "up-1", "status": "uploaded"}
+        if method == "GET":
+            return {"id": "up-1", "status": status}
+        raise AssertionError(url)
+
+    return fake_request
+
+
+@pytest.fixture(autouse=True)
+def _small_parts(monkeypatch):
+    monkeypatch.setattr(helper_module, "MIN_UPLOAD_PART_SIZE", 4)
+
+
+def test_upload_file_multipart_streams_parts_and_completes(tmp_path):
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"0123456789")
+    helper = NotionHelper("token")
+    sent, progress = [], []
+
+    with patch.object(NotionHelper, "_make_request", _fake_notion(sent)):
+        result = helper.upload_file_multipart(str(path), part_size=4, progress_callback=lambda done, total: progress.append((done, total)))
+
+    assert result["status"] == "uploaded"
+    assert sent == [("1", b"0123"), ("2", b"4567"), ("3", b"89")]
+    assert progress == [(4, 10), (8, 10), (10, 10)]
+    assert not os.path.exists(f"{path}.notion-upload.json")
+
+
+def test_upload_file_multipart_resumes_after_failure(tmp_path):
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"0123456789")
+    helper = NotionHelper("token")
+    sent = []
+
+    with patch.object(NotionHelper, "_make_request", _fake_notion(sent, fail_on_part="2")):
+        with pytest.raises(RateLimitError):
+            helper.upload_file_multipart(str(path), part_size=4)
+    with open(f"{path}.notion-upload.json", encoding="utf-8") as handle:
+        assert json.load(handle)["completed_parts"] == [1]
+
+    with patch.object(NotionHelper, "_make_request", _fake_notion(sent)):
+        helper.upload_file_multipart(str(path), part_size=4)
+
+    assert [part for part, _ in sent] == ["1", "2", "3"]
+
+
+def test_upload_file_switches_to_multipart_for_large_files(tmp_path, monkeypatch):
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"0123456789")
+    monkeypatch.setattr(helper_module, "MULTI_PART_UPLOAD_THRESHOLD", 5)
+    helper = NotionHelper("token")
+    sent = []
+
+    with patch.object(NotionHelper, "_make_request", _fake_notion(sent)):
+        result = helper.upload_file(str(path), part_size=5)
+
+    assert result["status"] == "uploaded"
+    assert [part for part, _ in sent] == ["1", "2"]
+
+
+def test_upload_file_multipart_rejects_parts_under_notion_minimum(tmp_path, monkeypatch):
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"0123456789")
+    monkeypatch.setattr(helper_module, "MIN_UPLOAD_PART_SIZE", 5)
+    helper = NotionHelper("token")
+
+    with patch.object(NotionHelper, "_make_request") as mock_request:
+        with pytest.raises(ValueError):
+            helper.upload_file_multipart(str(path), part_size=4)
+    mock_request.assert_not_called()
+    helper._check_upload_part_size(10, 10)  # A single part may be smaller than the minimum.
+
+
+def test_upload_file_reports_progress_and_wraps_errors_for_both_modes(tmp_path, monkeypatch):
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"0123456789")
+    helper = NotionHelper("token")
+    progress = []
+
+    with patch.object(NotionHelper, "_make_request", return_value={"id": "up-1", "upload_url": "https://upload"}):
+        helper.upload_file(str(path), progress_callback=lambda done, total: progress.append((done, total)))
+    assert progress == [(10, 10)]
+
+    monkeypatch.setattr(helper_module, "MULTI_PART_UPLOAD_THRESHOLD", 5)
+    with patch.object(NotionHelper, "_make_request", side_effect=OSError("disk")):
+        with pytest.raises(Exception, match="Error uploading file"):
+            helper.upload_file(str(path), part_size=5)
@@ -0,0 +1,126 @@
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from notionhelper import NotionHelper, PageCache
+
+
+def _paragraph(block_id, has_children=False):
+    return {"id": block_id, "type": "paragraph", "paragraph": {"rich_text": []}, "has_children": has_children}
+
+
+def _fake_request_factory(state):
+    calls = Counter()
+
+    def fake_request(self, method, url, payload=None, **kwargs):
+        calls[url.replace("https://api.notion.com/v1/", "")] += 1
+        if url.endswith("/v1/pages/page-id"):
+            return {"properties": {}, "last_edited_time": state["edited"]}
+        if url.endswith("/markdown"):
+            return {"markdown": state["markdown"]}
+        block_id = url.rsplit("/blocks/", 1)[1].split("/")[0]
+        return {"results": [dict(block) for block in state["tree"].get(block_id, [])], "has_more": False}
+
+    return fake_request, calls
+
+
+def _state():
+    return {
+        "edited": "2026-03-01T10:00:00.000Z",
+        "markdown": "# v1",
+        "tree": {
+            "page-id": [
+                _paragraph("p1", has_children=True),
+                {"id": "sub", "type": "child_page", "child_page": {"title": "Sub"}, "has_children": True},
+            ],
+            "p1": [_paragraph("p1a")],
+            "sub": [_paragraph("sub-1")],
+        },
+    }
+
+
+def test_get_page_serves_block_tree_from_cache_until_page_changes(tmp_path):
+    state = _state()
+    cache = PageCache(tmp_path)
+    helper = NotionHelper("token", page_cache=cache)
+    fake_request, calls = _fake_request_factory(state)
+
+    with patch.object(NotionHelper, "_make_request", fake_request):
+        first = helper.get_page("page-id", expand_child_pages=False)
+        state["tree"]["sub"] = [_paragraph("sub-2")]
+        second = helper.get_page("page-id", expand_child_pages=False)
+        state["edited"] = "2026-03-02T10:00:00.000Z"
+        helper.get_page("page-id", expand_child_pages=False)
+
+    assert first["content"][0] == second["content"][0]
+    # Child page content is re-fetched on a hit because its edits do not bump the parent.
+    assert second["content"][1]["child_page"]["children"][0]["id"] == "sub-2"
+    assert calls["blocks/page-id/children"] == 2
+    assert calls["blocks/p1/children"] == 2
+    assert calls["blocks/sub/children"] == 3
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_get_page_markdown_revalidates_with_page_get(tmp_path):
+    state = _state()
+    helper = NotionHelper("token", page_cache=PageCache(tmp_path))
+    fake_request, calls = _fake_request_factory(state)
+
+    with patch.object(NotionHelper, "_make_request", fake_request):
+        assert helper.get_page_markdown("page-id")["markdown"] == "# v1"
+        state["markdown"] = "# v2"
+        assert helper.get_page_markdown("page-id")["markdown"] == "# v1"
+        state["edited"] = "2026-03-02T10:00:00.000Z"
+        assert helper.get_page_markdown("page-id")["markdown"] == "# v2"
+
+    assert calls["pages/page-id"] == 3
+    assert calls["pages/page-id/markdown"] == 2
+
+
+def test_cache_evicts_least_recently_used_and_persists(tmp_path):
+    cache = PageCache(tmp_path, max_entries=2)
+    cache.put("a", "blocks", "t1", [1])
+    cache.put("b", "blocks", "t1", [2])
+    assert cache.get("a", "blocks", "t1") == [1]
+    cache.put("c", "blocks", "t1", [3])
+
+    assert cache.get("b", "blocks", "t1") is None
+    assert cache.stats()["evictions"] == 1
+
+    reopened = PageCache(tmp_path, max_entries=2)
+    assert reopened.get("a", "blocks", "t1") == [1]
+    assert reopened.get("c", "blocks", "t1") == [3]
+    assert reopened.get("c", "blocks", "t2") is None
+    reopened.invalidate("a")
+    assert reopened.stats()["entries"] == 1
+
+
+def test_cache_rejects_invalid_limits(tmp_path):
+    with pytest.raises(ValueError, match="max_bytes"):
+        PageCache(tmp_path, max_bytes=0)
+
+
+def test_synced_block_content_is_never_served_stale(tmp_path):
+    state = _state()
+    state["tree"]["page-id"].append(
+        {"id": "sync", "type": "synced_block", "synced_block": {"synced_from": {"block_id": "orig"}}, "has_children": True}
+    )
+    state["tree"]["sync"] = [_paragraph("orig-1")]
+    state["markdown"] = '<synced_block_reference url="https://www.notion.so/orig">v1</synced_block_reference>'
+    helper = NotionHelper("token", page_cache=PageCache(tmp_path))
+    fake_request, calls = _fake_request_factory(state)
+
+    with patch.object(NotionHelper, "_make_request", fake_request):
+        helper.get_page("page-id", expand_child_pages=False)
+        helper.get_page_markdown("page-id")
+        # The original is edited elsewhere; this page's last_edited_time does not change.
+        state["tree"]["sync"] = [_paragraph("orig-2")]
+        state["markdown"] = '<synced_block_reference url="https://www.notion.so/orig">v2</synced_block_reference>'
+        cached = helper.get_page("page-id", expand_child_pages=False)
+        markdown = helper.get_page_markdown("page-id")
+
+    assert cached["content"][2]["synced_block"]["children"][0]["id"] == "orig-2"
+    assert calls["blocks/page-id/children"] == 1
+    assert "v2" in markdown["markdown"]
@@ -0,0 +1,86 @@
+import multiprocessing
+from unittest.mock import Mock, patch
+
+import pytest
+
+from notionhelper import FileLockRateLimiter, NotionHelper, TokenBucketRateLimiter
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(rate=2.0, burst=2, clock=clock)
+
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.5)
+    assert limiter.reserve() == pytest.approx(1.0)
+
+    clock.now = 10.0
+    assert limiter.reserve() == 0.0
+
+
+def test_token_bucket_acquire_sleeps_for_reserved_delay():
+    limiter = TokenBucketRateLimiter(rate=1.0, burst=1, clock=FakeClock())
+
+    with patch("notionhelper.rate_limiter.time.sleep") as mock_sleep:
+        limiter.acquire()
+        limiter.acquire()
+
+    mock_sleep.assert_called_once_with(pytest.approx(1.0))
+
+
+def test_invalid_limiter_settings_raise():
+    with pytest.raises(ValueError, match="rate"):
+        TokenBucketRateLimiter(rate=0)
+    with pytest.raises(ValueError, match="burst"):
+        TokenBucketRateLimiter(burst=0)
+
+
+def test_file_lock_limiter_shares_bucket_between_instances(tmp_path):
+    clock = FakeClock(1000.0)
+    path = str(tmp_path / "notion.bucket")
+    first = FileLockRateLimiter(path, rate=1.0, burst=1, clock=clock)
+    second = FileLockRateLimiter(path, rate=1.0, burst=1, clock=clock)
+
+    assert first.reserve() == 0.0
+    assert second.reserve() == pytest.approx(1.0)
+    assert first.reserve() == pytest.approx(2.0)
+
+
+def _reserve_from_process(path: str, queue) -> None:
+    queue.put(FileLockRateLimiter(path, rate=1.0, burst=1, clock=lambda: 1000.0).reserve())
+
+
+def test_file_lock_limiter_across_processes(tmp_path):
+    path = str(tmp_path / "notion.bucket")
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    workers = [ctx.Process(target=_reserve_from_process, args=(path, queue)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+
+    delays = sorted(queue.get(timeout=5) for _ in workers)
+    assert delays == [pytest.approx(0.0), pytest.approx(1.0), pytest.approx(2.0)]
+
+
+def test_make_request_consults_rate_limiter_before_each_attempt():
+    limiter = Mock()
+    helper = NotionHelper("token", rate_limiter=limiter)
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = {"ok": True}
+
+    with patch("notionhelper.helper.requests.Session.get", return_value=response):
+        helper._make_request("GET", "https://api.notion.com/v1/test")
+        helper._make_request("GET", "https://api.notion.com/v1/test")
+
+    assert limiter.acquire.call_count == 2
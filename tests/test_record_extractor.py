@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from notionhelper import NotionHelper
+
+
+SCHEMA = {
+    "object": "data_source",
+    "properties": {
+        "Name": {"type": "title", "title": {}},
+        "Stage": {"type": "status", "status": {}},
+        "Score": {"type": "number", "number": {}},
+        "Due": {"type": "date", "date": {}},
+        "Owner": {"type": "people", "people": {}},
+        "Button": {"type": "button", "button": {}},
+    },
+}
+
+
+def _page(page_id, stage=None, due=None, owner=None):
+    return {
+        "id": page_id,
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": page_id}]},
+            "Stage": {"type": "status", "status": {"name": stage} if stage else None},
+            "Score": {"type": "number", "number": 3},
+            "Due": {"type": "date", "date": {"start": due} if due else None},
+            "Owner": {"type": "people", "people": [owner] if owner else []},
+            "Button": {"type": "button", "button": {}},
+        },
+    }
+
+
+def test_compiled_extractor_matches_generic_records():
+    helper = NotionHelper("token")
+    pages = [
+        _page("p1", "Doing", "2026-03-01T08:00:00-05:00", {"name": "Ada", "person": {"email": "ada@example.com"}}),
+        _page("p2"),
+    ]
+    extractor = helper.compile_record_extractor(SCHEMA)
+
+    records = extractor.extract(pages)
+
+    assert extractor.column_names == ["Name", "Stage", "Score", "Due", "Owner"]
+    assert records == [helper._page_properties_to_record(page) for page in pages]
+    assert records[0]["Due"] == "2026-03-01T13:00:00Z"
+    assert records[0]["Owner"] == {"name": "Ada", "email": "ada@example.com"}
+    # Null status values no longer raise; empty people lists produce no column.
+    assert records[1]["Stage"] == ""
+    assert "Owner" not in records[1]
+
+
+def test_column_projection_skips_unrequested_properties():
+    helper = NotionHelper("token")
+    extractor = helper.compile_record_extractor(SCHEMA, columns=["Score", "Name"], include_page_ids=False)
+
+    with patch.object(helper, "normalize_datetime_iso_batch") as normalize_batch:
+        records = extractor.extract([_page("p1", due="2026-03-01")])
+
+    assert records == [{"Name": "p1", "Score": 3.0}]
+    normalize_batch.assert_not_called()
+
+
+def test_extractor_adds_properties_seen_on_later_pages():
+    helper = NotionHelper("token")
+    extractor = helper.compile_record_extractor({}, include_page_ids=False)
+    later_page = {"properties": {"Extra": {"type": "url", "url": "https://example.com"}}}
+
+    records = extractor.extract([_page("p1"), later_page])
+
+    assert records[1] == {"Extra": "https://example.com"}
+    assert extractor.column_names[-1] == "Extra"
+
+
+def test_dataframe_columns_projection():
+    helper = NotionHelper("token")
+
+    with patch.object(NotionHelper, "iter_data_source_pages", return_value=iter([_page("p1", "Done")])):
+        df = helper.get_data_source_pages_as_dataframe("data-source-id", columns=["Stage"])
+
+    assert list(df.columns) == ["notion_page_id", "Stage"]
+    assert df.loc[0, "Stage"] == "Done"
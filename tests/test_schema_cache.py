@@ -0,0 +1,94 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from notionhelper import NotionHelper, SchemaCache
+
+
+DS_ID = "11111111-2222-3333-4444-555555555555"
+DB_ID = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
+
+
+def _data_source(properties):
+    return {
+        "object": "data_source",
+        "id": DS_ID,
+        "parent": {"type": "database_id", "database_id": DB_ID},
+        "properties": properties,
+    }
+
+
+def test_get_data_source_is_served_from_cache_until_ttl_expires():
+    now = [0.0]
+    cache = SchemaCache(ttl=60, clock=lambda: now[0])
+    helper = NotionHelper("token", schema_cache=cache)
+
+    with patch.object(NotionHelper, "_make_request", return_value=_data_source({"Name": {"type": "title"}})) as mock_request:
+        first = helper.get_data_source(DS_ID)
+        first["properties"]["Mutated"] = {}
+        second = helper.get_data_source(DS_ID.replace("-", ""))
+        now[0] = 61.0
+        helper.get_data_source(DS_ID)
+        helper.get_data_source(DS_ID, use_cache=False)
+
+    assert "Mutated" not in second["properties"]
+    assert mock_request.call_count == 3
+    assert cache.stats()["hits"] == 1
+
+
+def test_update_data_source_refreshes_cache_and_drops_parent_database():
+    cache = SchemaCache(ttl=60)
+    helper = NotionHelper("token", schema_cache=cache)
+    updated = _data_source({"Name": {"type": "title"}, "Score": {"type": "number"}})
+
+    with patch.object(NotionHelper, "_make_request", side_effect=[
+        _data_source({"Name": {"type": "title"}}),
+        {"object": "database", "id": DB_ID, "data_sources": []},
+        updated,
+    ]) as mock_request:
+        helper.get_data_source(DS_ID)
+        helper.get_database(DB_ID)
+        helper.update_data_source(DS_ID, properties={"Score": {"number": {}}})
+        assert "Score" in helper.get_data_source(DS_ID)["properties"]
+
+    assert mock_request.call_count == 3
+    assert cache.peek(("database", DB_ID)) is None
+
+
+def test_create_database_primes_cache_and_manual_invalidation():
+    helper = NotionHelper("token", schema_cache=SchemaCache())
+    created = {"object": "database", "id": DB_ID, "data_sources": [{"id": DS_ID}]}
+
+    with patch.object(NotionHelper, "_make_request", return_value=created) as mock_request:
+        helper.create_database("parent", "Runs", {"Name": {"title": {}}})
+        assert helper.get_database(DB_ID) == created
+        helper.invalidate_schema_cache(database_id=DB_ID)
+        helper.get_database(DB_ID)
+
+    assert mock_request.call_count == 2
+
+
+def test_schema_cache_evicts_lru_and_is_thread_safe():
+    cache = SchemaCache(ttl=60, max_entries=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")
+    cache.set("c", {"v": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+
+    def worker(idx):
+        for n in range(200):
+            cache.set(f"k{idx}-{n % 5}", {"n": n})
+            cache.get(f"k{idx}-{n % 5}")
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.stats()["entries"] == 2
+
+    with pytest.raises(ValueError, match="ttl"):
+        SchemaCache(ttl=0)
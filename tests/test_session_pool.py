@@ -0,0 +1,94 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from notionhelper import NotionHelper
+
+
+def _ok_response(payload: dict) -> Mock:
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.json.return_value = payload
+    return response
+
+
+def test_session_is_reused_across_requests():
+    helper = NotionHelper("token")
+
+    with patch.object(helper._session, "get", return_value=_ok_response({"ok": True})) as mock_get:
+        helper._make_request("GET", "https://api.notion.com/v1/a")
+        helper._make_request("GET", "https://api.notion.com/v1/b")
+
+    assert mock_get.call_count == 2
+    first_headers = mock_get.call_args_list[0].kwargs["headers"]
+    second_headers = mock_get.call_args_list[1].kwargs["headers"]
+    assert first_headers is second_headers
+    assert first_headers["Authorization"] == "Bearer token"
+
+
+def test_pool_settings_are_applied_to_mounted_adapter():
+    helper = NotionHelper("token", pool_connections=2, pool_maxsize=32, pool_block=True)
+    adapter = helper._session.get_adapter("https://api.notion.com/v1/pages")
+
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+
+
+def test_keep_alive_false_sends_connection_close():
+    helper = NotionHelper("token", keep_alive=False)
+
+    assert helper._session.headers["Connection"] == "close"
+
+
+def test_invalid_pool_size_raises():
+    with pytest.raises(ValueError, match="pool_maxsize"):
+        NotionHelper("token", pool_maxsize=0)
+
+
+def test_context_manager_closes_owned_session():
+    with patch.object(requests.Session, "close") as mock_close:
+        with NotionHelper("token"):
+            pass
+    mock_close.assert_called_once()
+
+
+def test_external_session_is_not_closed():
+    session = Mock(spec=requests.Session)
+    with NotionHelper("token", session=session) as helper:
+        assert helper._session is session
+    session.close.assert_not_called()
+
+
+def test_attach_file_to_page_routes_through_make_request():
+    helper = NotionHelper("token")
+
+    with patch.object(NotionHelper, "_make_request", return_value={"object": "list"}) as mock_request:
+        result = helper.attach_file_to_page("page-id", "upload-id")
+
+    assert result == {"object": "list"}
+    assert mock_request.call_args.args[0] == "PATCH"
+    assert mock_request.call_args.args[2]["children"][0]["file"]["file_upload"]["id"] == "upload-id"
+
+
+def test_upload_file_sends_multipart_without_json_content_type(tmp_path):
+    helper = NotionHelper("token")
+    file_path = tmp_path / "report.txt"
+    file_path.write_text("hello")
+
+    with patch.object(
+        helper._session,
+        "post",
+        side_effect=[
+            _ok_response({"id": "upload-id", "upload_url": "https://api.notion.com/v1/file_uploads/upload-id/send"}),
+            _ok_response({"id": "upload-id", "status": "uploaded"}),
+        ],
+    ) as mock_post:
+        result = helper.upload_file(str(file_path))
+
+    assert result["status"] == "uploaded"
+    send_call = mock_post.call_args_list[1]
+    assert "Content-Type" not in send_call.kwargs["headers"]
+    assert send_call.kwargs["files"]["file"][0] == "report.txt"
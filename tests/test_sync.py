@@ -0,0 +1,98 @@
+from unittest.mock import patch
+
+from notionhelper import NotionHelper, SQLiteSnapshot
+
+
+def _page(page_id, edited, name):
+    return {
+        "id": page_id,
+        "last_edited_time": edited,
+        "properties": {"Name": {"type": "title", "title": [{"plain_text": name}]}},
+    }
+
+
+def _response(*pages):
+    return {"results": list(pages), "has_more": False, "next_cursor": None}
+
+
+def test_first_sync_reads_everything_and_sets_watermark(tmp_path):
+    helper = NotionHelper("token")
+    path = tmp_path / "snapshot.sqlite"
+
+    with patch.object(NotionHelper, "_make_request", return_value=_response(
+        _page("a", "2026-03-01T10:00:00.000Z", "A"),
+        _page("b", "2026-03-01T11:00:00.000Z", "B"),
+    )) as mock_request:
+        result = helper.sync_data_source("ds-id", path)
+
+    assert "filter" not in mock_request.call_args.args[2]
+    assert [page["id"] for page in result.added] == ["a", "b"]
+    assert result.updated == [] and result.full_refresh
+    assert result.watermark == "2026-03-01T11:00:00Z"
+    with SQLiteSnapshot(path) as snapshot:
+        assert snapshot.get_watermark("ds-id") == "2026-03-01T11:00:00Z"
+        assert [page["id"] for page in snapshot.pages("ds-id")] == ["a", "b"]
+
+
+def test_incremental_sync_queries_since_watermark_and_returns_delta(tmp_path):
+    helper = NotionHelper("token")
+    path = tmp_path / "snapshot.sqlite"
+    with patch.object(NotionHelper, "_make_request", return_value=_response(
+        _page("a", "2026-03-01T10:00:00.000Z", "A"),
+        _page("b", "2026-03-01T11:00:00.000Z", "B"),
+    )):
+        helper.sync_data_source("ds-id", path)
+
+    # "b" comes back unchanged at the watermark; "a" was edited; "c" is new.
+    with patch.object(NotionHelper, "_make_request", return_value=_response(
+        _page("b", "2026-03-01T11:00:00.000Z", "B"),
+        _page("a", "2026-03-02T09:00:00.000Z", "A2"),
+        _page("c", "2026-03-02T09:00:00.000Z", "C"),
+    )) as mock_request:
+        result = helper.sync_data_source("ds-id", path)
+
+    assert mock_request.call_args.args[2]["filter"] == {
+        "timestamp": "last_edited_time",
+        "last_edited_time": {"on_or_after": "2026-03-01T11:00:00Z"},
+    }
+    assert [page["id"] for page in result.added] == ["c"]
+    assert [page["id"] for page in result.updated] == ["a"]
+    assert result.removed == [] and not result.full_refresh
+    with SQLiteSnapshot(path) as snapshot:
+        assert snapshot.get_watermark("ds-id") == "2026-03-02T09:00:00Z"
+        assert snapshot.get_page("ds-id", "a")["properties"]["Name"]["title"][0]["plain_text"] == "A2"
+
+
+def test_full_refresh_reports_removed_pages(tmp_path):
+    helper = NotionHelper("token")
+    with SQLiteSnapshot(tmp_path / "snapshot.sqlite") as snapshot:
+        with patch.object(NotionHelper, "_make_request", return_value=_response(
+            _page("a", "2026-03-01T10:00:00.000Z", "A"),
+            _page("b", "2026-03-01T11:00:00.000Z", "B"),
+        )):
+            helper.sync_data_source("ds-id", snapshot)
+
+        with patch.object(NotionHelper, "_make_request", return_value=_response(
+            _page("a", "2026-03-01T10:00:00.000Z", "A"),
+        )):
+            result = helper.sync_data_source("ds-id", snapshot, full_refresh=True)
+
+        assert result.removed == ["b"]
+        assert result.changed == []
+        assert snapshot.page_ids("ds-id") == {"a"}
+        assert snapshot.get_watermark("ds-id") == "2026-03-01T10:00:00Z"
+
+
+def test_sync_compares_watermark_timestamps_not_strings(tmp_path):
+    helper = NotionHelper("token")
+    path = tmp_path / "snapshot.sqlite"
+
+    # As strings "10:30:00.500000Z" < "10:30:00Z" and "11:00:00+01:00" > "10:30:00Z".
+    with patch.object(NotionHelper, "_make_request", return_value=_response(
+        _page("a", "2026-03-01T10:30:00.500Z", "A"),
+        _page("b", "2026-03-01T10:30:00.000Z", "B"),
+        _page("c", "2026-03-01T11:00:00.000+01:00", "C"),
+    )):
+        result = helper.sync_data_source("ds-id", path)
+
+    assert result.watermark == "2026-03-01T10:30:00.500000Z"